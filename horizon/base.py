@@ -23,6 +23,7 @@ the classes contained therein.
 import collections
 import collections.abc
 import copy
+import hashlib
 from importlib import import_module
 import inspect
 import logging
@@ -31,6 +32,7 @@ import os
 
 from django.conf import settings
 from django.conf.urls import include
+from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
 from django.urls import re_path
 from django.urls import reverse
@@ -62,27 +64,107 @@ def _decorate_urlconf(urlpatterns, decorator, *args, **kwargs):
             _decorate_urlconf(pattern.url_patterns, decorator, *args, **kwargs)
 
 
-# FIXME(lhcheng): We need to find a better way to cache the result.
-# Rather than storing it in the session, we could leverage the Django
-# session. Currently, this has been causing issue with cookie backend,
-# adding 1600+ in the cookie size.
+def _get_access_cache_key(request):
+    """Return the key of the access decisions of the request user or None.
+
+    Access decisions depend on the token (user, project and roles), on the
+    domain scoped token and domain context used for the domain policies, and
+    on the service catalog of the selected region, so they are all part of
+    the key. The tokens are hashed to keep them out of the cache backend.
+    """
+    user = getattr(request, 'user', None)
+    token_id = getattr(getattr(user, 'token', None), 'id', None)
+    if not token_id:
+        return None
+    session = getattr(request, 'session', {})
+    domain_token_id = getattr(session.get('domain_token'), 'auth_token', None)
+    token_hash = hashlib.sha256(
+        ('%s:%s' % (token_id, domain_token_id)).encode('utf-8')).hexdigest()
+    return 'horizon.access:%s:%s:%s' % (
+        token_hash, session.get('domain_context'),
+        getattr(user, 'services_region', None))
+
+
+def _get_access_decisions(request):
+    """Return the dict of access decisions of the request.
+
+    The decisions are kept on the request, so each decision is computed at
+    most once while rendering a page. When ``ACCESS_CACHE_BACKEND`` names a
+    Django cache, they are also loaded from and saved to that cache, so that
+    rendering the navigation of later requests with the same token is a
+    dictionary lookup. The new decisions are saved once the response is
+    complete by :func:`_save_access_decisions`. Nothing is stored in the
+    session, which keeps cookie backed sessions small.
+    """
+    decisions = getattr(request, '_horizon_access_decisions', None)
+    if isinstance(decisions, dict):
+        return decisions
+    decisions = None
+    cache_key = _get_access_cache_key(request)
+    backend = settings.ACCESS_CACHE_BACKEND
+    if cache_key and backend:
+        try:
+            decisions = caches[backend].get(cache_key)
+        except Exception:
+            LOG.warning("Failed to load access decisions from the cache.",
+                        exc_info=True)
+    request._horizon_access_decisions = decisions or {}
+    return request._horizon_access_decisions
+
+
+def _save_access_decisions(request):
+    """Save the access decisions made by the request to the cache, if any.
+
+    It is called by :class:`horizon.middleware.HorizonMiddleware` once the
+    response is complete, so that a single write is made per request.
+    """
+    if not getattr(request, '_horizon_access_decisions_changed', False):
+        return
+    request._horizon_access_decisions_changed = False
+    cache_key = _get_access_cache_key(request)
+    backend = settings.ACCESS_CACHE_BACKEND
+    if not (cache_key and backend):
+        return
+    try:
+        caches[backend].set(cache_key, request._horizon_access_decisions,
+                            settings.ACCESS_CACHE_TIMEOUT)
+    except Exception:
+        LOG.warning("Failed to save access decisions to the cache.",
+                    exc_info=True)
+
+
 def access_cached(func):
     def inner(self, context):
-        session = context['request'].session
+        request = context['request']
+        decisions = _get_access_decisions(request)
+        key = "%s.%s" % (self.__class__.__module__, self.__class__.__name__)
         try:
-            if session['allowed']['valid_for'] != session.get('token'):
-                raise KeyError()
+            return decisions[key]
         except KeyError:
-            session['allowed'] = {"valid_for": session.get('token')}
-
-        key = "%s.%s" % (self.__class__.__module__, self.__class__.__name__)
-        if key not in session['allowed']:
-            session['allowed'][key] = func(self, context)
-            session.modified = True
-        return session['allowed'][key]
+            pass
+        decisions[key] = allowed = func(self, context)
+        request._horizon_access_decisions_changed = True
+        return allowed
     return inner
 
 
+def _cached_policy_check(policy_check, rules, request):
+    """Call policy_check, reusing the decision for the same rules.
+
+    Many components share the same policy rules, so the decision is stored
+    among the access decisions keyed by the rules.
+    """
+    decisions = _get_access_decisions(request)
+    key = 'policy:%r' % (rules,)
+    try:
+        return decisions[key]
+    except KeyError:
+        pass
+    decisions[key] = allowed = bool(policy_check(rules, request))
+    request._horizon_access_decisions_changed = True
+    return allowed
+
+
 def _wrapped_include(arg):
     """Convert the old 3-tuple arg for include() into the new format.
 
@@ -135,15 +217,13 @@ class HorizonComponent(object):
                 urlpatterns = []
         return urlpatterns
 
-    # FIXME(lhcheng): Removed the access_cached decorator for now until
-    # a better implementation has been figured out. This has been causing
-    # issue with cookie backend, adding 1600+ in the cookie size.
-    # @access_cached
+    @access_cached
     def can_access(self, context):
         """Return whether the user has role based access to this component.
 
         This method is not intended to be overridden.
-        The result of the method is stored in per-session cache.
+        The result of the method is cached per request and, when
+        ``ACCESS_CACHE_BACKEND`` is set, per token in that cache.
         """
         return self.allowed(context)
 
@@ -166,7 +246,7 @@ class HorizonComponent(object):
                 rule_param = rule
                 if not any(isinstance(r, (list, tuple)) for r in rule):
                     rule_param = (rule,)
-                if policy_check(rule_param, request):
+                if _cached_policy_check(policy_check, rule_param, request):
                     return True
             return False
 
@@ -54,7 +54,34 @@ SESSION_COOKIE_MAX_SIZE = 4093
 # memory usage when caching. It should at least be 2 x the number of threads
 # with a little bit of extra buffer.
 MEMOIZED_MAX_SIZE_DEFAULT = 25
+# MEMOIZED_SHARED_CACHE_BACKEND is the alias of a Django cache used as a
+# second, cross-process tier of memoized functions which declare a shared
+# TTL. None disables the shared tier.
+MEMOIZED_SHARED_CACHE_BACKEND = None
+# Per-function overrides of the shared tier TTL in seconds, keyed by
+# "<module>.<function name>". 0 disables the shared tier for the function.
+MEMOIZED_SHARED_CACHE_TIMEOUTS = {}
+# ACCESS_CACHE_BACKEND is the alias of a Django cache where the results of
+# the panel and dashboard access checks are kept per token, so that the
+# navigation is not re-evaluated against the policy on every page. None keeps
+# the decisions for the duration of a request only.
+ACCESS_CACHE_BACKEND = None
+ACCESS_CACHE_TIMEOUT = 300
+# TAB_CACHE_BACKEND is the alias of a Django cache where the rendered content
+# of the cacheable tabs is kept per user and page for TAB_CACHE_TIMEOUT
+# seconds, so that switching between tabs does not load their data again.
+# None disables the cache.
+TAB_CACHE_BACKEND = None
+TAB_CACHE_TIMEOUT = 60
 HORIZON_COMPRESS_OFFLINE_CONTEXT_BASE = {}
+# BATCH_ACTION_MAX_WORKERS is the number of threads of the pool shared by the
+# batch actions of a process which run on several objects at the same time.
+# 0 runs every batch action on one object after the other.
+BATCH_ACTION_MAX_WORKERS = 10
+# TABLE_DATA_MAX_WORKERS is the number of threads of the pool shared by the
+# views and tabs of a process which load the data of several tables at the
+# same time. 0 loads the data of the tables one after the other.
+TABLE_DATA_MAX_WORKERS = 10
 
 SITE_BRANDING = _("Horizon")
 SITE_BRANDING_LINK = reverse_lazy("horizon:user_home")
@@ -32,6 +32,7 @@ from django import shortcuts
 from django.utils.encoding import iri_to_uri
 from django.utils import timezone
 
+from horizon import base
 from horizon import exceptions
 from horizon.utils import functions as utils
 from horizon.utils import http as http_utils
@@ -52,8 +53,19 @@ class HorizonMiddleware(object):
         self._process_request(request)
         response = self.get_response(request)
         response = self._process_response(request, response)
+        if response.streaming:
+            # The page is only rendered while the response is sent.
+            response.streaming_content = self._save_access_decisions(
+                request, response.streaming_content)
+        else:
+            base._save_access_decisions(request)
         return response
 
+    @staticmethod
+    def _save_access_decisions(request, streaming_content):
+        yield from streaming_content
+        base._save_access_decisions(request)
+
     def _process_request(self, request):
         """Adds data necessary for Horizon to function to the request."""
 
@@ -33,104 +33,26 @@ horizon.datatables = {
       return;
     }
 
+    // Rows with a batch update URL are polled with a request per table
+    // carrying the IDs of all their objects, the others one by one.
+    var batches = {};
     $rows_to_update.each(function() {
       var $row = $(this);
-      var $table = $row.closest('table.datatable');
+      var batch_url = $row.attr('data-update-batch-url');
+      if (batch_url) {
+        batches[batch_url] = batches[batch_url] || [];
+        batches[batch_url].push($row);
+        return;
+      }
 
       requests.push(
         horizon.ajax.queue({
           url: $row.attr('data-update-url'),
           error: function (jqXHR) {
-            switch (jqXHR.status) {
-              // A 404 indicates the object is gone, and should be removed from the table
-              case 404:
-                // Update the footer count and reset to default empty row if needed
-                var row_count, colspan, template, params;
-
-                // existing count minus one for the row we're removing
-                row_count = horizon.datatables.update_footer_count($table, -1);
-
-                if (row_count === 0) {
-                  colspan = $table.find('.table_column_header th').length;
-                  template = horizon.templates.compiled_templates["#empty_row_template"];
-                  params = {
-                      "colspan": colspan,
-                      no_items_label: gettext("No items to display.")
-                  };
-                  var empty_row = template.render(params);
-                  $row.replaceWith(empty_row);
-                } else {
-                  $row.remove();
-                }
-                // Reset tablesorter's data cache.
-                $table.trigger("update");
-                // Enable launch action if quota is not exceeded
-                horizon.datatables.update_actions();
-                break;
-              default:
-                console.log(gettext("An error occurred while updating."));
-                $row.removeClass("ajax-update");
-                $row.find("i.ajax-updating").remove();
-                break;
-            }
+            horizon.datatables.update_row_error($row, jqXHR.status);
           },
           success: function (data) {
-            var $new_row = $(data);
-
-            if ($new_row.hasClass('warning')) {
-              var $container = $(document.createElement('div'))
-                .addClass('progress-text horizon-loading-bar');
-
-              var $progress = $(document.createElement('div'))
-                .addClass('progress progress-striped active')
-                .appendTo($container);
-
-              // Incomplete progress bar addition
-              $width = $new_row.find('[percent]:first').attr('percent') || "100%";
-
-              $(document.createElement('div'))
-                .addClass('progress-bar')
-                .css("width", $width)
-                .appendTo($progress);
-
-              // if action/confirm is required, show progress-bar with "?"
-              // icon to indicate user action is required
-              if ($new_row.find('.btn-action-required').length > 0) {
-                $(document.createElement('span'))
-                  .addClass('fa fa-question-circle progress-bar-text')
-                  .appendTo($container);
-              }
-              $new_row.find("td.warning:last").prepend($container);
-            }
-
-            // Only replace row if the html content has changed
-            if ($new_row.html() !== $row.html()) {
-
-              // Directly accessing the checked property of the element
-              // is MUCH faster than using jQuery's helper method
-              var $checkbox = $row.find('.table-row-multi-select');
-              if ($checkbox.length && $checkbox[0].checked) {
-                // Preserve the checkbox if it's already clicked
-                $new_row.find('.table-row-multi-select').prop('checked', true);
-              }
-              $row.replaceWith($new_row);
-
-              // TODO(matt-borland, tsufiev): ideally we should solve the
-              // problem with not-working angular actions in a content added
-              // by jQuery via replacing jQuery insert with Angular insert.
-              // Should address this in Newton release
-              recompileAngularContent($table);
-
-              // Reset tablesorter's data cache.
-              $table.trigger("update");
-              // Reset decay constant.
-              $table.removeAttr('decay_constant');
-              // Check that quicksearch is enabled for this table
-              // Reset quicksearch's data cache.
-              if ($table.attr('id') in horizon.datatables.qs) {
-                horizon.datatables.qs[$table.attr('id')].cache();
-              }
-            }
+            horizon.datatables.update_row($row, data);
           },
           complete: function () {
             // Revalidate the button check for the updated table
@@ -140,6 +62,13 @@ horizon.datatables = {
       );
     });
 
+    $.each(batches, function(batch_url, rows) {
+      for (var i = 0; i < rows.length; i += horizon.datatables.update_batch_size) {
+        requests.push(horizon.datatables.update_rows(
+          batch_url, rows.slice(i, i + horizon.datatables.update_batch_size)));
+      }
+    });
+
     $.when.apply($, requests).always(function() {
       decay_constant = decay_constant || 0;
       decay_constant++;
@@ -151,6 +80,139 @@ horizon.datatables = {
     });
   },
 
+  // The maximum number of rows updated by a batched request.
+  update_batch_size: 100,
+
+  update_rows: function(batch_url, rows) {
+    var rows_by_id = {};
+    $.each(rows, function(index, $row) {
+      rows_by_id[$row.attr('data-object-id')] = $row;
+    });
+    return horizon.ajax.queue({
+      url: batch_url,
+      data: {obj_id: Object.keys(rows_by_id)},
+      traditional: true,
+      dataType: 'json',
+      error: function () {
+        // The failure of a batch is transient whatever its status, its rows
+        // are kept and polled again.
+        console.log(gettext("An error occurred while updating."));
+      },
+      success: function (data) {
+        $.each(data.rows, function(obj_id, row) {
+          if (obj_id in rows_by_id) {
+            horizon.datatables.update_row(rows_by_id[obj_id], row);
+          }
+        });
+        $.each(data.removed, function(index, obj_id) {
+          if (obj_id in rows_by_id) {
+            horizon.datatables.update_row_error(rows_by_id[obj_id], 404);
+          }
+        });
+      },
+      complete: function () {
+        // Revalidate the button check for the updated table
+        horizon.datatables.validate_button();
+      }
+    });
+  },
+
+  update_row_error: function($row, status) {
+    var $table = $row.closest('table.datatable');
+    switch (status) {
+      // A 404 indicates the object is gone, and should be removed from the table
+      case 404:
+        // Update the footer count and reset to default empty row if needed
+        var row_count, colspan, template, params;
+
+        // existing count minus one for the row we're removing
+        row_count = horizon.datatables.update_footer_count($table, -1);
+
+        if (row_count === 0) {
+          colspan = $table.find('.table_column_header th').length;
+          template = horizon.templates.compiled_templates["#empty_row_template"];
+          params = {
+              "colspan": colspan,
+              no_items_label: gettext("No items to display.")
+          };
+          var empty_row = template.render(params);
+          $row.replaceWith(empty_row);
+        } else {
+          $row.remove();
+        }
+        // Reset tablesorter's data cache.
+        $table.trigger("update");
+        // Enable launch action if quota is not exceeded
+        horizon.datatables.update_actions();
+        break;
+      default:
+        console.log(gettext("An error occurred while updating."));
+        $row.removeClass("ajax-update");
+        $row.find("i.ajax-updating").remove();
+        break;
+    }
+  },
+
+  update_row: function($row, data) {
+    var $table = $row.closest('table.datatable');
+    var $new_row = $(data);
+
+    if ($new_row.hasClass('warning')) {
+      var $container = $(document.createElement('div'))
+        .addClass('progress-text horizon-loading-bar');
+
+      var $progress = $(document.createElement('div'))
+        .addClass('progress progress-striped active')
+        .appendTo($container);
+
+      // Incomplete progress bar addition
+      var $width = $new_row.find('[percent]:first').attr('percent') || "100%";
+
+      $(document.createElement('div'))
+        .addClass('progress-bar')
+        .css("width", $width)
+        .appendTo($progress);
+
+      // if action/confirm is required, show progress-bar with "?"
+      // icon to indicate user action is required
+      if ($new_row.find('.btn-action-required').length > 0) {
+        $(document.createElement('span'))
+          .addClass('fa fa-question-circle progress-bar-text')
+          .appendTo($container);
+      }
+      $new_row.find("td.warning:last").prepend($container);
+    }
+
+    // Only replace row if the html content has changed
+    if ($new_row.html() !== $row.html()) {
+
+      // Directly accessing the checked property of the element
+      // is MUCH faster than using jQuery's helper method
+      var $checkbox = $row.find('.table-row-multi-select');
+      if ($checkbox.length && $checkbox[0].checked) {
+        // Preserve the checkbox if it's already clicked
+        $new_row.find('.table-row-multi-select').prop('checked', true);
+      }
+      $row.replaceWith($new_row);
+
+      // TODO(matt-borland, tsufiev): ideally we should solve the
+      // problem with not-working angular actions in a content added
+      // by jQuery via replacing jQuery insert with Angular insert.
+      // Should address this in Newton release
+      recompileAngularContent($table);
+
+      // Reset tablesorter's data cache.
+      $table.trigger("update");
+      // Reset decay constant.
+      $table.removeAttr('decay_constant');
+      // Check that quicksearch is enabled for this table
+      // Reset quicksearch's data cache.
+      if ($table.attr('id') in horizon.datatables.qs) {
+        horizon.datatables.qs[$table.attr('id')].cache();
+      }
+    }
+  },
+
   update_actions: function() {
     var $actions_to_update = $('.btn-launch.ajax-update, .btn-create.ajax-update');
     $actions_to_update.each(function() {
@@ -12,6 +12,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections.abc
 from collections import defaultdict
 from collections import OrderedDict
 import copy
@@ -26,9 +27,11 @@ from django import urls
 from django.utils.functional import Promise
 from django.utils.http import urlencode
 from django.utils.translation import gettext_lazy as _
+from futurist import waiters
 
 from horizon import exceptions
 from horizon import messages
+from horizon.utils import executors
 from horizon.utils import functions
 from horizon.utils import html
 from horizon.utils import settings as utils_settings
@@ -95,6 +98,7 @@ class BaseAction(html.HTMLElement, metaclass=BaseActionMetaClass):
         self.preempt = kwargs.get('preempt', False)
         self.policy_rules = kwargs.get('policy_rules', None)
         self.action_type = kwargs.get('action_type', 'default')
+        self.allowed_depends_on = kwargs.get('allowed_depends_on', None)
 
     def data_type_matched(self, datum):
         """Method to see if the action is allowed for a certain type of data.
@@ -127,6 +131,21 @@ class BaseAction(html.HTMLElement, metaclass=BaseActionMetaClass):
         """
         return True
 
+    def get_allowed_key(self, datum):
+        """Returns the values of ``datum`` listed in allowed_depends_on.
+
+        Rows sharing the same key share the result of :meth:`allowed`.
+        Returns ``None`` when :attr:`allowed_depends_on` is not declared,
+        in which case the action is evaluated for every row.
+        """
+        if self.allowed_depends_on is None or datum is None:
+            return None
+        if isinstance(datum, collections.abc.Mapping):
+            return tuple(datum.get(field)
+                         for field in self.allowed_depends_on)
+        return tuple(getattr(datum, field, None)
+                     for field in self.allowed_depends_on)
+
     def _allowed(self, request, datum):
         policy_check = utils_settings.import_setting("POLICY_CHECK_FUNCTION")
 
@@ -239,6 +258,16 @@ class Action(BaseAction):
                     "(("identity", "identity:list_users"),
                       ("identity", "identity:list_roles"))"
 
+    .. attribute:: allowed_depends_on
+
+        A tuple of the names of the datum attributes (or keys) which the
+        result of :meth:`allowed` and the policy target of the action depend
+        on, e.g. ``("status", "tenant_id")``. When set, the table evaluates
+        the action once per distinct combination of these values and shares
+        the result between rows. ``allowed`` must then not depend on any
+        other datum attribute nor modify the action. Defaults to ``None``,
+        which evaluates the action for every row.
+
     At least one of the following methods must be defined:
 
     .. method:: single(self, data_table, request, object_id)
@@ -650,10 +679,31 @@ class BatchAction(Action):
        Optional message for providing an appropriate help text for
        the horizon user.
 
+    .. attribute:: max_concurrency
+
+       The maximum number of selected objects the action runs on at the same
+       time, in the thread pool shared by the batch actions of the process
+       (see the ``BATCH_ACTION_MAX_WORKERS`` setting). ``action`` must be
+       thread safe when it is greater than one. Defaults to ``1``, which runs
+       the action on one object after the other.
+
+    .. method:: bulk_action
+
+       Optional method performing the action on all the selected objects
+       with a single call, for backends providing a bulk API. It is used
+       instead of ``action`` when defined.
+
+       Method must accept the request and the list of the ids of the objects
+       allowed to be acted on, and return a dict of the exceptions of the
+       objects it failed on, keyed by id. An exception raised by the method
+       fails all the objects.
+
     """
 
     help_text = _("This action cannot be undone.")
     default_message_level = "success"
+    max_concurrency = 1
+    bulk_action = None
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -752,10 +802,50 @@ class BatchAction(Action):
         attrs.update({'data-batch-action': 'true'})
         return attrs
 
+    def _run_action(self, request, datum_id):
+        try:
+            self.action(request, datum_id)
+        except Exception as ex:
+            return ex
+        return None
+
+    def _run_actions(self, request, datum_ids):
+        """Runs the action on the given objects.
+
+        Returns the exception raised for each object, or None when the action
+        succeeded, in the order of ``datum_ids``.
+        """
+        if self.bulk_action is not None:
+            if not datum_ids:
+                return []
+            try:
+                failures = self.bulk_action(request, datum_ids) or {}
+            except Exception as ex:
+                return [ex] * len(datum_ids)
+            return [failures.get(datum_id) for datum_id in datum_ids]
+
+        max_concurrency = min(self.max_concurrency,
+                              settings.BATCH_ACTION_MAX_WORKERS)
+        if max_concurrency <= 1 or len(datum_ids) <= 1:
+            return [self._run_action(request, datum_id)
+                    for datum_id in datum_ids]
+
+        executor = executors.get_executor('BATCH_ACTION_MAX_WORKERS')
+        futures = []
+        running = set()
+        for datum_id in datum_ids:
+            if len(running) >= max_concurrency:
+                running = set(waiters.wait_for_any(running).not_done)
+            future = executor.submit(self._run_action, request, datum_id)
+            futures.append(future)
+            running.add(future)
+        return [future.result() for future in futures]
+
     def handle(self, table, request, obj_ids):
         action_success = []
         action_failure = []
         action_not_allowed = []
+        allowed = []
         for datum_id in obj_ids:
             datum = table.get_object_by_id(datum_id)
             datum_display = table.get_object_display(datum) or datum_id
@@ -766,8 +856,16 @@ class BatchAction(Action):
                     'dis': datum_display
                 })
                 continue
+            allowed.append((datum_id, datum, datum_display))
+
+        # The objects are acted on concurrently when allowed, but the results
+        # are processed in the order of the selection so that the aggregated
+        # messages do not depend on it.
+        results = self._run_actions(request, [item[0] for item in allowed])
+        for (datum_id, datum, datum_display), ex in zip(allowed, results):
             try:
-                self.action(request, datum_id)
+                if ex is not None:
+                    raise ex
                 # Call update to invoke changes if needed
                 self.update(request, datum)
                 action_success.append(datum_display)
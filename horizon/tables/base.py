@@ -45,6 +45,7 @@ from horizon import messages
 from horizon.tables.actions import BatchAction
 from horizon.tables.actions import FilterAction
 from horizon.tables.actions import LinkAction
+from horizon.utils import executors
 from horizon.utils import html
 from horizon.utils import http as http_utils
 from horizon.utils import settings as utils_settings
@@ -553,8 +554,9 @@ class Row(html.HTMLElement):
 
     .. attribute:: cells
 
-        The cells belonging to this row stored in a ``OrderedDict`` object.
-        This attribute is populated during instantiation.
+        The cells belonging to this row stored in a ``dict`` object, in the
+        order of the columns. This attribute is populated during
+        instantiation.
 
     .. attribute:: status
 
@@ -582,10 +584,30 @@ class Row(html.HTMLElement):
         updates of cell. Generally you won't need to change this value.
         It is also used for inline edit of the cell.
         Default: ``"cell_update"``.
+
+    .. attribute:: ajax_batch
+
+        Boolean value to determine whether the AJAX updates of the rows of
+        the table are batched: the browser then polls all the rows being
+        updated with a single request, whose data is fetched with
+        :meth:`~horizon.tables.Row.get_data_multiple`. Default: ``False``.
+
+    .. attribute:: ajax_batch_action_name
+
+        String that is used for the query parameter key to request batched
+        AJAX updates. Generally you won't need to change this value.
+        Default: ``"rows_update"``.
     """
+    # Rows keep a ``__dict__`` for the attributes set by subclasses and
+    # plugins, which is only allocated when such an attribute is set.
+    __slots__ = ('attrs', 'classes', 'table', 'datum', 'selected', 'id',
+                 'cells', '__dict__')
+
     ajax = False
     ajax_action_name = "row_update"
     ajax_cell_action_name = "cell_update"
+    ajax_batch = False
+    ajax_batch_action_name = "rows_update"
 
     def __init__(self, table, datum=None):
         super().__init__()
@@ -624,12 +646,15 @@ class Row(html.HTMLElement):
         for column in table.columns.values():
             cell = table._meta.cell_class(datum, column, self)
             cells.append((column.name or column.auto, cell))
-        self.cells = collections.OrderedDict(cells)
+        self.cells = dict(cells)
 
         if self.ajax:
             interval = conf.HORIZON_CONFIG['ajax_poll_interval']
             self.attrs['data-update-interval'] = interval
             self.attrs['data-update-url'] = self.get_ajax_update_url()
+            if self.ajax_batch:
+                self.attrs['data-update-batch-url'] = \
+                    self.get_ajax_batch_update_url()
             self.classes.append("ajax-update")
 
         self.attrs['data-object-id'] = table.get_object_id(datum)
@@ -679,23 +704,36 @@ class Row(html.HTMLElement):
         """Returns the bound cells for this row in order."""
         return list(self.cells.values())
 
-    def get_ajax_update_url(self):
+    def _get_ajax_url(self, request_params):
         table_url = self.table.get_absolute_url()
         marker_name = self.table._meta.pagination_param
         marker = self.table.request.GET.get(marker_name, None)
         if not marker:
             marker_name = self.table._meta.prev_pagination_param
             marker = self.table.request.GET.get(marker_name, None)
-        request_params = [
-            ("action", self.ajax_action_name),
-            ("table", self.table.name),
-            ("obj_id", self.table.get_object_id(self.datum)),
-        ]
         if marker:
             request_params.append((marker_name, marker))
         params = urlencode(collections.OrderedDict(request_params))
         return "%s?%s" % (table_url, params)
 
+    def get_ajax_update_url(self):
+        return self._get_ajax_url([
+            ("action", self.ajax_action_name),
+            ("table", self.table.name),
+            ("obj_id", self.table.get_object_id(self.datum)),
+        ])
+
+    def get_ajax_batch_update_url(self):
+        """Returns the URL of the batched AJAX updates of the table.
+
+        The IDs of the objects to update are appended to it as ``obj_id``
+        query parameters.
+        """
+        return self._get_ajax_url([
+            ("action", self.ajax_batch_action_name),
+            ("table", self.table.name),
+        ])
+
     def can_be_selected(self, datum):
         """Determines whether the row can be selected.
 
@@ -711,14 +749,49 @@ class Row(html.HTMLElement):
         """
         return {}
 
+    def get_data_multiple(self, request, obj_ids):
+        """Fetches the updated data for the rows of the given object IDs.
+
+        It is used by the batched AJAX updates (see ``ajax_batch``) and
+        returns a tuple of the list of the data objects and the list of the
+        IDs of the objects which no longer exist, whose rows are removed
+        from the table. The rows of the other objects which are not
+        returned, for example because retrieving them failed, are left
+        unchanged and updated again later.
+
+        By default :meth:`~horizon.tables.Row.get_data` is called for each
+        object. Subclasses should override it to fetch all the objects at
+        once.
+        """
+        data = []
+        removed = []
+        for obj_id in obj_ids:
+            try:
+                data.append(self.get_data(request, obj_id))
+            except exceptions.NOT_FOUND:
+                removed.append(obj_id)
+            except Exception:
+                exceptions.handle(request, ignore=True)
+        return data, removed
+
 
 class Cell(html.HTMLElement):
-    """Represents a single cell in the table."""
+    """Represents a single cell in the table.
+
+    Cells are by far the most numerous objects of a table, so they use
+    ``__slots__`` and only create their ``attrs`` and ``classes`` when they
+    are first accessed.
+    """
+
+    __slots__ = ('_attrs', '_classes', 'datum', 'column', 'row', 'data',
+                 'wrap_list', 'inline_edit_available', 'update_action',
+                 'inline_edit_mod', '_status')
 
     def __init__(self, datum, column, row, attrs=None, classes=None):
-        self.classes = classes or getattr(self, "classes", [])
-        super().__init__()
-        self.attrs.update(attrs or {})
+        self._attrs = None
+        self._classes = classes or None
+        if attrs:
+            self.attrs.update(attrs)
 
         self.datum = datum
         self.column = column
@@ -728,22 +801,47 @@ class Cell(html.HTMLElement):
         # initialize the update action if available
         if self.inline_edit_available:
             self.update_action = self.column.update_action()
-            self.attrs['data-cell-name'] = column.name
-            self.attrs['data-update-url'] = self.get_ajax_update_url()
         self.inline_edit_mod = False
+        self.data = self.get_data(datum, column, row)
+
+    @property
+    def attrs(self):
+        if self._attrs is None:
+            self._attrs = {}
+        return self._attrs
+
+    @attrs.setter
+    def attrs(self, value):
+        self._attrs = value
+
+    @property
+    def classes(self):
+        if self._classes is None:
+            self._classes = []
+        return self._classes
+
+    @classes.setter
+    def classes(self, value):
+        self._classes = value
+
+    def get_default_attrs(self):
+        attrs = {}
+        if self.inline_edit_available:
+            attrs['data-cell-name'] = self.column.name
+            attrs['data-update-url'] = self.get_ajax_update_url()
         # add tooltip to cells if the truncate variable is set
-        if column.truncate:
+        if self.column.truncate:
             # NOTE(tsufiev): trying to pull cell raw data out of datum for
             # those columns where truncate is False leads to multiple errors
             # in unit tests
-            data = getattr(datum, column.name, '') or ''
+            data = getattr(self.datum, self.column.name, '') or ''
             data = encoding.force_str(data)
-            if len(data) > column.truncate:
-                self.attrs['data-toggle'] = 'tooltip'
-                self.attrs['title'] = data
+            if len(data) > self.column.truncate:
+                attrs['data-toggle'] = 'tooltip'
+                attrs['title'] = data
                 if settings.INTEGRATION_TESTS_SUPPORT:
-                    self.attrs['data-selenium'] = data
-        self.data = self.get_data(datum, column, row)
+                    attrs['data-selenium'] = data
+        return attrs
 
     def get_data(self, datum, column, row):
         """Fetches the data to be displayed in this cell."""
@@ -789,8 +887,9 @@ class Cell(html.HTMLElement):
         else:
             data = column.get_data(datum)
             if column.cell_attributes_getter:
-                cell_attributes = column.cell_attributes_getter(data) or {}
-                self.attrs.update(cell_attributes)
+                cell_attributes = column.cell_attributes_getter(data)
+                if cell_attributes:
+                    self.attrs.update(cell_attributes)
         return data
 
     def __repr__(self):
@@ -1277,6 +1376,7 @@ class DataTable(object, metaclass=DataTableMetaclass):
 
     def __init__(self, request, data=None, needs_form_wrapper=None, **kwargs):
         self.request = request
+        self._object_index = None
         self.data = data
         self.kwargs = kwargs
         self._needs_form_wrapper = needs_form_wrapper
@@ -1286,6 +1386,12 @@ class DataTable(object, metaclass=DataTableMetaclass):
         self.permissions = self._meta.permissions
         self.needs_filter_first = False
         self._filter_first_message = self._meta.filter_first_message
+        # Results of action permission checks shared between rows, see
+        # BaseAction.allowed_depends_on.
+        self._allowed_cache = {}
+        self.allowed_evaluations = 0
+        self.allowed_evaluations_skipped = 0
+        self._rows_placeholder = None
 
         # Create a new set
         columns = []
@@ -1320,6 +1426,17 @@ class DataTable(object, metaclass=DataTableMetaclass):
     def __repr__(self):
         return '<%s: %s>' % (self.__class__.__name__, self._meta.name)
 
+    @property
+    def data(self):
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+        # The index of the objects by ID is built again from the new data
+        # when needed.
+        self._object_index = None
+
     @property
     def name(self):
         return self._meta.name
@@ -1397,13 +1514,36 @@ class DataTable(object, metaclass=DataTableMetaclass):
         for column in self.get_columns():
             self._data_cache[column] = {}
 
+    def _get_allowed_cache_key(self, action, datum):
+        key = action.get_allowed_key(datum)
+        if key is None:
+            return None
+        if self._meta.mixed_data_type:
+            key += (getattr(datum, self._meta.data_type_name, None),)
+        key = (action.name, key)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
     def _filter_action(self, action, request, datum=None):
+        cache_key = self._get_allowed_cache_key(action, datum)
+        if cache_key is not None:
+            try:
+                allowed = self._allowed_cache[cache_key]
+            except KeyError:
+                pass
+            else:
+                self.allowed_evaluations_skipped += 1
+                return allowed
+        self.allowed_evaluations += 1
         try:
             # Catch user errors in permission functions here
             row_matched = True
             if self._meta.mixed_data_type:
                 row_matched = action.data_type_matched(datum)
-            return action._allowed(request, datum) and row_matched
+            allowed = action._allowed(request, datum) and row_matched
         except AssertionError:
             # don't trap mox exceptions (which subclass AssertionError)
             # when testing!
@@ -1411,7 +1551,10 @@ class DataTable(object, metaclass=DataTableMetaclass):
             raise
         except Exception:
             LOG.exception("Error while checking action permissions.")
-            return None
+            allowed = None
+        if cache_key is not None:
+            self._allowed_cache[cache_key] = allowed
+        return allowed
 
     def is_browser_table(self):
         if self._meta.browser_table:
@@ -1460,6 +1603,23 @@ class DataTable(object, metaclass=DataTableMetaclass):
         """
         return self._filter_first_message
 
+    def _get_object_index(self):
+        """Returns the lists of the data objects of the table by ID.
+
+        The IDs are converted to strings. The index is built on first use
+        and dropped when ``data`` is set again, so changes made to the list
+        of data objects in place are not taken into account.
+        """
+        if self._object_index is None:
+            index = {}
+            for datum in self.data or ():
+                obj_id = self.get_object_id(datum)
+                if not isinstance(obj_id, str):
+                    obj_id = str(obj_id)
+                index.setdefault(obj_id, []).append(datum)
+            self._object_index = index
+        return self._object_index
+
     def get_object_by_id(self, lookup):
         """Returns the data object whose ID matches ``loopup`` parameter.
 
@@ -1470,17 +1630,12 @@ class DataTable(object, metaclass=DataTableMetaclass):
         We will convert the object id and ``lookup`` to unicode before
         comparison.
 
-        Uses :meth:`~horizon.tables.DataTable.get_object_id` internally.
+        Uses :meth:`~horizon.tables.DataTable.get_object_id` internally,
+        through an index of the data objects by ID built on first use.
         """
         if not isinstance(lookup, str):
             lookup = str(lookup)
-        matches = []
-        for datum in self.data:
-            obj_id = self.get_object_id(datum)
-            if not isinstance(obj_id, str):
-                obj_id = str(obj_id)
-            if obj_id == lookup:
-                matches.append(datum)
+        matches = self._get_object_index().get(lookup, [])
         if len(matches) > 1:
             raise ValueError("Multiple matches were returned for that id: %s."
                              % matches)
@@ -1695,6 +1850,9 @@ class DataTable(object, metaclass=DataTableMetaclass):
                     if not error:
                         return HttpResponse(new_row.render())
                     return HttpResponse(status=error.status_code)
+            elif (new_row.ajax and new_row.ajax_batch and
+                  new_row.ajax_batch_action_name == action_name):
+                return self.batch_update_handle(request, new_row)
             elif new_row.ajax_cell_action_name == action_name:
                 # inline edit of the cell actions
                 return self.inline_edit_handle(request, table_name,
@@ -1711,6 +1869,35 @@ class DataTable(object, metaclass=DataTableMetaclass):
                             return handled
         return None
 
+    def batch_update_handle(self, request, new_row):
+        """Batched AJAX row update handler.
+
+        Returns a JSON object with the rendered rows of the objects whose
+        IDs are given by the ``obj_id`` query parameters, keyed by ID, and
+        the list of the IDs of the objects which no longer exist.
+        """
+        obj_ids = request.GET.getlist('obj_id')
+        try:
+            data, removed = new_row.get_data_multiple(request, obj_ids)
+            rows = {}
+            for datum in data:
+                row = self._meta.row_class(self)
+                if self.get_object_id(datum) == self.current_item_id:
+                    self.selected = True
+                    row.classes.append('current_selected')
+                row.load_cells(datum)
+                rows[str(self.get_object_id(datum))] = row.render()
+            error = False
+        except Exception:
+            error = exceptions.handle(request, ignore=True)
+        if http_utils.is_ajax(request):
+            if not error:
+                return HttpResponse(
+                    json.dumps({'rows': rows, 'removed': removed}),
+                    content_type="application/json")
+            return HttpResponse(status=error.status_code)
+        return None
+
     def inline_edit_handle(self, request, table_name, action_name, obj_id,
                            new_row):
         """Inline edit handler.
@@ -1931,24 +2118,129 @@ class DataTable(object, metaclass=DataTableMetaclass):
         """Returns this table's columns including auto-generated ones."""
         return list(self.columns.values())
 
-    def get_rows(self):
-        """Return the row data for this table broken out by columns."""
-        rows = []
+    def iter_rows(self):
+        """Returns an iterator building the rows of this table one by one."""
         try:
             for datum in self.filtered_data:
                 row = self._meta.row_class(self, datum)
                 if self.get_object_id(datum) == self.current_item_id:
                     self.selected = True
                     row.classes.append('current_selected')
-                rows.append(row)
+                yield row
         except Exception as e:
             # Exceptions can be swallowed at the template level here,
             # re-raising as a TemplateSyntaxError makes them visible.
             LOG.exception("Error while rendering table rows.")
             raise template.TemplateSyntaxError from e
 
-        return rows
+    def get_rows(self):
+        """Return the row data for this table broken out by columns.
+
+        When the table is streamed (see :meth:`set_streaming`) the rows are
+        not built here but by :func:`stream_tables` while the response is
+        being sent, and a lazy sequence of the rows is returned instead.
+        """
+        if self._rows_placeholder is not None:
+            return StreamedRows(self)
+        return list(self.iter_rows())
+
+    def set_streaming(self):
+        """Renders the rows of this table while the response is being sent.
+
+        Once called, :meth:`render` leaves a placeholder in place of the
+        rows of the table, which :func:`stream_tables` replaces by the rows
+        rendered one at a time. The memory needed to render the table then
+        does not grow with its number of rows.
+        """
+        self._rows_placeholder = "<!-- rows of %s %x -->" % (
+            self.name, id(self))
+
+    @property
+    def rows_placeholder(self):
+        """The placeholder of the rows left in the rendered table, if any."""
+        if self._rows_placeholder is None or not self.filtered_data:
+            return ""
+        return mark_safe(self._rows_placeholder)
+
+    def render_stream(self):
+        """Renders the table as an iterator of HTML chunks."""
+        self.set_streaming()
+        return stream_tables(self.render(), [self])
 
     def css_classes(self):
         """Returns the additional CSS class to be added to <table> tag."""
         return self._meta.css_classes
+
+
+class StreamedRows(object):
+    """Lazy sequence of the rows of a streamed table.
+
+    It lets the table templates test whether the table has rows without
+    building them.
+    """
+
+    def __init__(self, table):
+        self.table = table
+
+    def __len__(self):
+        return len(self.table.filtered_data)
+
+    def __iter__(self):
+        return self.table.iter_rows()
+
+
+def stream_tables(content, tables):
+    """Yields ``content`` with the rows of the streamed ``tables`` rendered.
+
+    ``content`` is HTML rendered after :meth:`DataTable.set_streaming` was
+    called on ``tables``. The rows of each table are built and rendered one
+    at a time in place of the placeholder of the table.
+    """
+    if not tables:
+        yield content
+        return
+    table, tables = tables[0], tables[1:]
+    head, placeholder, tail = content.partition(table._rows_placeholder)
+    yield from stream_tables(head, tables)
+    if placeholder:
+        for row in table.iter_rows():
+            yield row.render()
+        yield from stream_tables(tail, tables)
+
+
+# Exceptions of the data loaders which are not turned into an empty table.
+_RERAISED_DATA_EXCEPTIONS = ((exceptions.Http302, exceptions.HandledException,
+                              exceptions.NotAuthenticated) +
+                             exceptions.UNAUTHORIZED)
+
+
+def load_table_data(request, loaders):
+    """Calls the data loaders of several tables concurrently.
+
+    ``loaders`` is a list of ``(table class, function)`` tuples. The
+    functions run in the pool sized by the ``TABLE_DATA_MAX_WORKERS``
+    setting, so that a page waits for the slowest of them only.
+
+    Returns the data returned by each function, in the order of ``loaders``.
+    Redirections, escalated exceptions and authentication or authorization
+    errors raised by a function are raised again as they are. Other
+    exceptions are handled by :func:`horizon.exceptions.handle` and an empty
+    list is returned in place of the data, so that a failing backend only
+    leaves its own table empty.
+    """
+    results = executors.call_functions([func for table, func in loaders],
+                                       'TABLE_DATA_MAX_WORKERS')
+    data = []
+    for (table, func), (result, exc) in zip(loaders, results):
+        if exc is None:
+            data.append(result)
+            continue
+        if isinstance(exc, _RERAISED_DATA_EXCEPTIONS):
+            raise exc
+        try:
+            raise exc
+        except Exception:
+            msg = _('Unable to retrieve the data of the "%s" table.')
+            exceptions.handle(request, msg % table._meta.verbose_name)
+        data.append([])
+    return data
@@ -14,8 +14,11 @@
 
 from collections import defaultdict
 
+from django import http
 from django import shortcuts
 
+from horizon.tables.base import load_table_data
+from horizon.tables.base import stream_tables
 from horizon import views
 
 from horizon.templatetags.horizon import has_permissions
@@ -35,13 +38,15 @@ class MultiTableMixin(object):
 
     def _get_data_dict(self):
         if not self._data:
+            # The data methods of all the tables are called concurrently.
+            loaders = [(table, func) for table in self.table_classes
+                       for func in self._data_methods.get(table._meta.name,
+                                                          [])]
+            results = load_table_data(self.request, loaders)
             for table in self.table_classes:
-                data = []
-                name = table._meta.name
-                func_list = self._data_methods.get(name, [])
-                for func in func_list:
-                    data.extend(func())
-                self._data[name] = data
+                self._data[table._meta.name] = []
+            for (table, func), data in zip(loaders, results):
+                self._data[table._meta.name].extend(data)
         return self._data
 
     def get_data_methods(self, table_classes, methods):
@@ -199,7 +204,15 @@ class MultiTableView(MultiTableMixin, views.HorizonTemplateView):
     define a ``get_{{ table_name }}_data`` method for each table class
     which returns a set of data for that table; and specify a template for
     the ``template_name`` attribute.
+
+    Setting the ``streaming`` attribute to ``True`` renders the rows of the
+    tables while the response is being sent, using a
+    ``StreamingHttpResponse``. It keeps the memory used and the time to the
+    first byte independent of the number of rows, at the cost of errors
+    raised while rendering a row no longer being reported as an error
+    response.
     """
+    streaming = False
 
     def construct_tables(self):
         tables = self.get_tables().values()
@@ -222,8 +235,26 @@ class MultiTableView(MultiTableMixin, views.HorizonTemplateView):
         handled = self.construct_tables()
         if handled:
             return handled
+        if self.streaming:
+            for table in self.get_tables().values():
+                table.set_streaming()
         context = self.get_context_data(**kwargs)
-        return self.render_to_response(context)
+        response = self.render_to_response(context)
+        if self.streaming:
+            return self.stream_response(response)
+        return response
+
+    def stream_response(self, response):
+        """Returns a streaming response rendering the rows of the tables."""
+        response.render()
+        content = stream_tables(response.content.decode(response.charset),
+                                list(self.get_tables().values()))
+        streaming_response = http.StreamingHttpResponse(
+            content, status=response.status_code)
+        for header, value in response.items():
+            streaming_response[header] = value
+        streaming_response.cookies = response.cookies
+        return streaming_response
 
     def post(self, request, *args, **kwargs):
         # GET and POST handling are the same
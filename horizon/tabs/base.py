@@ -13,15 +13,19 @@
 #    under the License.
 
 from collections import OrderedDict
+import hashlib
 import logging
 import operator
 
 from django.conf import settings
+from django.core.cache import caches
 from django.template.loader import render_to_string
 from django.template import TemplateSyntaxError
 from django.utils import module_loading
+from django.utils import translation
 
 from horizon import exceptions
+from horizon.tables.base import load_table_data
 from horizon.utils import html
 from horizon.utils import settings as utils_settings
 
@@ -61,6 +65,13 @@ class TabGroup(html.HTMLElement):
         Boolean to control whether the tab bar is shown when the tab group
         has only one tab. Default: ``False``
 
+    .. attribute:: lazy
+
+        Boolean to control whether only the active tab is loaded with the
+        page, the other tabs being loaded when they are selected whatever
+        the value of their :attr:`~horizon.tabs.Tab.preload` attribute.
+        Default: ``False``
+
     .. attribute:: param_name
 
         The name of the GET request parameter which will be used when
@@ -91,6 +102,7 @@ class TabGroup(html.HTMLElement):
     param_name = 'tab'
     sticky = False
     show_single_tab = False
+    lazy = False
     _selected = None
     _active = None
 
@@ -168,7 +180,8 @@ class TabGroup(html.HTMLElement):
     def load_tab_data(self):
         """Preload all data that for the tabs that will be displayed."""
         for tab in self._tabs.values():
-            if tab.load and not tab.data_loaded:
+            if (tab.load and not tab.data_loaded and
+                    tab.get_cached_content() is None):
                 try:
                     tab._data = tab.get_context_data(self.request)
                 except Exception:
@@ -302,10 +315,18 @@ class Tab(html.HTMLElement):
 
         A list of permission names which this tab requires in order to be
         displayed. Defaults to an empty list (``[]``).
+
+    .. attribute:: cacheable
+
+        Boolean to control whether the rendered content of the tab is kept
+        in the ``TAB_CACHE_BACKEND`` cache, per user and page, for
+        ``TAB_CACHE_TIMEOUT`` seconds. The data of the tab is not loaded again
+        while it is found in the cache. Default: ``False``.
     """
     name = None
     slug = None
     preload = True
+    cacheable = False
     _active = None
     permissions = []
     policy_rules = None
@@ -339,7 +360,8 @@ class Tab(html.HTMLElement):
 
     @property
     def load(self):
-        load_preloaded = self.preload or self.is_active()
+        preload = self.preload and not self.tab_group.lazy
+        load_preloaded = preload or self.is_active()
         return load_preloaded and self._allowed and self._enabled
 
     @property
@@ -366,13 +388,85 @@ class Tab(html.HTMLElement):
         """
         if not self.load:
             return ''
+        content = self.get_cached_content()
+        if content is not None:
+            return content
         try:
             context = self.data
         except exceptions.Http302:
             raise
         except Exception as e:
             raise TemplateSyntaxError from e
-        return render_to_string(self.get_template_name(self.request), context)
+        content = render_to_string(self.get_template_name(self.request),
+                                   context)
+        self._save_cached_content(content)
+        return content
+
+    def _get_cache_key(self):
+        """Return the key of the rendered content of the tab or None.
+
+        The content depends on the token (user, project and roles), the
+        region, the language and the page, identified by its path and its
+        query string without the parameter selecting the tab. The token is
+        hashed to keep it out of the cache backend.
+        """
+        if not (self.cacheable and settings.TAB_CACHE_BACKEND and
+                self.request is not None):
+            return None
+        user = getattr(self.request, 'user', None)
+        token_id = getattr(getattr(user, 'token', None), 'id', None)
+        if not token_id:
+            return None
+        params = sorted((key, values) for key, values
+                        in self.request.GET.lists()
+                        if key != self.tab_group.param_name)
+        page = repr((token_id, getattr(user, 'services_region', None),
+                     translation.get_language(), self.request.path, params))
+        page_hash = hashlib.sha256(page.encode('utf-8')).hexdigest()
+        return 'horizon.tab:%s:%s' % (page_hash, self.get_id())
+
+    def get_cached_content(self):
+        """Returns the rendered content of the tab found in the cache.
+
+        ``None`` is returned if the tab is not
+        :attr:`~horizon.tabs.Tab.cacheable` or its content is not cached.
+        The cache is looked up once per tab instance.
+        """
+        if not hasattr(self, '_cached_content'):
+            self._cached_content = None
+            cache_key = self._get_cache_key()
+            if cache_key:
+                try:
+                    self._cached_content = caches[
+                        settings.TAB_CACHE_BACKEND].get(cache_key)
+                except Exception:
+                    LOG.warning('Failed to load the content of the tab %s '
+                                'from the cache.', self.get_id(),
+                                exc_info=True)
+        return self._cached_content
+
+    def _save_cached_content(self, content):
+        cache_key = self._get_cache_key()
+        if not cache_key:
+            return
+        try:
+            caches[settings.TAB_CACHE_BACKEND].set(
+                cache_key, content, settings.TAB_CACHE_TIMEOUT)
+        except Exception:
+            LOG.warning('Failed to save the content of the tab %s to the '
+                        'cache.', self.get_id(), exc_info=True)
+
+    def clear_cached_content(self):
+        """Removes the rendered content of the tab from the cache."""
+        self._cached_content = None
+        cache_key = self._get_cache_key()
+        if not cache_key:
+            return
+        try:
+            caches[settings.TAB_CACHE_BACKEND].delete(cache_key)
+        except Exception:
+            LOG.warning('Failed to remove the content of the tab %s from '
+                        'the cache.', self.get_id(), exc_info=True)
 
     def get_id(self):
         """Returns the id for this tab.
@@ -499,10 +593,13 @@ class TableTab(Tab):
     def load_table_data(self):
         """Calls the ``get_{{ table_name }}_data`` methods for each table class.
 
-        When returning, the loaded data is set on the tables.
+        The methods are called concurrently, see
+        :func:`horizon.tables.base.load_table_data`. When returning, the
+        loaded data is set on the tables.
         """
         # We only want the data to be loaded once, so we track if we have...
         if not self._table_data_loaded:
+            loaders = []
             for table_name, table in self._tables.items():
                 # Fetch the data function.
                 func_name = "get_%s_data" % table_name
@@ -513,9 +610,12 @@ class TableTab(Tab):
                         "You must define a %(func_name)s method on"
                         " %(cls_name)s."
                         % {'func_name': func_name, 'cls_name': cls_name})
+                loaders.append((table, data_func))
 
-                # Load the data.
-                table.data = data_func()
+            # Load the data of all the tables concurrently.
+            results = load_table_data(self.request, loaders)
+            for (table, data_func), data in zip(loaders, results):
+                table.data = data
                 table._meta.has_prev_data = self.has_prev_data(table)
                 table._meta.has_more_data = self.has_more_data(table)
             # Mark our data as loaded so we don't run the loaders again.
@@ -140,11 +140,14 @@ class TabbedTableView(tables.MultiTableMixin, TabView):
         return self.handle_tabbed_response(context["tab_group"], context)
 
     def post(self, request, *args, **kwargs):
+        tabs = self.get_tabs(self.request, **self.kwargs).get_tabs()
+        # The content of the tabs may be changed by the actions.
+        for tab in tabs:
+            tab.clear_cached_content()
         # Direct POST to its appropriate tab
         # Note some table actions like filter do not have an 'action'
         if 'action' in request.POST:
             targetslug = request.POST['action'].split('__')[0]
-            tabs = self.get_tabs(self.request, **self.kwargs).get_tabs()
             matches = [tab for tab in tabs if tab.slug == targetslug]
             if matches:
                 # Call POST on first match only. There shouldn't be a case
@@ -17,7 +17,9 @@ import datetime
 from unittest import mock
 
 from django.conf import settings
+from django.http import HttpResponse
 from django.http import HttpResponseRedirect
+from django.http import StreamingHttpResponse
 from django import test as django_test
 from django.test.utils import override_settings
 from django.utils import timezone
@@ -50,6 +52,31 @@ class MiddlewareTests(django_test.TestCase):
 
         self.assertRedirects(resp, settings.TESTSERVER + url)
 
+    @override_settings(SESSION_REFRESH=False)
+    @mock.patch('horizon.base._save_access_decisions')
+    def test_save_access_decisions(self, mock_save):
+        request = self.factory.get(settings.LOGIN_REDIRECT_URL)
+        self.get_response.return_value = HttpResponse()
+        mw = middleware.HorizonMiddleware(self.get_response)
+
+        mw(request)
+
+        mock_save.assert_called_once_with(request)
+
+    @override_settings(SESSION_REFRESH=False)
+    @mock.patch('horizon.base._save_access_decisions')
+    def test_save_access_decisions_streaming(self, mock_save):
+        request = self.factory.get(settings.LOGIN_REDIRECT_URL)
+        self.get_response.return_value = StreamingHttpResponse(iter(['a']))
+        mw = middleware.HorizonMiddleware(self.get_response)
+
+        response = mw(request)
+
+        # The decisions are saved once the page has been rendered.
+        mock_save.assert_not_called()
+        self.assertEqual(b'a', b''.join(response.streaming_content))
+        mock_save.assert_called_once_with(request)
+
     def test_process_response_redirect_on_ajax_request(self):
         url = settings.LOGIN_REDIRECT_URL
         mw = middleware.HorizonMiddleware(self.get_response)
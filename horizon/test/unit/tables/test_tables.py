@@ -15,6 +15,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
+import threading
 import unittest
 from unittest import mock
 import uuid
@@ -148,6 +150,17 @@ class MyRow(tables.Row):
         return TEST_DATA_2[0]
 
 
+class MyBatchUpdateRow(tables.Row):
+    ajax = True
+    ajax_batch = True
+
+    @classmethod
+    def get_data_multiple(cls, request, obj_ids):
+        data = [datum for datum in TEST_DATA_2 if datum.id in obj_ids]
+        removed = [obj_id for obj_id in obj_ids if obj_id == '5']
+        return data, removed
+
+
 class MyBatchAction(tables.BatchAction):
     name = "batch"
 
@@ -1286,6 +1299,182 @@ class DataTableTests(test.TestCase):
         resp = http.HttpResponse(table.render())
         self.assertContains(resp, value)
 
+    def test_table_render_stream(self):
+        self.table = MyTable(self.request, TEST_DATA)
+        chunks = list(self.table.render_stream())
+        # The start of the table, each row, then the end of the table.
+        self.assertEqual(len(TEST_DATA) + 2, len(chunks))
+        self.assertIn('<tbody>', chunks[0])
+        self.assertIn('</tbody>', chunks[-1])
+        for datum, chunk in zip(TEST_DATA, chunks[1:-1]):
+            self.assertIn('data-object-id="%s"' % datum.id, chunk)
+        self.assertNotIn(self.table._rows_placeholder, ''.join(chunks))
+
+    def test_table_render_stream_no_data(self):
+        table = MyTable(self.request, [])
+        chunks = list(table.render_stream())
+        self.assertEqual(1, len(chunks))
+        self.assertIn(str(table.get_empty_message()), chunks[0])
+
+    def test_table_cells_attrs_created_lazily(self):
+        self.table = MyTable(self.request, TEST_DATA_5)
+        row = self.table.get_rows()[0]
+        cell = row.cells['status']
+        self.assertFalse(hasattr(cell, '__dict__'))
+        self.assertIsNone(cell._attrs)
+        self.assertIsNone(cell._classes)
+        # The tooltip of the truncated value is only computed on rendering.
+        self.assertIn('data-toggle="tooltip"', cell.attr_string)
+        self.assertIn('data-toggle="tooltip"', row.render())
+
+    def test_table_row_arbitrary_attribute(self):
+        self.table = MyTable(self.request, TEST_DATA_5)
+        row = self.table.get_rows()[0]
+        row.custom_attribute = 'custom'
+        self.assertEqual('custom', row.custom_attribute)
+
+    def test_row_actions_allowed_depends_on(self):
+        class MyStatusAction(MyAction):
+            allowed_depends_on = ('status',)
+
+        class MyStatusTable(MyTable):
+            class Meta(object):
+                name = "my_table"
+                row_actions = (MyStatusAction,)
+
+        data = [FakeObject(str(i), 'object_%d' % i, 'value',
+                           ('up', 'down')[i % 2]) for i in range(10)]
+        table = MyStatusTable(self.request, data)
+        with mock.patch.object(MyStatusAction, 'allowed',
+                               autospec=True,
+                               side_effect=MyAction.allowed) as allowed:
+            rows = table.get_rows()
+        self.assertEqual(2, allowed.call_count)
+        self.assertEqual(2, table.allowed_evaluations)
+        self.assertEqual(8, table.allowed_evaluations_skipped)
+        for row in rows:
+            actions = table.get_row_actions(row.datum)
+            self.assertEqual(row.datum.status != 'down', bool(actions))
+
+    def test_get_object_by_id(self):
+        table = MyTable(self.request, TEST_DATA)
+        with mock.patch.object(table, 'get_object_id',
+                               wraps=table.get_object_id) as get_object_id:
+            self.assertEqual(TEST_DATA[1], table.get_object_by_id('2'))
+            self.assertEqual(TEST_DATA[2], table.get_object_by_id(3))
+            # The index is only built once.
+            self.assertEqual(len(TEST_DATA), get_object_id.call_count)
+        self.assertRaises(exceptions.Http302, table.get_object_by_id, '9')
+
+        # The index is built again when the data is set.
+        table.data = TEST_DATA_2
+        self.assertEqual(TEST_DATA_2[0], table.get_object_by_id('1'))
+        self.assertRaises(exceptions.Http302, table.get_object_by_id, '2')
+
+        table.data = TEST_DATA_2 + TEST_DATA_3
+        self.assertRaises(ValueError, table.get_object_by_id, '1')
+
+    def test_batch_row_update(self):
+        class MyBatchUpdateTable(MyTable):
+            class Meta(object):
+                name = "my_table"
+                status_columns = ["status"]
+                row_class = MyBatchUpdateRow
+
+        table = MyBatchUpdateTable(self.request, TEST_DATA)
+        resp = http.HttpResponse(table.render())
+        self.assertContains(
+            resp, 'data-update-batch-url="?action=rows_update&amp;'
+            'table=my_table"', 4)
+
+        req = self.factory.get('/my_url/',
+                               {"table": "my_table", "action": "rows_update",
+                                "obj_id": ["1", "5", "6"]},
+                               HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        table = MyBatchUpdateTable(req)
+        resp = table.maybe_preempt()
+
+        self.assertEqual(200, resp.status_code)
+        data = json.loads(resp.content)
+        self.assertEqual(['1'], list(data['rows']))
+        self.assertIn('my_table__row__1', data['rows']['1'])
+        self.assertIn('status_down', data['rows']['1'])
+        self.assertEqual(['5'], data['removed'])
+
+    @mock.patch.object(exceptions, 'NOT_FOUND', (LookupError,))
+    @mock.patch.object(exceptions, 'handle')
+    def test_batch_row_update_default_get_data_multiple(self, mock_handle):
+        def get_data(request, obj_id):
+            if obj_id == '2':
+                raise LookupError()
+            if obj_id == '3':
+                raise ValueError()
+            return TEST_DATA[int(obj_id) - 1]
+
+        row = tables.Row(MyTable(self.request))
+        with mock.patch.object(tables.Row, 'get_data', side_effect=get_data):
+            data, removed = row.get_data_multiple(self.request,
+                                                  ['1', '2', '3', '4'])
+        # The row of the object which could not be retrieved is unchanged.
+        self.assertEqual([TEST_DATA[0], TEST_DATA[3]], data)
+        self.assertEqual(['2'], removed)
+        mock_handle.assert_called_once_with(self.request, ignore=True)
+
+    def _handle_batch_action(self):
+        req = self.factory.post('/my_url/',
+                                {'action': 'my_table__batch',
+                                 'object_ids': ['1', '2', '3', '4']})
+        handled = MyTable(req, TEST_DATA).maybe_handle()
+        self.assertEqual(302, handled.status_code)
+        return [str(message.message) for message in req._messages]
+
+    @mock.patch.object(MyBatchAction, 'max_concurrency', 2)
+    def test_batch_action_concurrent(self):
+        # Both objects of a window must be acted on at the same time to get
+        # through the barrier.
+        barrier = threading.Barrier(2, timeout=10)
+        acted_on = []
+
+        def action(request, obj_id):
+            barrier.wait()
+            acted_on.append(obj_id)
+            if obj_id == '2':
+                raise Exception('failed')
+
+        with mock.patch.object(MyBatchAction, 'action',
+                               side_effect=action):
+            messages = self._handle_batch_action()
+
+        self.assertEqual(['1', '2', '3', '4'], sorted(acted_on))
+        self.assertEqual(['Unable to batch item: object_2',
+                          'Batched Items: object_1, object_3, öbject_4'],
+                         messages)
+
+    def test_batch_action_bulk(self):
+        bulk_action = mock.Mock(return_value={'2': Exception('failed')})
+        with mock.patch.object(MyBatchAction, 'bulk_action', bulk_action), \
+                mock.patch.object(MyBatchAction, 'action') as action:
+            messages = self._handle_batch_action()
+
+        bulk_action.assert_called_once_with(mock.ANY, ['1', '2', '3', '4'])
+        action.assert_not_called()
+        self.assertEqual(['Unable to batch item: object_2',
+                          'Batched Items: object_1, object_3, öbject_4'],
+                         messages)
+
+    def test_row_actions_allowed_evaluated_per_row_by_default(self):
+        class MyRowTable(MyTable):
+            class Meta(object):
+                name = "my_table"
+                row_actions = (MyAction,)
+
+        table = MyRowTable(self.request, TEST_DATA)
+        with mock.patch.object(MyAction, 'allowed', autospec=True,
+                               return_value=True) as allowed:
+            table.get_rows()
+        self.assertEqual(len(TEST_DATA), allowed.call_count)
+        self.assertEqual(0, table.allowed_evaluations_skipped)
+
 
 class SingleTableView(table_views.DataTableView):
     table_class = MyTable
@@ -1366,6 +1555,66 @@ class DataTableViewTests(test.TestCase):
         self.assertEqual(TableWithPermissions,
                          context['table_with_permissions_table'].__class__)
 
+    def test_multi_table_view_concurrent(self):
+        # Both data methods must be called at the same time to get through
+        # the barrier.
+        barrier = threading.Barrier(2, timeout=10)
+
+        def get_data(view):
+            barrier.wait()
+            return TEST_DATA
+
+        with mock.patch.object(MultiTableView,
+                               'get_table_with_permissions_data',
+                               autospec=True, side_effect=get_data), \
+                mock.patch.object(MultiTableView, 'get_my_table_data',
+                                  autospec=True, side_effect=get_data):
+            view = self._prepare_view(MultiTableView)
+            data = view._get_data_dict()
+        self.assertEqual({'my_table': list(TEST_DATA),
+                          'table_with_permissions': list(TEST_DATA)}, data)
+
+    @mock.patch.object(exceptions, 'handle')
+    def test_multi_table_view_data_error(self, mock_handle):
+        with mock.patch.object(MultiTableView, 'get_my_table_data',
+                               side_effect=Exception('failed')):
+            view = self._prepare_view(MultiTableView)
+            data = view._get_data_dict()
+        self.assertEqual({'my_table': [],
+                          'table_with_permissions': list(TEST_DATA)}, data)
+        mock_handle.assert_called_once_with(
+            view.request, 'Unable to retrieve the data of the "My Table" '
+            'table.')
+
+    def test_multi_table_view_data_redirect(self):
+        with mock.patch.object(MultiTableView, 'get_my_table_data',
+                               side_effect=exceptions.Http302('/other/')):
+            view = self._prepare_view(MultiTableView)
+            with self.assertRaises(exceptions.Http302) as cm:
+                view._get_data_dict()
+        self.assertEqual('/other/', cm.exception.location)
+
+    def test_multi_table_view_data_escalate(self):
+        with mock.patch.object(MultiTableView, 'get_my_table_data',
+                               side_effect=exceptions.HandledException(
+                                   [Exception, Exception('failed'), None])):
+            view = self._prepare_view(MultiTableView)
+            self.assertRaises(exceptions.HandledException,
+                              view._get_data_dict)
+
+    def test_data_table_view_streaming(self):
+        view = self._prepare_view(SingleTableView)
+        view.streaming = True
+        with mock.patch.object(MyTable, 'get_rows') as get_rows:
+            response = view.get(view.request)
+        get_rows.assert_not_called()
+        self.assertTrue(response.streaming)
+        content = b''.join(response.streaming_content).decode()
+        for datum in TEST_DATA:
+            self.assertIn('data-object-id="%s"' % datum.id, content)
+        self.assertNotIn(view.table._rows_placeholder, content)
+        self.assertIn('id="my_table"', content)
+
     fil_value_param = "my_table__filter__q"
     fil_field_param = '%s_field' % fil_value_param
 
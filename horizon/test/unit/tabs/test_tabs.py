@@ -15,8 +15,10 @@
 #    under the License.
 
 import copy
+from unittest import mock
 
 from django.conf import settings
+from django.core.cache import caches
 from django import http
 from django.test.utils import override_settings
 
@@ -87,6 +89,19 @@ class GroupWithConfig(horizon_tabs.TabGroup):
     sticky = True
 
 
+class TabCacheable(BaseTestTab):
+    slug = "tab_cacheable"
+    name = "Cacheable Tab"
+    template_name = "_tab.html"
+    cacheable = True
+
+
+class LazyGroup(horizon_tabs.TabGroup):
+    slug = "tab_group"
+    tabs = (TabOne, TabCacheable)
+    lazy = True
+
+
 class TabWithTable(horizon_tabs.TableTab):
     table_classes = (MyTable,)
     name = "Tab With My Table"
@@ -334,6 +349,96 @@ class TabTests(test.TestCase):
         # Since we only had one table we should get the shortcut name too.
         self.assertEqual(table, context['table'])
 
+    @mock.patch.object(exceptions, 'handle')
+    def test_table_tabs_data_error(self, mock_handle):
+        tab = TableTabGroup(self.request).get_tabs()[0]
+        with mock.patch.object(TabWithTable, 'get_my_table_data',
+                               side_effect=Exception('failed')):
+            tab.load_table_data()
+        self.assertTrue(tab._table_data_loaded)
+        self.assertEqual([], tab._tables[MyTable.Meta.name].data)
+        mock_handle.assert_called_once_with(
+            self.request, 'Unable to retrieve the data of the "My Table" '
+            'table.')
+
+    def test_table_tabs_data_redirect(self):
+        tab = TableTabGroup(self.request).get_tabs()[0]
+        with mock.patch.object(TabWithTable, 'get_my_table_data',
+                               side_effect=exceptions.Http302('/other/')):
+            with self.assertRaises(exceptions.Http302) as cm:
+                tab.load_table_data()
+        self.assertEqual('/other/', cm.exception.location)
+        self.assertFalse(tab._table_data_loaded)
+
+    def test_table_tabs_data_escalate(self):
+        tab = TableTabGroup(self.request).get_tabs()[0]
+        with mock.patch.object(TabWithTable, 'get_my_table_data',
+                               side_effect=exceptions.HandledException(
+                                   [Exception, Exception('failed'), None])):
+            self.assertRaises(exceptions.HandledException,
+                              tab.load_table_data)
+        self.assertFalse(tab._table_data_loaded)
+
+    def test_lazy_tab_group(self):
+        tg = LazyGroup(self.request)
+        tab_one = tg.get_tab("tab_one")
+        tab_cacheable = tg.get_tab("tab_cacheable")
+        # Only the active tab is loaded, even if the others are preloaded.
+        self.assertTrue(tab_one.load)
+        self.assertFalse(tab_cacheable.load)
+        tg.load_tab_data()
+        self.assertTrue(tab_one.data_loaded)
+        self.assertFalse(tab_cacheable.data_loaded)
+        self.assertEqual('', tab_cacheable.render())
+
+        # The selected tab is loaded on demand.
+        self.request.GET['tab'] = tab_cacheable.get_id()
+        tg = LazyGroup(self.request)
+        self.assertFalse(tg.get_tab("tab_one").load)
+        self.assertTrue(tg.get_tab("tab_cacheable").load)
+
+    def _render_cacheable_tab(self, token_id='token'):
+        request = http.HttpRequest()
+        request.user = mock.Mock()
+        request.user.token.id = token_id
+        request.user.services_region = 'RegionOne'
+        request.GET['tab'] = 'tab_group__tab_cacheable'
+        tg = LazyGroup(request)
+        tg.load_tab_data()
+        tab = tg.get_tab("tab_cacheable")
+        return tab, tab.render()
+
+    @override_settings(
+        CACHES={'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+        TAB_CACHE_BACKEND='default')
+    @mock.patch.object(TabCacheable, 'get_context_data', autospec=True,
+                       side_effect=lambda tab, request: {"tab": tab})
+    def test_tab_cache(self, mock_get_context_data):
+        caches['default'].clear()
+        tab, output = self._render_cacheable_tab()
+        self.assertEqual(tab.name, output.strip())
+        self.assertEqual(1, mock_get_context_data.call_count)
+
+        # The content is found in the cache for the same user and page.
+        tab, output = self._render_cacheable_tab()
+        self.assertEqual(tab.name, output.strip())
+        self.assertEqual(1, mock_get_context_data.call_count)
+
+        self._render_cacheable_tab('other')
+        self.assertEqual(2, mock_get_context_data.call_count)
+
+        tab.clear_cached_content()
+        self._render_cacheable_tab()
+        self.assertEqual(3, mock_get_context_data.call_count)
+
+    @mock.patch.object(TabCacheable, 'get_context_data', autospec=True,
+                       side_effect=lambda tab, request: {"tab": tab})
+    def test_tab_cache_disabled(self, mock_get_context_data):
+        self._render_cacheable_tab()
+        self._render_cacheable_tab()
+        self.assertEqual(2, mock_get_context_data.call_count)
+
     def test_tabbed_table_view(self):
         view = TabWithTableView.as_view()
 
@@ -18,10 +18,13 @@
 #    under the License.
 
 import importlib
+from unittest import mock
 
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
+from django import http
 from django.test.utils import override_settings
 from django import urls
 
@@ -67,6 +70,12 @@ class RbacYesAccessPanel(horizon.Panel):
     slug = "rbac_panel_yes"
 
 
+class RbacPolicyPanel(horizon.Panel):
+    name = "RBAC Policy Panel"
+    slug = "rbac_policy_panel"
+    policy_rules = (("identity", "identity:get_user"),)
+
+
 class BaseHorizonTests(test.TestCase):
 
     def setUp(self):
@@ -563,3 +572,95 @@ class RbacHorizonTests(test.TestCase):
                                  transform=repr)
 
         self.assertTrue(dogs.can_access(context))
+
+
+class AccessCacheTests(test.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.panel = RbacPolicyPanel()
+        self.policy_check = mock.Mock(return_value=True)
+        patcher = self.settings(POLICY_CHECK_FUNCTION=self.policy_check)
+        patcher.enable()
+        self.addCleanup(patcher.disable)
+
+    def _token_request(self, token_id='token'):
+        request = http.HttpRequest()
+        request.user = mock.Mock()
+        request.user.token.id = token_id
+        request.user.services_region = 'RegionOne'
+        return request
+
+    def test_can_access_cached_per_request(self):
+        context = {'request': self.request}
+        self.assertTrue(self.panel.can_access(context))
+        self.assertTrue(self.panel.can_access(context))
+        self.policy_check.assert_called_once_with(
+            (("identity", "identity:get_user"),), self.request)
+
+        # Without a shared cache a new request evaluates the policy again.
+        self.assertTrue(self.panel.can_access({'request': http.HttpRequest()}))
+        self.assertEqual(2, self.policy_check.call_count)
+
+    def test_policy_decision_shared_between_components(self):
+        context = {'request': self.request}
+        other_panel = type('OtherPanel', (RbacPolicyPanel,),
+                           {'slug': 'other_panel'})()
+        self.assertTrue(self.panel.can_access(context))
+        self.assertTrue(other_panel.can_access(context))
+        self.policy_check.assert_called_once()
+
+    @override_settings(
+        CACHES={'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+        ACCESS_CACHE_BACKEND='default')
+    def test_can_access_cached_per_token(self):
+        caches['default'].clear()
+        request = self._token_request()
+        self.assertTrue(self.panel.can_access({'request': request}))
+        base._save_access_decisions(request)
+        self.assertTrue(
+            self.panel.can_access({'request': self._token_request()}))
+        self.policy_check.assert_called_once()
+
+        self.assertTrue(
+            self.panel.can_access({'request': self._token_request('other')}))
+        self.assertEqual(2, self.policy_check.call_count)
+
+    @override_settings(
+        CACHES={'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+        ACCESS_CACHE_BACKEND='default')
+    def test_can_access_cached_per_domain(self):
+        caches['default'].clear()
+        request = self._token_request()
+        self.assertTrue(self.panel.can_access({'request': request}))
+        base._save_access_decisions(request)
+
+        # The domain scoped token and the domain context are used by the
+        # domain policies.
+        request = self._token_request()
+        request.session = {'domain_token': mock.Mock(auth_token='domain')}
+        self.assertTrue(self.panel.can_access({'request': request}))
+        base._save_access_decisions(request)
+        request = self._token_request()
+        request.session = {'domain_context': 'domain_id'}
+        self.assertTrue(self.panel.can_access({'request': request}))
+        self.assertEqual(3, self.policy_check.call_count)
+
+    @override_settings(ACCESS_CACHE_BACKEND='default')
+    def test_save_access_decisions_once(self):
+        request = self._token_request()
+        other_panel = type('OtherPanel', (RbacPolicyPanel,),
+                           {'slug': 'other_panel',
+                            'policy_rules': (("identity",
+                                              "identity:list_users"),)})()
+        with mock.patch.object(base, 'caches') as mock_caches:
+            mock_caches.__getitem__.return_value.get.return_value = None
+            self.assertTrue(self.panel.can_access({'request': request}))
+            self.assertTrue(other_panel.can_access({'request': request}))
+            base._save_access_decisions(request)
+            base._save_access_decisions(request)
+        mock_caches.__getitem__.return_value.set.assert_called_once_with(
+            base._get_access_cache_key(request), mock.ANY,
+            settings.ACCESS_CACHE_TIMEOUT)
@@ -10,10 +10,25 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from unittest import mock
+
+from django.core.cache import caches
+from django.test.utils import override_settings
+
 from horizon.test import helpers as test
 from horizon.utils import memoized
 
 
+def _fake_request(token_id='token', project_id='project'):
+    request = mock.Mock()
+    request.user.is_authenticated = True
+    request.user.endpoint = 'http://keystone/v3'
+    request.user.services_region = 'RegionOne'
+    request.user.project_id = project_id
+    request.user.token.id = token_id
+    return request
+
+
 class MemoizedTests(test.TestCase):
     def test_memoized_decorator_cache_on_next_call(self):
         values_list = []
@@ -80,3 +95,98 @@ class MemoizedTests(test.TestCase):
         cache_calls(4)
         self.assertEqual(9, len(values_list))
         # 4 is readded, 5 is dropped
+
+
+@override_settings(
+    CACHES={'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    MEMOIZED_SHARED_CACHE_BACKEND='default')
+class MemoizedSharedCacheTests(test.TestCase):
+    def setUp(self):
+        super().setUp()
+        caches['default'].clear()
+
+    def test_shared_cache_across_requests(self):
+        values_list = []
+
+        @memoized.memoized(shared_ttl=60)
+        def cache_calls(request, param):
+            values_list.append(param)
+            return [param]
+
+        self.assertEqual([1], cache_calls(_fake_request(), 1))
+        # A new request object misses the per-process cache, but the value
+        # is found in the shared cache.
+        self.assertEqual([1], cache_calls(_fake_request(), 1))
+        self.assertEqual(1, len(values_list))
+
+        cache_calls(_fake_request(), 2)
+        self.assertEqual(2, len(values_list))
+
+    def test_shared_cache_key_per_token(self):
+        values_list = []
+
+        @memoized.memoized(shared_ttl=60)
+        def per_token(request):
+            values_list.append(request)
+
+        @memoized.memoized(shared_ttl=60, per_token=False)
+        def per_project(request):
+            values_list.append(request)
+
+        per_token(_fake_request(token_id='a'))
+        per_token(_fake_request(token_id='b'))
+        self.assertEqual(2, len(values_list))
+
+        per_project(_fake_request(token_id='a'))
+        per_project(_fake_request(token_id='b'))
+        self.assertEqual(3, len(values_list))
+        per_project(_fake_request(project_id='other'))
+        self.assertEqual(4, len(values_list))
+
+    def test_shared_cache_caches_none(self):
+        values_list = []
+
+        @memoized.memoized(shared_ttl=60)
+        def cache_calls(request):
+            values_list.append(request)
+
+        cache_calls(_fake_request())
+        cache_calls(_fake_request())
+        self.assertEqual(1, len(values_list))
+
+    def test_shared_cache_skipped_for_complex_args(self):
+        values_list = []
+
+        @memoized.memoized(shared_ttl=60)
+        def cache_calls(request, param):
+            values_list.append(param)
+
+        param = object()
+        cache_calls(_fake_request(), param)
+        cache_calls(_fake_request(), param)
+        self.assertEqual(2, len(values_list))
+
+    def test_shared_cache_disabled_by_timeout_setting(self):
+        values_list = []
+
+        @memoized.memoized(shared_ttl=60)
+        def cache_calls(request):
+            values_list.append(request)
+
+        name = '%s.%s' % (cache_calls.__module__, cache_calls.__qualname__)
+        with self.settings(MEMOIZED_SHARED_CACHE_TIMEOUTS={name: 0}):
+            cache_calls(_fake_request())
+            cache_calls(_fake_request())
+        self.assertEqual(2, len(values_list))
+
+    def test_shared_cache_not_used_without_ttl(self):
+        values_list = []
+
+        @memoized.memoized
+        def cache_calls(request):
+            values_list.append(request)
+
+        cache_calls(_fake_request())
+        cache_calls(_fake_request())
+        self.assertEqual(2, len(values_list))
@@ -0,0 +1,110 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+import threading
+
+from django.conf import settings
+from django.utils import translation
+import futurist
+
+# The thread pools of the process and the pid they were created in, keyed by
+# the name of the setting giving their size.
+_EXECUTORS = {}
+_EXECUTORS_LOCK = threading.Lock()
+
+
+def get_executor(setting_name):
+    """Returns the thread pool of the process sized by the given setting.
+
+    A pool is shared by all the requests of the process for each setting,
+    for example ``BATCH_ACTION_MAX_WORKERS``. It is created again in
+    processes forked after its creation, since they do not inherit its
+    threads.
+    """
+    pid = os.getpid()
+    executor = _EXECUTORS.get(setting_name)
+    if executor is None or executor[0] != pid:
+        with _EXECUTORS_LOCK:
+            executor = _EXECUTORS.get(setting_name)
+            if executor is None or executor[0] != pid:
+                executor = (pid, futurist.ThreadPoolExecutor(
+                    max_workers=getattr(settings, setting_name)))
+                _EXECUTORS[setting_name] = executor
+    return executor[1]
+
+
+def get_executor_statistics(setting_name):
+    """Returns statistics about the thread pool sized by the given setting.
+
+    :returns: a dict with the maximum and current number of workers, the
+        number of idle workers, the number of functions queued waiting for a
+        worker (``queue_size``), the numbers of functions executed, failed
+        and cancelled, and the total time spent running them. They are all
+        zero when the setting is ``0``, no pool being created then.
+    """
+    max_workers = getattr(settings, setting_name)
+    if max_workers <= 0:
+        return {'max_workers': 0, 'workers': 0, 'idle_workers': 0,
+                'queue_size': 0, 'executed': 0, 'failures': 0,
+                'cancelled': 0, 'runtime': 0.0}
+    executor = get_executor(setting_name)
+    statistics = executor.statistics
+    return {
+        'max_workers': max_workers,
+        'workers': executor.num_workers,
+        'idle_workers': executor.get_num_idle_workers(),
+        'queue_size': executor.queue_size,
+        'executed': statistics.executed,
+        'failures': statistics.failures,
+        'cancelled': statistics.cancelled,
+        'runtime': statistics.runtime,
+    }
+
+
+def _call(func, language):
+    with translation.override(language):
+        try:
+            return func(), None
+        except Exception as e:
+            return None, e
+
+
+def call_functions(funcs, setting_name):
+    """Calls the given functions concurrently.
+
+    The functions run in the pool returned by :func:`get_executor` for
+    ``setting_name``, with the language active in the calling thread. The
+    calling thread runs the first function, as well as the functions which
+    have not started by the time it is free, so that the calls keep making
+    progress when the pool is busy. They all run one after the other in the
+    calling thread when the setting is ``0``.
+
+    :returns: a list of ``(result, exception)`` tuples in the order of
+        ``funcs``, where ``exception`` is the exception raised by the
+        function, or None if it returned ``result``. An exception raised by
+        a function does not prevent the others from running.
+    """
+    language = translation.get_language()
+    futures = [None] * len(funcs)
+    if getattr(settings, setting_name) > 0:
+        executor = get_executor(setting_name)
+        for index in range(1, len(funcs)):
+            futures[index] = executor.submit(_call, funcs[index], language)
+
+    results = []
+    for func, future in zip(funcs, futures):
+        if future is None or future.cancel():
+            results.append(_call(func, language))
+        else:
+            results.append(future.result())
+    return results
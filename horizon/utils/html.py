@@ -17,6 +17,9 @@ from django.forms.utils import flatatt
 
 class HTMLElement(object):
     """A generic base class that gracefully handles html-style attributes."""
+
+    __slots__ = ()
+
     def __init__(self):
         self.attrs = getattr(self, "attrs", {})
         self.classes = getattr(self, "classes", [])
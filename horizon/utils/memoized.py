@@ -14,11 +14,21 @@
 
 import collections
 import functools
+import hashlib
+import logging
 import threading
 import warnings
 import weakref
 
 from django.conf import settings
+from django.core.cache import caches
+
+
+LOG = logging.getLogger(__name__)
+
+# Argument types whose repr() is stable across processes and can therefore
+# be part of a key in the shared cache tier.
+_SHARED_KEY_TYPES = (str, int, float, bool, type(None))
 
 
 class UnhashableKeyWarning(RuntimeWarning):
@@ -48,7 +58,113 @@ def _get_key(args, kwargs, remove_callback):
     return weak_args, weak_kwargs
 
 
-def memoized(func=None, max_size=None):
+def _get_request_identity(request, per_token):
+    """Return a stable identity of the request scope or None.
+
+    The identity is built from the keystone endpoint, the services region
+    and the project of the current user, and additionally from a hash of
+    the token when ``per_token`` is set. It is used instead of the object
+    identity of the request so that the value can be shared between
+    requests and processes.
+    """
+    user = getattr(request, 'user', None)
+    if user is None or not getattr(user, 'is_authenticated', False):
+        return None
+    identity = [getattr(user, 'endpoint', None),
+                getattr(user, 'services_region', None),
+                getattr(user, 'project_id', None)]
+    if per_token:
+        token = getattr(user, 'token', None)
+        token_id = getattr(token, 'id', None)
+        if not token_id:
+            return None
+        identity.append(hashlib.sha256(token_id.encode('utf-8')).hexdigest())
+    return tuple(identity)
+
+
+def _is_shared_key_arg(arg):
+    # Sets are not accepted, because their iteration order depends on the
+    # string hash seed of the process.
+    if isinstance(arg, tuple):
+        return all(_is_shared_key_arg(item) for item in arg)
+    return isinstance(arg, _SHARED_KEY_TYPES)
+
+
+def _get_shared_key(func, args, kwargs, per_token):
+    """Calculate the key of the shared cache tier.
+
+    The first positional argument (or the ``request`` keyword argument) is
+    expected to be a request. All other arguments must be of simple types,
+    otherwise None is returned and the shared tier is skipped.
+    """
+    if args:
+        request, args = args[0], args[1:]
+    else:
+        kwargs = dict(kwargs)
+        request = kwargs.pop('request', None)
+    identity = _get_request_identity(request, per_token)
+    if identity is None:
+        return None
+    if not (_is_shared_key_arg(args) and
+            _is_shared_key_arg(tuple(kwargs.values()))):
+        return None
+    raw_key = repr((func.__module__, func.__qualname__, identity,
+                    args, tuple(sorted(kwargs.items()))))
+    return 'horizon.memoized:%s' % hashlib.sha256(
+        raw_key.encode('utf-8')).hexdigest()
+
+
+def _get_shared_timeout(func, default_timeout):
+    name = '%s.%s' % (func.__module__, func.__qualname__)
+    timeouts = settings.MEMOIZED_SHARED_CACHE_TIMEOUTS
+    return timeouts.get(name, default_timeout)
+
+
+def _get_shared_cache():
+    backend = settings.MEMOIZED_SHARED_CACHE_BACKEND
+    if not backend:
+        return None
+    return caches[backend]
+
+
+def _call_with_shared_cache(func, args, kwargs, shared_ttl, per_token):
+    """Call func, looking the value up in the shared cache tier first.
+
+    The shared tier is only used when it is configured by
+    ``MEMOIZED_SHARED_CACHE_BACKEND`` and a positive timeout applies to
+    the function. Errors of the cache backend are logged and never
+    propagated, the function is simply called in that case.
+    """
+    timeout = _get_shared_timeout(func, shared_ttl)
+    shared_cache = _get_shared_cache() if timeout else None
+    if shared_cache is None:
+        return func(*args, **kwargs)
+    shared_key = _get_shared_key(func, args, kwargs, per_token)
+    if shared_key is None:
+        return func(*args, **kwargs)
+
+    try:
+        cached = shared_cache.get(shared_key)
+    except Exception:
+        LOG.warning("Failed to read %s.%s from the shared memoize cache.",
+                    func.__module__, func.__qualname__, exc_info=True)
+        cached = None
+    if cached is not None:
+        # The value is wrapped in a tuple so that a cached None can be told
+        # apart from a cache miss.
+        return cached[0]
+
+    value = func(*args, **kwargs)
+    try:
+        shared_cache.set(shared_key, (value,), timeout)
+    except Exception:
+        # Most likely the value cannot be pickled.
+        LOG.warning("Failed to store %s.%s in the shared memoize cache.",
+                    func.__module__, func.__qualname__, exc_info=True)
+    return value
+
+
+def memoized(func=None, max_size=None, shared_ttl=None, per_token=True):
     """Decorator that caches function calls.
 
     Caches the decorated function's return value the first time it is called
@@ -60,6 +176,16 @@ def memoized(func=None, max_size=None):
 
     The cache uses weak references to the passed arguments, so it doesn't keep
     them alive in memory forever.
+
+    When ``shared_ttl`` is given (or a timeout is configured for the function
+    in ``MEMOIZED_SHARED_CACHE_TIMEOUTS``) and ``MEMOIZED_SHARED_CACHE_BACKEND``
+    names a Django cache, a miss of the per-process cache is looked up in
+    that shared cache before the decorated function is called. The first
+    argument of such a function must be a request. The shared key is built
+    from the keystone endpoint, region and project of the request user, plus
+    a hash of the token unless ``per_token`` is False, so values survive the
+    request and are shared by all the worker processes using the cache.
+    The cached values must be picklable.
     """
 
     def decorate(func):
@@ -106,7 +232,8 @@ def memoized(func=None, max_size=None):
                     UnhashableKeyWarning, 2)
                 try:
                     # Prevent exception chaining.
-                    value = func(*args, **kwargs)
+                    value = _call_with_shared_cache(func, args, kwargs,
+                                                    shared_ttl, per_token)
                 except Exception as exc:
                     raise exc from None
             else:
@@ -123,7 +250,8 @@ def memoized(func=None, max_size=None):
                         value = cache[key] = cache.pop(key)
                     except KeyError:
                         try:
-                            value = cache[key] = func(*args, **kwargs)
+                            value = cache[key] = _call_with_shared_cache(
+                                func, args, kwargs, shared_ttl, per_token)
                         except Exception as exc:
                             # Prevent exception chaining to avoid confusing
                             # error messages that have nothing to do with the
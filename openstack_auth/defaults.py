@@ -66,6 +66,14 @@ DEFAULT_SERVICE_REGIONS = {}
 
 SECURE_PROXY_ADDR_HEADER = False
 
+# PROJECT_LIST_CACHE_BACKEND is the alias of a Django cache where the list of
+# the projects a user may access is kept per unscoped token, so that the
+# project switcher does not list the projects from keystone on every page.
+# None disables the cache. Entries expire after PROJECT_LIST_CACHE_TIMEOUT
+# seconds and are removed when the user switches projects or logs out.
+PROJECT_LIST_CACHE_BACKEND = None
+PROJECT_LIST_CACHE_TIMEOUT = 300
+
 # Password will have an expiration date when using keystone v3 and enabling
 # the feature.
 # This setting allows you to set the number of days that the user will be
@@ -15,9 +15,11 @@
 
 import logging
 import os.path
+import time
 
 from django.conf import settings
 from oslo_config import cfg
+from oslo_policy import _checks
 from oslo_policy import opts as policy_opts
 from oslo_policy import policy
 import yaml
@@ -29,6 +31,15 @@ LOG = logging.getLogger(__name__)
 
 _ENFORCER = None
 _BASE_PATH = settings.POLICY_FILES_PATH
+# Compiled rules per service. Each value is a tuple of the rules object the
+# entry was compiled from, the time the policy files were last checked for
+# changes, a dict of compiled actions and a dict of memoized decisions of
+# target independent actions keyed by (action, credentials).
+_COMPILED = {}
+# Upper bound of the memoized decisions per service.
+_MAX_DECISIONS = 10000
+# Interval in seconds to check the policy files for changes.
+_RULES_CHECK_INTERVAL = 10
 
 
 def _get_policy_conf(policy_file, policy_dirs=None):
@@ -151,6 +162,7 @@ def _get_enforcer():
 def reset():
     global _ENFORCER
     _ENFORCER = None
+    _COMPILED.clear()
 
 
 def check(actions, request, target=None):
@@ -191,9 +203,44 @@ def check(actions, request, target=None):
                       {'project_id': object.project_id}
     :returns: boolean if the user has permission or not for the actions.
     """
-    if target is None:
-        target = {}
     user = auth_utils.get_user(request)
+    credentials = _user_to_credentials(user)
+    domain_credentials = _domain_to_credentials(request, user)
+    enforcer = _get_enforcer()
+
+    # The target is only needed when a rule has to be evaluated, so build
+    # it lazily and at most once.
+    full_target = []
+
+    def get_target():
+        if not full_target:
+            full_target.append(_build_target(user, target))
+        return full_target[0]
+
+    for action in actions:
+        scope, action = action[0], action[1]
+        if scope in enforcer:
+            # this is for handling the v3 policy file and will only be
+            # needed when a domain scoped token is present
+            if scope == 'identity' and domain_credentials:
+                # use domain credentials
+                if not _check_compiled(scope, enforcer[scope], action,
+                                       get_target, domain_credentials):
+                    return False
+
+            # use project credentials
+            if not _check_compiled(scope, enforcer[scope], action,
+                                   get_target, credentials):
+                return False
+
+        # if no policy for scope, allow action, underlying API will
+        # ultimately block the action if not permitted, treat as though
+        # allowed
+    return True
+
+
+def _build_target(user, target=None):
+    target = dict(target) if target else {}
 
     # Several service policy engines default to a project id check for
     # ownership. Since the user is already scoped to a project, if a
@@ -233,34 +280,149 @@ def check(actions, request, target=None):
     for key in domain_id_keys:
         if target.get(key) is None:
             target[key] = user.user_domain_id
+    return target
 
-    credentials = _user_to_credentials(user)
-    domain_credentials = _domain_to_credentials(request, user)
 
-    enforcer = _get_enforcer()
+class _NotCompilable(Exception):
+    """Raised for check types the compiled evaluation does not know."""
 
-    for action in actions:
-        scope, action = action[0], action[1]
-        if scope in enforcer:
-            # this is for handling the v3 policy file and will only be
-            # needed when a domain scoped token is present
-            if scope == 'identity' and domain_credentials:
-                # use domain credentials
-                if not _check_credentials(enforcer[scope],
-                                          action,
-                                          target,
-                                          domain_credentials):
-                    return False
 
-            # use project credentials
-            if not _check_credentials(enforcer[scope],
-                                      action, target, credentials):
-                return False
+# Check types whose result only depends on the target and credentials, and
+# which can be called directly.
+_LEAF_CHECKS = (_checks.RoleCheck, _checks.GenericCheck)
 
-        # if no policy for scope, allow action, underlying API will
-        # ultimately block the action if not permitted, treat as though
-        # allowed
-    return True
+
+def _is_check_target_independent(check, rules, seen):
+    """Return whether the result of check depends on credentials only.
+
+    :raises _NotCompilable: for unknown check types, e.g. ``http:`` checks
+        or checks registered by plugins.
+    """
+    if isinstance(check, (_checks.TrueCheck, _checks.FalseCheck)):
+        return True
+    if isinstance(check, (_checks.AndCheck, _checks.OrCheck)):
+        # Evaluate all the sub rules to detect uncompilable ones.
+        return all([_is_check_target_independent(rule, rules, seen)
+                    for rule in check.rules])
+    if isinstance(check, _checks.NotCheck):
+        return _is_check_target_independent(check.rule, rules, seen)
+    if isinstance(check, _checks.RuleCheck):
+        if check.match in seen:
+            return True
+        seen.add(check.match)
+        try:
+            rule = rules[check.match]
+        except KeyError:
+            # A missing rule always fails.
+            return True
+        return _is_check_target_independent(rule, rules, seen)
+    if type(check) in _LEAF_CHECKS:
+        # The match is interpolated with the target.
+        return '%' not in check.match
+    raise _NotCompilable()
+
+
+def _compile_action(action, rules):
+    """Resolve the check tree of an action.
+
+    This mirrors _check_credentials(): an action without a rule falls back
+    to the default rule, and is allowed if there is no default rule either.
+
+    :returns: a tuple of the check and whether it is target independent,
+        or None if the check cannot be evaluated by _evaluate().
+    """
+    if action in rules:
+        check = rules[action]
+    elif 'default' in rules:
+        check = rules['default']
+    else:
+        check = _checks.TrueCheck()
+    try:
+        return check, _is_check_target_independent(check, rules, {action})
+    except _NotCompilable:
+        return None
+
+
+def _evaluate(check, target, credentials, enforcer_scope):
+    """Evaluate a compiled check tree.
+
+    This is equivalent to oslo.policy evaluating the tree in enforce(), but
+    avoids reloading the rules and inspecting the signature of every check
+    on each call.
+    """
+    if isinstance(check, _checks.TrueCheck):
+        return True
+    if isinstance(check, _checks.FalseCheck):
+        return False
+    if isinstance(check, _checks.AndCheck):
+        return all(_evaluate(rule, target, credentials, enforcer_scope)
+                   for rule in check.rules)
+    if isinstance(check, _checks.OrCheck):
+        return any(_evaluate(rule, target, credentials, enforcer_scope)
+                   for rule in check.rules)
+    if isinstance(check, _checks.NotCheck):
+        return not _evaluate(check.rule, target, credentials, enforcer_scope)
+    if isinstance(check, _checks.RuleCheck):
+        try:
+            rule = enforcer_scope.rules[check.match]
+        except KeyError:
+            return False
+        return _evaluate(rule, target, credentials, enforcer_scope)
+    return check(target, credentials, enforcer_scope)
+
+
+def _credentials_key(credentials):
+    return tuple(sorted(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in credentials.items()))
+
+
+def _get_compiled(scope, enforcer_scope):
+    compiled = _COMPILED.get(scope)
+    now = time.monotonic()
+    if compiled is not None and now - compiled[1] > _RULES_CHECK_INTERVAL:
+        # Pick up changes of the policy files like enforce() does.
+        enforcer_scope.load_rules()
+        compiled = _COMPILED[scope] = (compiled[0], now) + compiled[2:]
+    if compiled is None or compiled[0] is not enforcer_scope.rules:
+        compiled = (enforcer_scope.rules, now, {}, {})
+        _COMPILED[scope] = compiled
+    return compiled
+
+
+def _check_compiled(scope, enforcer_scope, action, get_target, credentials):
+    """Check an action using the compiled rules of the service.
+
+    The check tree of each action is resolved once per loaded rules and
+    evaluated directly. Decisions of target independent rules (e.g. pure
+    role checks) are memoized per set of credentials, so for the same user
+    and project they are evaluated only once; target dependent rules (e.g.
+    ``project_id:%(project_id)s``) are evaluated on each call. Rules using
+    unknown check types are passed to oslo.policy.
+    """
+    rules, _loaded, actions, decisions = _get_compiled(scope, enforcer_scope)
+
+    try:
+        compiled = actions[action]
+    except KeyError:
+        compiled = actions[action] = _compile_action(action, rules)
+    if compiled is None:
+        return _check_credentials(enforcer_scope, action, get_target(),
+                                  credentials)
+    check, independent = compiled
+    if not independent:
+        return _evaluate(check, get_target(), credentials, enforcer_scope)
+
+    key = (action, _credentials_key(credentials))
+    try:
+        return decisions[key]
+    except KeyError:
+        pass
+    allowed = _evaluate(check, get_target(), credentials, enforcer_scope)
+    if len(decisions) >= _MAX_DECISIONS:
+        decisions.clear()
+    decisions[key] = allowed
+    return allowed
 
 
 def _check_credentials(enforcer_scope, action, target, credentials):
@@ -16,6 +16,7 @@ import uuid
 
 from django.conf import settings
 from django.contrib import auth
+from django.core.cache import cache
 from django import shortcuts
 from django import test
 from django.test.utils import override_settings
@@ -1154,6 +1155,45 @@ class OpenStackAuthTests(test.TestCase):
 
         mock_project_list.assert_called_once()
 
+    @override_settings(PROJECT_LIST_CACHE_BACKEND='default')
+    @mock.patch.object(projects.ProjectManager, 'list')
+    def test_cached_project_list(self, mock_project_list):
+        self.addCleanup(cache.clear)
+        user = self.data.user
+        token = self.data.unscoped_access_info.auth_token
+        mock_project_list.return_value = [self.data.project_two,
+                                          self.data.project_one]
+
+        def get_projects():
+            return utils.get_cached_project_list(
+                user_id=user.id,
+                auth_url=settings.OPENSTACK_KEYSTONE_URL,
+                token=token)
+
+        project_list = get_projects()
+        cached_list = get_projects()
+
+        self.assertEqual([p.to_dict() for p in project_list],
+                         [p.to_dict() for p in cached_list])
+        self.assertEqual(self.data.project_one.name, cached_list[0].name)
+        mock_project_list.assert_called_once()
+
+        utils.clear_cached_project_list(token)
+        get_projects()
+        self.assertEqual(2, mock_project_list.call_count)
+
+    @mock.patch.object(projects.ProjectManager, 'list')
+    def test_cached_project_list_disabled(self, mock_project_list):
+        mock_project_list.return_value = [self.data.project_one]
+
+        for _ in range(2):
+            utils.get_cached_project_list(
+                user_id=self.data.user.id,
+                auth_url=settings.OPENSTACK_KEYSTONE_URL,
+                token=self.data.unscoped_access_info.auth_token)
+
+        self.assertEqual(2, mock_project_list.call_count)
+
     @mock.patch.object(v3_auth.Token, 'get_access')
     @mock.patch.object(password.PasswordPlugin, 'list_projects')
     @mock.patch.object(v3_auth.Password, 'get_access')
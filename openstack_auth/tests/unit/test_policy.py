@@ -96,6 +96,75 @@ class PolicyTestCaseNonAdmin(PolicyTestCase):
         self.assertTrue(value)
 
 
+class PolicyCompiledTestCase(PolicyTestCase):
+    _roles = [{'id': '1', 'name': 'member'}]
+
+    def test_role_based_decision_memoized(self):
+        policy.reset()
+        self.assertFalse(policy.check(
+            (("compute", "context_is_admin"),), self.request))
+        with mock.patch.object(policy, '_evaluate') as evaluate:
+            for _i in range(3):
+                self.assertFalse(policy.check(
+                    (("compute", "context_is_admin"),), self.request))
+        evaluate.assert_not_called()
+
+    def test_target_dependent_decision_not_memoized(self):
+        policy.reset()
+        self.assertTrue(policy.check(
+            (("compute", "compute:reboot"),), self.request,
+            target={'project_id': None}))
+        self.assertFalse(policy.check(
+            (("compute", "compute:reboot"),), self.request,
+            target={'project_id': 'other'}))
+        self.assertEqual({}, policy._COMPILED['compute'][3])
+
+    def test_target_not_modified(self):
+        policy.reset()
+        target = {'project_id': 'other'}
+        policy.check((("compute", "compute:reboot"),), self.request,
+                     target=target)
+        self.assertEqual({'project_id': 'other'}, target)
+
+    def test_compile_action(self):
+        policy.reset()
+        enforcer = policy._get_enforcer()
+        compute_rules = enforcer['compute'].rules
+        identity_rules = enforcer['identity'].rules
+        self.assertTrue(policy._compile_action(
+            'context_is_admin', compute_rules)[1])
+        self.assertTrue(policy._compile_action(
+            'compute:create', compute_rules)[1])
+        self.assertFalse(policy._compile_action(
+            'compute:reboot', compute_rules)[1])
+        # Missing actions are checked against the default rule.
+        self.assertFalse(policy._compile_action(
+            'i_dont_exist', compute_rules)[1])
+        self.assertTrue(policy._compile_action(
+            'i_dont_exist', identity_rules)[1])
+        self.assertFalse(policy._compile_action(
+            'admin_or_owner', identity_rules)[1])
+
+    def test_unknown_check_uses_enforcer(self):
+        policy.reset()
+        enforcer = policy._get_enforcer()
+        rules = enforcer['compute'].rules
+        with mock.patch.dict(rules, {'compute:custom': mock.Mock()}):
+            self.assertIsNone(policy._compile_action('compute:custom', rules))
+            with mock.patch.object(policy, '_check_credentials',
+                                   return_value=True) as check:
+                self.assertTrue(policy.check(
+                    (("compute", "compute:custom"),), self.request))
+            check.assert_called_once()
+
+    def test_memoized_decisions_cleared_on_reset(self):
+        policy.reset()
+        policy.check((("compute", "context_is_admin"),), self.request)
+        self.assertIn('compute', policy._COMPILED)
+        policy.reset()
+        self.assertEqual({}, policy._COMPILED)
+
+
 @test.override_settings(
     POLICY_FILES={
         'no_default': 'no_default_policy.json',
@@ -37,3 +37,20 @@ class PermTestCase(test.TestCase):
             # perm1 AND (perm2 OR perm3)
             perm_list = ['perm1', ('perm2', 'perm3')]
             self.assertTrue(testuser.has_perms(perm_list))
+
+
+class ServiceCatalogTestCase(test.TestCase):
+    def test_service_catalog_index(self):
+        catalog = [{'type': 'compute',
+                    'endpoints': [{'region_id': 'RegionOne',
+                                   'interface': 'public',
+                                   'url': 'http://nova.example.com'}]}]
+        testuser = user.User(id=1, service_catalog=catalog)
+
+        index = testuser.service_catalog_index
+        self.assertIs(index, testuser.service_catalog_index)
+        self.assertEqual(['RegionOne'], testuser.available_services_regions)
+
+        testuser.service_catalog = []
+        self.assertIsNot(index, testuser.service_catalog_index)
+        self.assertEqual([], testuser.available_services_regions)
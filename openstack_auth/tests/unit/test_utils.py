@@ -82,6 +82,67 @@ class UtilsTestCase(test.TestCase):
         self.assertEqual("RegionOne", default_region)
 
 
+class ServiceCatalogIndexTestCase(test.TestCase):
+
+    CATALOG = [
+        {'type': 'compute',
+         'endpoints': [
+             {'region_id': 'RegionOne', 'interface': 'public',
+              'url': 'http://nova1.example.com'},
+             {'region_id': 'RegionOne', 'interface': 'public',
+              'url': 'http://nova1-other.example.com'},
+             {'region_id': 'RegionTwo', 'interface': 'internal',
+              'url': 'http://nova2.example.com'},
+         ]},
+        {'type': 'compute',
+         'endpoints': [
+             {'region_id': 'RegionThree', 'interface': 'public',
+              'url': 'http://nova3.example.com'},
+         ]},
+        {'type': 'identity',
+         'endpoints': [
+             {'region_id': 'RegionOne', 'interface': 'public',
+              'url': 'http://keystone.example.com'},
+             {'region_id': 'RegionIdentity', 'interface': 'admin',
+              'url': 'http://keystone-admin.example.com'},
+         ]},
+        {'name': 'no type', 'endpoints': [{'region_id': 'RegionFour'}]},
+    ]
+
+    def test_get_url(self):
+        index = utils.ServiceCatalogIndex(self.CATALOG)
+        self.assertEqual('http://nova1.example.com',
+                         index.get_url('compute', 'RegionOne', 'public'))
+        self.assertEqual('http://nova2.example.com',
+                         index.get_url('compute', 'RegionTwo', 'internal'))
+        self.assertIsNone(index.get_url('compute', 'RegionTwo', 'public'))
+        # Only the first service of a type is used.
+        self.assertIsNone(index.get_url('compute', 'RegionThree', 'public'))
+        self.assertIsNone(index.get_url('image', 'RegionOne', 'public'))
+
+    def test_get_url_identity(self):
+        index = utils.ServiceCatalogIndex(self.CATALOG)
+        self.assertEqual('http://keystone.example.com',
+                         index.get_url('identity', 'RegionOne', 'public'))
+        self.assertIsNone(index.get_url('identity', 'RegionOne', 'admin'))
+        # The identity endpoints are global when none is in the region.
+        self.assertEqual('http://keystone-admin.example.com',
+                         index.get_url('identity', 'RegionTwo', 'admin'))
+
+    def test_is_service_enabled(self):
+        index = utils.ServiceCatalogIndex(self.CATALOG)
+        self.assertTrue(index.is_service_enabled('compute', 'RegionTwo'))
+        self.assertFalse(index.is_service_enabled('compute', 'RegionThree'))
+        self.assertTrue(index.is_service_enabled('identity', 'RegionTwo'))
+        self.assertFalse(index.is_service_enabled('image', 'RegionOne'))
+
+    def test_regions(self):
+        index = utils.ServiceCatalogIndex(self.CATALOG)
+        self.assertEqual(['RegionOne', 'RegionTwo', 'RegionThree'],
+                         index.regions)
+        self.assertEqual([], utils.ServiceCatalogIndex(None).regions)
+
+
 class BehindProxyTestCase(test.TestCase):
 
     def setUp(self):
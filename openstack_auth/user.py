@@ -223,7 +223,8 @@ class User(models.AbstractBaseUser, models.AnonymousUser):
         self.project_id = project_id or tenant_id
         self.project_name = project_name or tenant_name
         self.system_scoped = system_scoped
-        self.service_catalog = service_catalog
+        self._service_catalog = service_catalog
+        self._service_catalog_index = None
         self._services_region = (
             services_region or
             utils.default_services_region(service_catalog)
@@ -301,11 +302,15 @@ class User(models.AbstractBaseUser, models.AnonymousUser):
 
     @property
     def authorized_tenants(self):
-        """Returns a memoized list of tenants this user may access."""
+        """Returns a memoized list of tenants this user may access.
+
+        The list is also kept in ``PROJECT_LIST_CACHE_BACKEND`` when it is
+        set, since users are created again from the session on each request.
+        """
         if self.is_authenticated and self._authorized_tenants is None:
             endpoint = self.endpoint
             try:
-                self._authorized_tenants = utils.get_project_list(
+                self._authorized_tenants = utils.get_cached_project_list(
                     user_id=self.id,
                     auth_url=endpoint,
                     token=self.unscoped_token,
@@ -319,6 +324,23 @@ class User(models.AbstractBaseUser, models.AnonymousUser):
     def authorized_tenants(self, tenant_list):
         self._authorized_tenants = tenant_list
 
+    @property
+    def service_catalog(self):
+        return self._service_catalog
+
+    @service_catalog.setter
+    def service_catalog(self, service_catalog):
+        self._service_catalog = service_catalog
+        self._service_catalog_index = None
+
+    @property
+    def service_catalog_index(self):
+        """Returns the index of the service catalog of the user."""
+        if self._service_catalog_index is None:
+            self._service_catalog_index = utils.ServiceCatalogIndex(
+                self._service_catalog)
+        return self._service_catalog_index
+
     @property
     def services_region(self):
         return self._services_region
@@ -330,17 +352,7 @@ class User(models.AbstractBaseUser, models.AnonymousUser):
     @property
     def available_services_regions(self):
         """Returns list of unique region name values in service catalog."""
-        regions = []
-        if self.service_catalog:
-            for service in self.service_catalog:
-                service_type = service.get('type')
-                if service_type is None or service_type == 'identity':
-                    continue
-                for endpoint in service.get('endpoints', []):
-                    region = utils.get_endpoint_region(endpoint)
-                    if region not in regions:
-                        regions.append(region)
-        return regions
+        return list(self.service_catalog_index.regions)
 
     @property
     def is_system_user(self):
@@ -12,6 +12,7 @@
 # limitations under the License.
 
 import datetime
+import hashlib
 import logging
 import re
 from urllib import parse
@@ -19,12 +20,14 @@ from urllib import parse
 from django.conf import settings
 from django.contrib import auth
 from django.contrib.auth import models
+from django.core.cache import caches
 from django.utils import timezone
 from keystoneauth1 import exceptions as keystone_exceptions
 from keystoneauth1.identity import v3 as v3_auth
 from keystoneauth1 import session
 from keystoneauth1 import token_endpoint
 from keystoneclient.v3 import client as client_v3
+from keystoneclient.v3 import projects as v3_projects
 
 from openstack_auth import defaults
 
@@ -336,6 +339,66 @@ def get_project_list(*args, **kwargs):
     return projects
 
 
+def _get_project_list_cache():
+    backend = settings.PROJECT_LIST_CACHE_BACKEND
+    if not backend or not settings.PROJECT_LIST_CACHE_TIMEOUT:
+        return None
+    return caches[backend]
+
+
+def _get_project_list_cache_key(token):
+    # The token is hashed to keep it out of the cache backend.
+    token_hash = hashlib.sha256(token.encode('utf-8')).hexdigest()
+    return 'openstack_auth.projects:%s' % token_hash
+
+
+def get_cached_project_list(*args, **kwargs):
+    """Returns the project list of a token, shared between requests.
+
+    The projects are looked up in ``PROJECT_LIST_CACHE_BACKEND`` by the hash
+    of the token and only retrieved with :func:`get_project_list` when they
+    are not found there. The arguments are those of
+    :func:`get_project_list`.
+    """
+    cache = _get_project_list_cache()
+    token = kwargs['token']
+    if cache is None or not token:
+        return get_project_list(*args, **kwargs)
+    cache_key = _get_project_list_cache_key(token)
+    try:
+        cached = cache.get(cache_key)
+    except Exception:
+        LOG.warning("Failed to load the project list from the cache.",
+                    exc_info=True)
+        cached = None
+    if cached is not None:
+        return [v3_projects.Project(None, info, loaded=True)
+                for info in cached]
+
+    projects = get_project_list(*args, **kwargs)
+    try:
+        # Project objects refer to their manager and its client, so only
+        # their attributes are stored.
+        cache.set(cache_key, [project.to_dict() for project in projects],
+                  settings.PROJECT_LIST_CACHE_TIMEOUT)
+    except Exception:
+        LOG.warning("Failed to save the project list to the cache.",
+                    exc_info=True)
+    return projects
+
+
+def clear_cached_project_list(token):
+    """Removes the project list of a token from the cache."""
+    cache = _get_project_list_cache()
+    if cache is None or not token:
+        return
+    try:
+        cache.delete(_get_project_list_cache_key(token))
+    except Exception:
+        LOG.warning("Failed to remove the project list from the cache.",
+                    exc_info=True)
+
+
 def get_system_access(user_id, auth_url, token, is_federated):
     session = get_session()
     auth_url, _ = fix_auth_url_version_prefix(auth_url)
@@ -427,6 +490,82 @@ def get_endpoint_region(endpoint):
     return endpoint.get('region_id') or endpoint.get('region')
 
 
+class ServiceCatalogIndex(object):
+    """Index of the endpoints of a service catalog.
+
+    It is compiled once from the catalog of a user and gives the URL of an
+    endpoint of a service by its type, region and interface without going
+    through the catalog.
+
+    .. attribute:: services
+
+        The first service of the catalog of each service type.
+
+    .. attribute:: regions
+
+        The unique regions of the endpoints of the services other than
+        identity, in the order of the catalog.
+    """
+
+    def __init__(self, service_catalog):
+        self.services = {}
+        # {(service type, region, interface): url}
+        self._urls = {}
+        # {(service type, interface): url} whatever their region.
+        self._any_region_urls = {}
+        # {service type: regions}
+        self._service_regions = {}
+        regions = {}
+        for service in service_catalog or []:
+            service_type = service.get('type')
+            if service_type is None:
+                continue
+            if service_type not in self.services:
+                self.services[service_type] = service
+                self._index_service(service)
+            if service_type == 'identity':
+                continue
+            for endpoint in service.get('endpoints', []):
+                regions.setdefault(get_endpoint_region(endpoint), None)
+        self.regions = list(regions)
+
+    def _index_service(self, service):
+        service_type = service['type']
+        service_regions = self._service_regions[service_type] = set()
+        for endpoint in service.get('endpoints', []):
+            region = get_endpoint_region(endpoint)
+            service_regions.add(region)
+            interface = endpoint.get('interface')
+            url = endpoint.get('url')
+            if interface is None or url is None:
+                continue
+            self._urls.setdefault((service_type, region, interface), url)
+            self._any_region_urls.setdefault((service_type, interface), url)
+
+    def get_url(self, service_type, region, interface):
+        """Returns the URL of an endpoint of a service, or None.
+
+        The endpoints of identity are assumed to be global if none of them
+        is in ``region``.
+        """
+        if service_type not in self.services:
+            return None
+        if (service_type == 'identity' and
+                region not in self._service_regions[service_type]):
+            return self._any_region_urls.get((service_type, interface))
+        return self._urls.get((service_type, region, interface))
+
+    def is_service_enabled(self, service_type, region):
+        """Whether a service has endpoints in ``region``.
+
+        The endpoints of identity are enabled in all the regions.
+        """
+        service_regions = self._service_regions.get(service_type)
+        if not service_regions:
+            return False
+        return service_type == 'identity' or region in service_regions
+
+
 def using_cookie_backed_sessions():
     engine = settings.SESSION_ENGINE
     return "signed_cookies" in engine
@@ -286,6 +286,8 @@ def logout(request, login_url=None, **kwargs):
     msg = 'Logging out user "%(username)s".' % \
         {'username': request.user.username}
     LOG.info(msg)
+    utils.clear_cached_project_list(
+        getattr(request.user, 'unscoped_token', None))
 
     """ Securely logs a user out. """
     if (settings.WEBSSO_ENABLED and settings.WEBSSO_DEFAULT_REDIRECT and
@@ -341,6 +343,9 @@ class ProjectSwitchView(View):
             messages.error(request, msg)
             auth_ref = None
             LOG.exception('An error occurred while switching sessions.')
+        # Projects may have been added or removed since the list was cached,
+        # switching is the time to look at it again.
+        utils.clear_cached_project_list(unscoped_token)
 
         # Ensure the user-originating redirection url is safe.
         # Taken from django.contrib.auth.views.login()
@@ -20,6 +20,7 @@ import importlib
 
 from django.conf import settings
 from glanceclient import exc as glance_exceptions
+from keystoneauth1 import identity
 from keystoneauth1 import session
 from keystoneauth1 import token_endpoint
 from novaclient import api_versions
@@ -140,10 +141,18 @@ class Server(base.APIResourceWrapper):
         return getattr(self, 'OS-EXT-SRV-ATTR:user_data', "")
 
 
+def get_server_version_range(request):
+    """Returns the minimum and maximum microversions supported by nova."""
+    def fetch():
+        return api_versions._get_server_version_range(novaclient(request))
+
+    return microversions.get_version_range(
+        'compute', base.url_for(request, 'compute'), fetch)
+
+
 @memoized.memoized
 def get_microversion(request, features):
-    client = novaclient(request)
-    min_ver, max_ver = api_versions._get_server_version_range(client)
+    min_ver, max_ver = get_server_version_range(request)
     return (microversions.get_microversion_for_features(
         'nova', features, api_versions.APIVersion, min_ver, max_ver))
 
@@ -166,7 +175,7 @@ def get_auth_params_from_request(request):
 @memoized.memoized
 def cached_novaclient(request, version=None):
     (
-        username,
+        _username,
         token_id,
         project_id,
         project_domain_id,
@@ -175,16 +184,17 @@ def cached_novaclient(request, version=None):
     ) = get_auth_params_from_request(request)
     if version is None:
         version = VERSIONS.get_active_version()['version']
+    token_auth = identity.Token(auth_url=auth_url,
+                                token=token_id,
+                                project_id=project_id,
+                                project_domain_id=project_domain_id)
+    k_session = session.Session(auth=token_auth,
+                                verify=(CACERT or not INSECURE),
+                                user_agent='python-novaclient',
+                                session=base.get_http_session(nova_url))
     c = nova_client.Client(version,
-                           username,
-                           token_id,
-                           project_id=project_id,
-                           project_domain_id=project_domain_id,
-                           auth_url=auth_url,
-                           insecure=INSECURE,
-                           cacert=CACERT,
+                           session=k_session,
                            http_log_debug=settings.DEBUG,
-                           auth_token=token_id,
                            endpoint_override=nova_url)
     return c
 
@@ -231,6 +241,7 @@ def computeclient(request, microversion=None):
         auth=token_auth,
         original_ip=auth_utils.get_client_ip(request),
         verify=verify,
+        session=base.get_http_session(nova_url),
     )
     conn = openstack.connection.Connection(
         session=k_session,
@@ -18,11 +18,18 @@
 
 import collections.abc
 import functools
+import http.cookiejar
+import os
+import threading
+from urllib import parse
 
 from django.conf import settings
+from keystoneauth1 import session as ks_session
+import requests
 import semantic_version
 
 from horizon import exceptions
+from openstack_auth import utils as auth_utils
 
 
 __all__ = ('APIResourceWrapper', 'APIDictWrapper',
@@ -329,40 +336,35 @@ def get_url_for_service(service, region, endpoint_type):
             pass
 
 
+def _get_catalog_index(request):
+    index = getattr(request.user, 'service_catalog_index', None)
+    if not isinstance(index, auth_utils.ServiceCatalogIndex):
+        # The user does not come from openstack_auth.
+        index = auth_utils.ServiceCatalogIndex(request.user.service_catalog)
+    return index
+
+
 def url_for(request, service_type, endpoint_type=None, region=None):
     endpoint_type = endpoint_type or settings.OPENSTACK_ENDPOINT_TYPE
     fallback_endpoint_type = settings.SECONDARY_ENDPOINT_TYPE
 
-    catalog = request.user.service_catalog
-    service = get_service_from_catalog(catalog, service_type)
-    if service:
-        if not region:
-            region = request.user.services_region
-        url = get_url_for_service(service,
-                                  region,
-                                  endpoint_type)
-        if not url and fallback_endpoint_type:
-            url = get_url_for_service(service,
-                                      region,
-                                      fallback_endpoint_type)
-        if url:
-            return url
+    index = _get_catalog_index(request)
+    if not region:
+        region = request.user.services_region
+    url = index.get_url(service_type, region,
+                        ENDPOINT_TYPE_TO_INTERFACE.get(endpoint_type, ''))
+    if not url and fallback_endpoint_type:
+        url = index.get_url(
+            service_type, region,
+            ENDPOINT_TYPE_TO_INTERFACE.get(fallback_endpoint_type, ''))
+    if url:
+        return url
     raise exceptions.ServiceCatalogException(service_type)
 
 
 def is_service_enabled(request, service_type):
-    service = get_service_from_catalog(request.user.service_catalog,
-                                       service_type)
-    if service:
-        region = request.user.services_region
-        for endpoint in service.get('endpoints', []):
-            if 'type' not in service:
-                continue
-            # ignore region for identity
-            if service['type'] == 'identity' or \
-               _get_endpoint_region(endpoint) == region:
-                return True
-    return False
+    return _get_catalog_index(request).is_service_enabled(
+        service_type, request.user.services_region)
 
 
 def _get_endpoint_region(endpoint):
@@ -375,3 +377,42 @@ def _get_endpoint_region(endpoint):
     both Keystone V2 and V3.
     """
     return endpoint.get('region_id') or endpoint.get('region')
+
+
+_HTTP_SESSIONS = {}
+_HTTP_SESSIONS_LOCK = threading.Lock()
+
+
+def get_http_session(url):
+    """Returns the HTTP session shared by the process for an endpoint.
+
+    The session keeps up to ``OPENSTACK_HTTP_POOL_MAXSIZE`` connections to
+    the host of ``url`` open between the requests of the dashboard, so that
+    API calls do not open new TCP and TLS connections. It does not store
+    cookies since it is shared by all the users. The authentication of each
+    call is provided by the keystoneauth session wrapping it.
+
+    :returns: a ``requests.Session`` for the scheme, host and port of
+        ``url``, or None if ``OPENSTACK_HTTP_POOL_MAXSIZE`` is 0.
+    """
+    maxsize = settings.OPENSTACK_HTTP_POOL_MAXSIZE
+    if not maxsize:
+        return None
+    parsed = parse.urlsplit(url)
+    # Connections cannot be shared with the processes forked after they
+    # were opened.
+    key = (os.getpid(), parsed.scheme, parsed.netloc)
+    http_session = _HTTP_SESSIONS.get(key)
+    if http_session is None:
+        with _HTTP_SESSIONS_LOCK:
+            http_session = _HTTP_SESSIONS.get(key)
+            if http_session is None:
+                http_session = requests.Session()
+                http_session.cookies.set_policy(
+                    http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+                adapter = ks_session.TCPKeepAliveAdapter(
+                    pool_maxsize=maxsize)
+                for scheme in list(http_session.adapters):
+                    http_session.mount(scheme, adapter)
+                _HTTP_SESSIONS[key] = http_session
+    return http_session
@@ -18,6 +18,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import functools
 import logging
 import math
 
@@ -29,6 +30,8 @@ from cinderclient import api_versions
 from cinderclient import client as cinder_client
 from cinderclient import exceptions as cinder_exception
 from cinderclient.v3.contrib import list_extensions as cinder_list_extensions
+from keystoneauth1 import session
+from keystoneauth1 import token_endpoint
 
 from horizon import exceptions
 from horizon.utils.memoized import memoized
@@ -235,18 +238,16 @@ def cinderclient(request, version=None):
     insecure = settings.OPENSTACK_SSL_NO_VERIFY
     cacert = settings.OPENSTACK_SSL_CACERT
 
+    token_auth = token_endpoint.Token(endpoint=cinder_url,
+                                      token=request.user.token.id)
+    k_session = session.Session(auth=token_auth,
+                                verify=(cacert or not insecure),
+                                session=base.get_http_session(cinder_url))
     c = cinder_client.Client(
         version,
-        request.user.username,
-        request.user.token.id,
-        project_id=request.user.tenant_id,
-        auth_url=base.url_for(request, 'identity'),
-        insecure=insecure,
-        cacert=cacert,
+        session=k_session,
         http_log_debug=settings.DEBUG,
     )
-    c.client.auth_token = request.user.token.id
-    c.client.management_url = cinder_url
     return c
 
 
@@ -259,8 +260,10 @@ def get_microversion(request, features):
     insecure = settings.OPENSTACK_SSL_NO_VERIFY
     cacert = settings.OPENSTACK_SSL_CACERT
 
-    min_ver, max_ver = cinder_client.get_server_version(cinder_url,
-                                                        insecure, cacert)
+    min_ver, max_ver = microversions.get_version_range(
+        'volume', cinder_url,
+        functools.partial(cinder_client.get_server_version, cinder_url,
+                          insecure, cacert))
     return microversions.get_microversion_for_features(
         'cinder', features, api_versions.APIVersion, min_ver, max_ver)
 
@@ -979,7 +982,7 @@ def list_extensions(request):
     return tuple(cinder_list_extensions.ListExtManager(cinder_api).show_all())
 
 
-@memoized
+@memoized(shared_ttl=600, per_token=False)
 def extension_supported(request, extension_name):
     """This method will determine if Cinder supports a given extension name."""
     for extension in list_extensions(request):
@@ -16,22 +16,26 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import _thread as thread
 import collections
 from collections import abc
 import itertools
 import json
 import logging
 import os
+import tempfile
+import threading
+import time
 
 from django.conf import settings
 from django.core.files.uploadedfile import InMemoryUploadedFile
-from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.files.uploadedfile import TemporaryUploadedFile
 from django.utils.translation import gettext_lazy as _
+import futurist
 
+from glanceclient.common import utils as glance_utils
 from glanceclient.v2 import client
-
+from keystoneauth1 import session
+from keystoneauth1 import token_endpoint
 
 from horizon import messages
 from horizon.utils.memoized import memoized
@@ -120,8 +124,14 @@ def glanceclient(request):
     insecure = settings.OPENSTACK_SSL_NO_VERIFY
     cacert = settings.OPENSTACK_SSL_CACERT
 
-    return api_version['client'].Client(url, token=request.user.token.id,
-                                        insecure=insecure, cacert=cacert)
+    # The version of the API is part of the paths of the calls.
+    endpoint = glance_utils.endpoint_version_from_url(url)[0]
+    token_auth = token_endpoint.Token(endpoint=endpoint,
+                                      token=request.user.token.id)
+    k_session = session.Session(auth=token_auth,
+                                verify=(cacert or not insecure),
+                                session=base.get_http_session(url))
+    return api_version['client'].Client(session=k_session)
 
 
 # Note: Glance is adding more than just public and private in Newton or later
@@ -383,6 +393,157 @@ class ExternallyUploadedImage(Image):
         return self._token_id
 
 
+class ImageUpload(object):
+    """The status of an upload of image data through horizon.
+
+    The upload is ``queued`` until an upload worker is free, ``uploading``
+    while the data is sent to glance, and ``done`` or ``failed`` once it
+    has returned.
+    """
+
+    def __init__(self, image_id, project_id, size=None):
+        self.image_id = image_id
+        self.project_id = project_id
+        self.size = size
+        self.uploaded = 0
+        self.status = 'queued'
+        self.error = None
+        self.finished_at = None
+
+    def to_dict(self):
+        return {
+            'image_id': self.image_id,
+            'status': self.status,
+            'size': self.size,
+            'uploaded': self.uploaded,
+            'error': self.error,
+        }
+
+
+class _UploadProgressFile(object):
+    """File-like wrapper counting the bytes of an upload read by glance."""
+
+    def __init__(self, file, upload):
+        self._file = file
+        self._upload = upload
+
+    def read(self, size=-1):
+        chunk = self._file.read(size)
+        self._upload.uploaded += len(chunk)
+        return chunk
+
+
+_UPLOAD_EXECUTOR = None
+_UPLOAD_EXECUTOR_PID = None
+_IMAGE_UPLOADS = {}
+_IMAGE_UPLOADS_LOCK = threading.Lock()
+
+
+def _get_upload_executor():
+    """Returns the pool of workers uploading image data to glance.
+
+    Its size is set by ``HORIZON_IMAGES_UPLOAD_MAX_WORKERS``, further uploads
+    wait in its queue. Like the executor of
+    :mod:`openstack_dashboard.utils.futurist_utils`, it is created again in
+    forked processes.
+    """
+    global _UPLOAD_EXECUTOR, _UPLOAD_EXECUTOR_PID
+    pid = os.getpid()
+    with _IMAGE_UPLOADS_LOCK:
+        if _UPLOAD_EXECUTOR is None or _UPLOAD_EXECUTOR_PID != pid:
+            _UPLOAD_EXECUTOR = futurist.ThreadPoolExecutor(
+                max_workers=settings.HORIZON_IMAGES_UPLOAD_MAX_WORKERS)
+            _UPLOAD_EXECUTOR_PID = pid
+            _IMAGE_UPLOADS.clear()
+    return _UPLOAD_EXECUTOR
+
+
+def _spool_uploaded_file(data):
+    """Copies an uploaded file to a temporary file, chunk by chunk."""
+    spooled = tempfile.NamedTemporaryFile(
+        prefix='horizon-image-', dir=settings.FILE_UPLOAD_TEMP_DIR,
+        delete=False)
+    try:
+        for chunk in data.chunks():
+            spooled.write(chunk)
+        spooled.seek(0)
+    except Exception:
+        spooled.close()
+        os.remove(spooled.name)
+        raise
+    return spooled
+
+
+def _remove_image_data(data):
+    try:
+        data.close()
+    except Exception:
+        pass
+    filename = getattr(getattr(data, 'file', data), 'name', None)
+    if not isinstance(filename, str):
+        return
+    try:
+        os.remove(filename)
+    except OSError as e:
+        LOG.warning('Failed to remove temporary image file '
+                    '%(file)s (%(e)s)',
+                    {'file': filename, 'e': e})
+
+
+def _upload_image_data(client, upload, data):
+    upload.status = 'uploading'
+    try:
+        client.images.upload(upload.image_id,
+                             _UploadProgressFile(data, upload))
+    except Exception as e:
+        upload.status = 'failed'
+        upload.error = str(e)
+        LOG.warning('Failed to upload the data of image %(image)s (%(e)s)',
+                    {'image': upload.image_id, 'e': e})
+    else:
+        upload.status = 'done'
+    finally:
+        upload.finished_at = time.monotonic()
+        _remove_image_data(data)
+
+
+def _purge_image_uploads():
+    expired = time.monotonic() - settings.HORIZON_IMAGES_UPLOAD_STATUS_TIMEOUT
+    for image_id, upload in list(_IMAGE_UPLOADS.items()):
+        if upload.finished_at is not None and upload.finished_at < expired:
+            del _IMAGE_UPLOADS[image_id]
+
+
+def _start_image_upload(request, image, data, size):
+    upload = ImageUpload(image.id, request.user.project_id, size=size)
+    executor = _get_upload_executor()
+    with _IMAGE_UPLOADS_LOCK:
+        _purge_image_uploads()
+        _IMAGE_UPLOADS[image.id] = upload
+    try:
+        executor.submit(_upload_image_data, glanceclient(request), upload,
+                        data)
+    except Exception:
+        with _IMAGE_UPLOADS_LOCK:
+            _IMAGE_UPLOADS.pop(image.id, None)
+        _remove_image_data(data)
+        raise
+    return upload
+
+
+def image_upload_get(request, image_id):
+    """Returns the status of an upload of image data through horizon.
+
+    Only the uploads started by the current process for the project of the
+    user are known, None is returned for the others.
+    """
+    with _IMAGE_UPLOADS_LOCK:
+        upload = _IMAGE_UPLOADS.get(image_id)
+    if upload is None or upload.project_id != request.user.project_id:
+        return None
+    return upload
+
+
 def create_image_metadata(data):
     """Generate metadata dict for a new image from a given form data."""
 
@@ -467,7 +628,8 @@ def image_create(request, **kwargs):
     asynchronously.
 
     In the case of 'data' the process of uploading the data may take
-    some time and is handed off to a separate thread.
+    some time and is handed off to the image upload workers, see
+    :func:`image_upload_get` for its status.
     """
     data = kwargs.pop('data', None)
     location = kwargs.pop('location', None)
@@ -482,32 +644,15 @@ def image_create(request, **kwargs):
             # special wrapper to bypass the web server in a subsequent upload
             return ExternallyUploadedImage(image, request)
 
+        size = getattr(data, 'size', None)
         if isinstance(data, TemporaryUploadedFile):
             # Hack to fool Django, so we can keep file open in the new thread.
             data.file._closer.close_called = True
         elif isinstance(data, InMemoryUploadedFile):
-            # Clone a new file for InMemeoryUploadedFile.
-            # Because the old one will be closed by Django.
-            data = SimpleUploadedFile(data.name,
-                                      data.read(),
-                                      data.content_type)
+            # The file will be closed by Django at the end of the request.
+            data = _spool_uploaded_file(data)
 
-        def upload():
-            try:
-                return glanceclient(request).images.upload(image.id, data)
-            finally:
-                try:
-                    filename = str(data.file.name)
-                except AttributeError:
-                    pass
-                else:
-                    try:
-                        os.remove(filename)
-                    except OSError as e:
-                        LOG.warning('Failed to remove temporary image file '
-                                    '%(file)s (%(e)s)',
-                                    {'file': filename, 'e': e})
-        thread.start_new_thread(upload, ())
+        _start_image_upload(request, image, data, size)
 
     return Image(image)
 
@@ -185,9 +185,11 @@ def keystoneclient(request, admin=False, force_scoped=None):
         remote_addr = auth_utils.get_client_ip(request)
         token_auth = token_endpoint.Token(endpoint=endpoint,
                                           token=token_id)
-        keystone_session = session.Session(auth=token_auth,
-                                           original_ip=remote_addr,
-                                           verify=verify)
+        keystone_session = session.Session(
+            auth=token_auth,
+            original_ip=remote_addr,
+            verify=verify,
+            session=base.get_http_session(endpoint))
         conn = client_version['client'].Client(session=keystone_session,
                                                debug=settings.DEBUG)
         setattr(request, cache_attr, conn)
@@ -13,9 +13,21 @@
 # under the License.
 
 import logging
+import threading
+import time
+
+from django.conf import settings
+
+from openstack_dashboard.utils import futurist_utils
 
 LOG = logging.getLogger(__name__)
 
+# The minimum and maximum microversions of the endpoints of the services,
+# keyed by service and endpoint URL, along with when they were retrieved.
+_VERSION_RANGES = {}
+_VERSION_RANGES_LOCK = threading.Lock()
+_VERSION_RANGES_REFRESHING = set()
+
 # A list of features and their supported microversions. Note that these are
 # explicit functioning versions, not a range.
 # There should be a minimum of two versions per feature. The first entry in
@@ -97,3 +109,57 @@ def get_microversion_for_features(service, features, wrapper_class,
         if microversion.matches(min_ver, max_ver):
             return microversion
     return None
+
+
+def _refresh_version_range(key, fetch):
+    try:
+        _VERSION_RANGES[key] = (fetch(), time.monotonic())
+    except Exception:
+        LOG.warning('Unable to refresh the microversions supported by '
+                    '%s at %s.', *key, exc_info=True)
+        # Keep using the previous ones and only try again once the timeout
+        # expires again, instead of on every request in the meantime.
+        _VERSION_RANGES[key] = (_VERSION_RANGES[key][0], time.monotonic())
+    finally:
+        with _VERSION_RANGES_LOCK:
+            _VERSION_RANGES_REFRESHING.discard(key)
+
+
+def get_version_range(service, url, fetch):
+    """Returns the minimum and maximum microversions of a service endpoint.
+
+    ``fetch`` is called without arguments to retrieve them from the endpoint
+    ``url``. They are then shared by all the requests of the process for
+    ``OPENSTACK_API_VERSION_CACHE_TIMEOUT`` seconds. Once expired, they are
+    still returned while being retrieved again in the background. If that
+    fails, they are still returned until the timeout expires again.
+    """
+    timeout = settings.OPENSTACK_API_VERSION_CACHE_TIMEOUT
+    if not timeout:
+        return fetch()
+
+    key = (service, url)
+    entry = _VERSION_RANGES.get(key)
+    if entry is None:
+        version_range = fetch()
+        _VERSION_RANGES[key] = (version_range, time.monotonic())
+        return version_range
+
+    version_range, fetched_at = entry
+    if time.monotonic() - fetched_at >= timeout:
+        with _VERSION_RANGES_LOCK:
+            refresh = key not in _VERSION_RANGES_REFRESHING
+            _VERSION_RANGES_REFRESHING.add(key)
+        if refresh:
+            if settings.PARALLEL_EXECUTOR_MAX_WORKERS > 0:
+                futurist_utils.get_executor().submit(
+                    _refresh_version_range, key, fetch)
+            else:
+                _refresh_version_range(key, fetch)
+                version_range = _VERSION_RANGES[key][0]
+    return version_range
+
+
+def clear_version_ranges():
+    """Forgets the microversions retrieved from the service endpoints."""
+    _VERSION_RANGES.clear()
@@ -22,11 +22,13 @@ from collections.abc import Sequence
 import copy
 import itertools
 import logging
+import time
 import types
 
 import netaddr
 
 from django.conf import settings
+from django.core.cache import cache
 from django.utils.translation import gettext_lazy as _
 from keystoneauth1 import exceptions as ks_exceptions
 from keystoneauth1 import session
@@ -832,12 +834,14 @@ class FloatingIpManager(object):
         update_dict = {'port_id': pid,
                        'fixed_ip_address': ip_address}
         self.net_client.update_ip(floating_ip_id, **update_dict)
+        invalidate_server_addresses(self.request)
 
     @profiler.trace
     def disassociate(self, floating_ip_id):
         """Disassociates the floating IP specified."""
         update_dict = {'port_id': None}
         self.net_client.update_ip(floating_ip_id, **update_dict)
+        invalidate_server_addresses(self.request)
 
     def _get_reachable_subnets(self, ports, fetch_router_ports=False):
         if not is_enabled_by_config('enable_fip_topology_check'):
@@ -988,6 +992,7 @@ def networkclient(request):
         auth=token_auth,
         original_ip=auth_utils.get_client_ip(request),
         verify=verify,
+        session=base.get_http_session(neutron_url),
         # TODO(lajoskatona): cert should be None of a tuple in the form of
         # (cert, key).
         # In a devstack with enable_service tls-proxy:
@@ -1960,6 +1965,7 @@ def port_update(request, port_id, **kwargs):
               {'port_id': port_id, 'kwargs': kwargs})
     kwargs = unescape_port_kwargs(**kwargs)
     port = networkclient(request).update_port(port_id, **kwargs).to_dict()
+    invalidate_server_addresses(request)
     return Port(port)
 
 
@@ -2266,12 +2272,88 @@ def servers_update_addresses(request, servers, all_tenants=False):
 
        Should be used when up to date networking information is required,
        and Nova's networking info caching mechanism is not fast enough.
+
+       When ``OPENSTACK_INSTANCE_IP_ADDRESSES_CACHE_TIMEOUT`` is set, the
+       addresses retrieved are kept in the cache along with the ``updated``
+       timestamp of their server, and Neutron is only queried for the servers
+       updated since their addresses were cached.
     """
 
     # NOTE(e0ne): we don't need to call neutron if we have no instances
     if not servers:
         return
 
+    timeout = settings.OPENSTACK_INSTANCE_IP_ADDRESSES_CACHE_TIMEOUT
+    if not timeout:
+        addresses = _servers_get_addresses(request, servers, all_tenants)
+        for server in servers:
+            if server.id in addresses:
+                server.addresses = addresses[server.id]
+        return
+
+    cache_key = _server_addresses_cache_key(request, all_tenants)
+    try:
+        cached = cache.get(cache_key) or {}
+    except Exception:
+        LOG.exception('Unable to read the server addresses from the cache.')
+        cached = {}
+    now = time.time()
+    outdated = []
+    for server in servers:
+        updated = getattr(server, 'updated', None)
+        try:
+            cached_updated, cached_at, addresses = cached[server.id]
+        except KeyError:
+            outdated.append(server)
+            continue
+        if (updated is None or updated != cached_updated or
+                now - cached_at > timeout):
+            outdated.append(server)
+        else:
+            server.addresses = addresses
+    if not outdated:
+        return
+
+    addresses = _servers_get_addresses(request, outdated, all_tenants)
+    if not addresses:
+        return
+    for server in outdated:
+        if server.id in addresses:
+            server.addresses = addresses[server.id]
+            cached[server.id] = (getattr(server, 'updated', None), now,
+                                 addresses[server.id])
+    # Drop the addresses which can no longer be used.
+    cached = dict((server_id, value) for server_id, value in cached.items()
+                  if now - value[1] <= timeout)
+    try:
+        cache.set(cache_key, cached, timeout)
+    except Exception:
+        LOG.exception('Unable to store the server addresses in the cache.')
+
+
+def _server_addresses_cache_key(request, all_tenants=False):
+    return 'openstack_dashboard.server_addresses:%s:%s:%s:%s' % (
+        request.user.endpoint, request.user.services_region,
+        request.user.project_id, all_tenants)
+
+
+def invalidate_server_addresses(request):
+    """Drops the cached addresses of the servers of the current project.
+
+    It needs to be called after a change of the ports or floating IPs of
+    the servers which does not change their ``updated`` timestamp.
+    """
+    if not settings.OPENSTACK_INSTANCE_IP_ADDRESSES_CACHE_TIMEOUT:
+        return
+    try:
+        cache.delete_many([_server_addresses_cache_key(request, all_tenants)
+                           for all_tenants in (False, True)])
+    except Exception:
+        LOG.exception('Unable to drop the server addresses from the cache.')
+
+
+def _servers_get_addresses(request, servers, all_tenants=False):
+    """Returns the addresses of the servers, keyed by server ID."""
     # Get all (filtered for relevant servers) information from Neutron
     try:
         # NOTE(e0ne): we need tuple here to work with @memoized decorator.
@@ -2294,12 +2376,12 @@ def servers_update_addresses(request, servers, all_tenants=False):
             request=request)
     except sdk_exceptions.NotFoundException as e:
         LOG.error('Neutron resource does not exist. %s', e)
-        return
+        return {}
     except Exception as e:
         LOG.error('Unable to connect to Neutron: %s', e)
         error_message = _('Unable to connect to Neutron.')
         messages.error(request, error_message)
-        return
+        return {}
 
     # Map instance to its ports
     instances_ports = collections.defaultdict(list)
@@ -2315,9 +2397,10 @@ def servers_update_addresses(request, servers, all_tenants=False):
     network_names = dict((network.id, network.name_or_id)
                          for network in networks)
 
+    servers_addresses = {}
     for server in servers:
         try:
-            addresses = _server_get_addresses(
+            servers_addresses[server.id] = _server_get_addresses(
                 request,
                 server,
                 instances_ports,
@@ -2325,8 +2408,7 @@ def servers_update_addresses(request, servers, all_tenants=False):
                 network_names)
         except Exception as e:
             LOG.error(str(e))
-        else:
-            server.addresses = addresses
+    return servers_addresses
 
 
 def _server_get_addresses(request, server, ports, floating_ips, network_names):
@@ -2368,10 +2450,13 @@ def _server_get_addresses(request, server, ports, floating_ips, network_names):
 
 
 @profiler.trace
-@memoized
+@memoized(shared_ttl=600, per_token=False)
 def list_extensions(request):
     """List neutron extensions.
 
+    The extensions are returned as plain dicts, so that the list can be
+    kept in the shared memoize cache.
+
     :param request: django request object
     """
     neutron_api = networkclient(request)
@@ -2379,7 +2464,7 @@ def list_extensions(request):
         extensions_list = neutron_api.extensions()
     except exceptions.ServiceCatalogException:
         return {}
-    return tuple(extensions_list)
+    return tuple(extension.to_dict() for extension in extensions_list)
 
 
 @profiler.trace
@@ -222,7 +222,7 @@ class QuotaSet(base.QuotaSet):
 def upgrade_api(request, client, version):
     """Ugrade the nova API to the specified version if possible."""
 
-    min_ver, max_ver = api_versions._get_server_version_range(client)
+    min_ver, max_ver = _nova.get_server_version_range(request)
     if min_ver <= api_versions.APIVersion(version) <= max_ver:
         client = _nova.novaclient(request, version)
     return client
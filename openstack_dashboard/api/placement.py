@@ -47,8 +47,9 @@ def make_adapter(request):
         verify = False
     elif settings.OPENSTACK_SSL_CACERT:
         verify = settings.OPENSTACK_SSL_CACERT
+    http_session = base.get_http_session(base.url_for(request, 'placement'))
     return Adapter(
-        session.Session(auth=auth, verify=verify),
+        session.Session(auth=auth, verify=verify, session=http_session),
         api_version="placement 1.6",
     )
 
@@ -136,6 +136,26 @@ class ImageProperties(generic.View):
         )
 
 
+@urls.register
+class ImageUpload(generic.View):
+    """API for the status of the upload of image data through horizon."""
+    url_regex = r'glance/images/(?P<image_id>[^/]+)/upload/$'
+
+    @rest_utils.ajax()
+    def get(self, request, image_id):
+        """Get the status of the upload of the data of a specific image.
+
+        The result is an object with the properties "status" (one of
+        "queued", "uploading", "done" or "failed"), "size", "uploaded"
+        (the number of bytes sent to glance so far) and "error". Uploads
+        only known to another horizon process return 404.
+        """
+        upload = api.glance.image_upload_get(request, image_id)
+        if upload is None:
+            raise rest_utils.AjaxError(404, 'Image upload not found')
+        return upload.to_dict()
+
+
 class UploadObjectForm(forms.Form):
     data = forms.FileField(required=False)
 
@@ -16,6 +16,7 @@
 import os
 from urllib import parse
 
+from django.core.files import File
 from django import forms
 from django.http import StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
@@ -145,28 +146,68 @@ class Objects(generic.View):
         :param request:
         :param container:
         :return:
+
+        When the ``filter`` query parameter is given, only the objects and
+        folders whose name matches it are listed (see
+        :func:`openstack_dashboard.api.swift.compile_filter`), up to
+        ``limit`` of them after ``marker``. The result then has a ``marker``
+        property to get the next matches, which is null once the whole
+        folder has been read.
         """
         path = request.GET.get('path')
         if path is not None:
             path = parse.unquote(path)
 
+        filter_string = request.GET.get('filter')
+        if filter_string is not None:
+            limit = request.GET.get('limit')
+            objects, marker = api.swift.swift_filter_objects(
+                request,
+                filter_string,
+                container,
+                prefix=path,
+                marker=request.GET.get('marker'),
+                limit=int(limit) if limit else None
+            )
+            return {'items': self._get_contents(objects, path),
+                    'marker': marker}
+
         objects = api.swift.swift_get_objects(
             request,
             container,
             prefix=path
         )
+        return {'items': self._get_contents(objects[0], path)}
+
+    @rest_utils.ajax(data_required=True)
+    def delete(self, request, container):
+        """Delete multiple objects and pseudo-folders.
+
+        The DELETE data should be an application/json array of the names of
+        the objects to delete. The names of pseudo-folders end with a slash,
+        all their contents are deleted along with them.
+
+        This method returns the number of objects deleted and the errors of
+        the objects which could not be deleted, by name.
+        """
+        deleted, failures = api.swift.swift_delete_objects(
+            request,
+            container,
+            request.DATA
+        )
+        return {'deleted': deleted, 'failures': failures}
 
+    def _get_contents(self, objects, path):
         # filter out the folder from the listing if we're filtering for
         # contents of a (pseudo) folder
-        contents = [{
+        return [{
             'path': o.subdir if isinstance(o, swift.PseudoFolder) else o.name,
             'name': o.name.split('/')[-1],
             'bytes': o.bytes,
             'is_subdir': isinstance(o, swift.PseudoFolder),
             'is_object': not isinstance(o, swift.PseudoFolder),
             'content_type': getattr(o, 'content_type', None)
-        } for o in objects[0] if o.name != path]
-        return {'items': contents}
+        } for o in objects if o.name != path]
 
 
 class UploadObjectForm(forms.Form):
@@ -196,14 +237,14 @@ class Object(generic.View):
 
         :param file: the file data for the upload.
 
+        Instead of a form, the body of the request can be the file data
+        itself, with the ``application/octet-stream`` content type and a
+        ``Content-Length``. It is then streamed to swift without being
+        stored by Django first. The original name of the file can be given
+        in the ``filename`` query parameter.
+
         :return:
         """
-        form = UploadObjectForm(request.POST, request.FILES)
-        if not form.is_valid():
-            raise rest_utils.AjaxError(500, 'Invalid request')
-
-        data = form.clean()
-
         if object_name[-1] == '/':
             result = api.swift.swift_create_pseudo_folder(
                 request,
@@ -215,13 +256,32 @@ class Object(generic.View):
                 request,
                 container,
                 object_name,
-                data['file']
+                self._get_object_file(request, object_name)
             )
 
         return rest_utils.CreatedResponse(
             '/api/swift/containers/%s/object/%s' % (container, result.name)
         )
 
+    def _get_object_file(self, request, object_name):
+        if request.content_type != 'application/octet-stream':
+            form = UploadObjectForm(request.POST, request.FILES)
+            if not form.is_valid():
+                raise rest_utils.AjaxError(500, 'Invalid request')
+            return form.clean()['file']
+
+        try:
+            size = int(request.META['CONTENT_LENGTH'])
+        except (KeyError, ValueError):
+            raise rest_utils.AjaxError(411, 'Length Required')
+        if not size:
+            return None
+        name = (request.GET.get('filename') or
+                object_name.rsplit(api.swift.FOLDER_DELIMITER)[-1])
+        object_file = File(request, name=name)
+        object_file.size = size
+        return object_file
+
     @rest_utils.ajax()
     def delete(self, request, container, object_name):
         if object_name[-1] == '/':
@@ -16,7 +16,14 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
 import datetime
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
 from urllib import parse
 
 import functools
@@ -27,12 +34,20 @@ from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
 from horizon import exceptions
+from horizon.utils import executors
 
 from openstack_dashboard.api import base
 from openstack_dashboard.contrib.developer.profiler import api as profiler
 
 FOLDER_DELIMITER = "/"
 CHUNK_SIZE = settings.SWIFT_FILE_TRANSFER_CHUNK_SIZE
+# Suffix of the containers where the segments of large objects are stored,
+# as with the swift command line client.
+SEGMENTS_CONTAINER_SUFFIX = "_segments"
+# The maximum number of listing pages read by a call to swift_filter_objects.
+FILTER_MAX_PAGES = 10
+# The number of objects listed per request when deleting pseudo-folders.
+DELETE_LISTING_LIMIT = 10000
 # Swift ACL
 GLOBAL_READ_ACL = ".r:*"
 LIST_CONTENTS_ACL = ".rlistings"
@@ -277,41 +292,67 @@ def swift_get_objects(request, container_name, prefix=None, marker=None,
     return (object_objs, False)
 
 
+def compile_filter(filter_string):
+    """Compiles a filter of object names.
+
+    The filter is made of space separated patterns, where ``*`` stands for
+    any sequence of characters. A name matches the filter when it matches
+    one of the patterns as a whole.
+
+    :returns: a tuple of the compiled regular expression and the longest
+        literal prefix shared by all the patterns, which all the matching
+        names start with.
+    """
+    patterns = filter_string.split() or ['*']
+    regex = re.compile('|'.join(
+        '.*'.join(re.escape(part) for part in pattern.split('*'))
+        for pattern in patterns), re.DOTALL)
+    prefix = os.path.commonprefix(
+        [pattern.split('*', 1)[0] for pattern in patterns])
+    return regex, prefix
+
+
 @profiler.trace
 @safe_swift_exception
 def swift_filter_objects(request, filter_string, container_name, prefix=None,
-                         marker=None):
-    # FIXME(kewu): Swift currently has no real filtering API, thus the marker
-    # parameter here won't actually help the pagination. For now I am just
-    # getting the largest number of objects from a container and filtering
-    # based on those objects.
-    limit = 9999
-    objects = swift_get_objects(request,
-                                container_name,
-                                prefix=prefix,
-                                marker=marker,
-                                limit=limit)
-    filter_string_list = filter_string.lower().strip().split(' ')
-
-    def matches_filter(obj):
-        for q in filter_string_list:
-            return wildcard_search(obj.name.lower(), q)
-
-    return filter(matches_filter, objects[0])
-
-
-def wildcard_search(string, q):
-    q_list = q.split('*')
-    if all(map(lambda x: x == '', q_list)):
-        return True
-    if q_list[0] not in string:
-        return False
-
-    if q_list[0] == '':
-        tail = string
-    else:
-        head, delimiter, tail = string.partition(q_list[0])
-    return wildcard_search(tail, '*'.join(q_list[1:]))
+                         marker=None, limit=None):
+    """Lists the objects and pseudo-folders of a folder matching a filter.
+
+    The filter (see :func:`compile_filter`) is matched against the names
+    relative to ``prefix``, without the trailing delimiter of
+    pseudo-folders. The listing is read from swift page by page, starting
+    after ``marker`` and narrowed with the literal prefix of the filter,
+    until ``limit`` matches are found. At most ``FILTER_MAX_PAGES`` pages
+    are read per call.
+
+    :returns: a tuple of the matching objects and the marker to pass to get
+        the next ones, or None when the whole listing has been read.
+    """
+    limit = limit or settings.API_RESULT_LIMIT
+    page_size = settings.API_RESULT_LIMIT
+    regex, filter_prefix = compile_filter(filter_string)
+    prefix = prefix or ''
+    listing_prefix = prefix + filter_prefix
+    swift = swift_api(request)
+    matches = []
+    for _page in range(FILTER_MAX_PAGES):
+        items = swift.get_container(container_name,
+                                    prefix=listing_prefix,
+                                    marker=marker,
+                                    limit=page_size,
+                                    delimiter=FOLDER_DELIMITER)[1]
+        for item in items:
+            name = item.get('subdir') or item['name']
+            marker = name
+            if not regex.fullmatch(name[len(prefix):].rstrip(
+                    FOLDER_DELIMITER)):
+                continue
+            matches.append(item)
+            if len(matches) == limit:
+                return _objectify(matches, container_name), marker
+        if len(items) < page_size:
+            return _objectify(matches, container_name), None
+    return _objectify(matches, container_name), marker
 
 
 @profiler.trace
@@ -336,6 +377,18 @@ def swift_copy_object(request, orig_container_name, orig_object_name,
 @safe_swift_exception
 def swift_upload_object(request, container_name, object_name,
                         object_file=None):
+    """Uploads an object.
+
+    ``object_file`` can be any file-like object with ``name`` and ``size``
+    attributes, it is read in chunks. Objects larger than
+    ``SWIFT_UPLOAD_SEGMENT_SIZE``, when it is set, are uploaded in segments
+    (see :func:`swift_upload_object_segmented`).
+    """
+    segment_size = settings.SWIFT_UPLOAD_SEGMENT_SIZE
+    if object_file and segment_size and object_file.size > segment_size:
+        return swift_upload_object_segmented(request, container_name,
+                                             object_name, object_file)
+
     headers = {}
     size = 0
     if object_file:
@@ -352,6 +405,150 @@ def swift_upload_object(request, container_name, object_name,
     return StorageObject(obj_info, container_name)
 
 
+def _is_true(value):
+    return str(value).lower() in ('true', '1', 'yes', 'on')
+
+
+def _get_uploaded_segments(request, container_name, segments_container,
+                           prefix):
+    """Returns the (etag, size) of the segments already uploaded by name.
+
+    The segments container is created, with the storage policy of the
+    container of the object, when it does not exist yet.
+    """
+    swift = swift_api(request)
+    try:
+        segments = swift.get_container(segments_container, prefix=prefix,
+                                       full_listing=True)[1]
+    except swiftclient.client.ClientException as e:
+        if e.http_status != 404:
+            raise
+        headers = {}
+        policy = swift.head_container(container_name).get(
+            'x-storage-policy')
+        if policy:
+            headers['X-Storage-Policy'] = policy
+        swift.put_container(segments_container, headers=headers)
+        segments = []
+    return {segment['name']: (segment['hash'], segment['bytes'])
+            for segment in segments}
+
+
+def _spool_segment(object_file, length):
+    """Copies the next segment of a file to a temporary file.
+
+    :returns: the temporary file, positioned at its start, and the MD5 of
+        the segment, which is the etag swift computes for it.
+    """
+    segment_file = tempfile.TemporaryFile(dir=settings.FILE_UPLOAD_TEMP_DIR)
+    md5 = hashlib.md5(usedforsecurity=False)
+    remaining = length
+    try:
+        while remaining:
+            chunk = object_file.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                raise exceptions.BadRequest(
+                    _("The object data ended before its announced size."))
+            md5.update(chunk)
+            segment_file.write(chunk)
+            remaining -= len(chunk)
+        segment_file.seek(0)
+    except Exception:
+        segment_file.close()
+        raise
+    return segment_file, md5.hexdigest()
+
+
+def _upload_segment(request, segments_container, name, segment_file, length,
+                    etag):
+    # Connections are not shared between threads.
+    try:
+        swift_api(request).put_object(segments_container, name, segment_file,
+                                      content_length=length, etag=etag,
+                                      chunk_size=CHUNK_SIZE)
+    finally:
+        segment_file.close()
+
+
+def _get_max_slo_segments(request):
+    """Returns how many segments SLO manifests can have, None without SLO."""
+    capabilities = swift_get_capabilities(request)
+    if 'slo' not in capabilities:
+        return None
+    return capabilities['slo'].get('max_manifest_segments', 1000)
+
+
+@profiler.trace
+@safe_swift_exception
+def swift_upload_object_segmented(request, container_name, object_name,
+                                  object_file, segment_size=None):
+    """Uploads an object in segments, followed by its manifest.
+
+    The segments of ``SWIFT_UPLOAD_SEGMENT_SIZE`` bytes are read in turn
+    from ``object_file`` into temporary files and uploaded to the
+    ``<container>_segments`` container in the thread pool of
+    ``SWIFT_UPLOAD_SEGMENT_WORKERS`` shared by the requests of the process,
+    or one after the other when it is ``0``. The object is then created as
+    a Static Large Object manifest, or as a Dynamic Large Object manifest
+    when swift does not support SLO or the object has too many segments.
+
+    The names of the segments only depend on the name and size of the
+    object, so a failed upload can be resumed by uploading the same data
+    again: the segments already in swift with the same MD5 are not
+    uploaded again.
+    """
+    segment_size = segment_size or settings.SWIFT_UPLOAD_SEGMENT_SIZE
+    size = object_file.size
+    segments_container = container_name + SEGMENTS_CONTAINER_SUFFIX
+    prefix = '%s/slo/%d/%d/' % (object_name, size, segment_size)
+    uploaded = _get_uploaded_segments(request, container_name,
+                                      segments_container, prefix)
+
+    manifest = []
+    workers = settings.SWIFT_UPLOAD_SEGMENT_WORKERS
+    executor = None
+    if workers > 0:
+        executor = executors.get_executor('SWIFT_UPLOAD_SEGMENT_WORKERS')
+    pending = collections.deque()
+    for offset in range(0, size, segment_size):
+        # Bound the number of segments spooled to disk.
+        while pending and len(pending) >= workers:
+            pending.popleft().result()
+        length = min(segment_size, size - offset)
+        name = '%s%08d' % (prefix, len(manifest))
+        segment_file, etag = _spool_segment(object_file, length)
+        manifest.append({'path': '/%s/%s' % (segments_container, name),
+                         'etag': etag,
+                         'size_bytes': length})
+        if uploaded.get(name) == (etag, length):
+            segment_file.close()
+        elif executor is None:
+            _upload_segment(request, segments_container, name, segment_file,
+                            length, etag)
+        else:
+            pending.append(executor.submit(
+                _upload_segment, request, segments_container, name,
+                segment_file, length, etag))
+    for future in pending:
+        future.result()
+
+    headers = {'X-Object-Meta-Orig-Filename': object_file.name}
+    max_segments = _get_max_slo_segments(request)
+    if max_segments is not None and len(manifest) <= max_segments:
+        etag = swift_api(request).put_object(
+            container_name, object_name, json.dumps(manifest),
+            headers=headers, query_string='multipart-manifest=put')
+    else:
+        headers['X-Object-Manifest'] = '%s/%s' % (
+            parse.quote(segments_container), parse.quote(prefix))
+        etag = swift_api(request).put_object(
+            container_name, object_name, b'', content_length=0,
+            headers=headers)
+
+    obj_info = {'name': object_name, 'bytes': size, 'etag': etag}
+    return StorageObject(obj_info, container_name)
+
+
 @profiler.trace
 @safe_swift_exception
 def swift_create_pseudo_folder(request, container_name, pseudo_folder_name):
@@ -375,10 +572,177 @@ def swift_create_pseudo_folder(request, container_name, pseudo_folder_name):
 @profiler.trace
 @safe_swift_exception
 def swift_delete_object(request, container_name, object_name):
-    swift_api(request).delete_object(container_name, object_name)
+    swift = swift_api(request)
+    query_string = None
+    if settings.SWIFT_UPLOAD_SEGMENT_SIZE:
+        # Delete the segments of Static Large Objects along with them.
+        headers = swift.head_object(container_name, object_name)
+        if _is_true(headers.get('x-static-large-object')):
+            query_string = 'multipart-manifest=delete'
+    if query_string:
+        swift.delete_object(container_name, object_name,
+                            query_string=query_string)
+    else:
+        swift.delete_object(container_name, object_name)
     return True
 
 
+def _bulk_delete(request, container_name, object_names):
+    """Deletes objects with the bulk delete middleware of swift."""
+    data = b''.join(
+        parse.quote('/%s/%s' % (container_name, name)).encode('utf-8') + b'\n'
+        for name in object_names)
+    headers, body = swift_api(request).post_account(
+        headers={'Accept': 'application/json', 'Content-Type': 'text/plain'},
+        query_string='bulk-delete', data=data)
+    result = json.loads(body)
+    path_prefix = '/%s/' % container_name
+    failures = {}
+    for path, status in result.get('Errors') or []:
+        name = parse.unquote(path)
+        if name.startswith(path_prefix):
+            name = name[len(path_prefix):]
+        failures[name] = status
+    status = result.get('Response Status', '200 OK')
+    if not failures and not status.startswith('2'):
+        failures = dict.fromkeys(object_names, status)
+    return failures
+
+
+def _parallel_delete(request, container_name, object_names,
+                     query_string=None):
+    """Deletes objects in the thread pool of SWIFT_DELETE_WORKERS."""
+    local = threading.local()
+    kwargs = {'query_string': query_string} if query_string else {}
+
+    def delete(name):
+        # Connections are not shared between threads.
+        if not hasattr(local, 'swift'):
+            local.swift = swift_api(request)
+        try:
+            local.swift.delete_object(container_name, name, **kwargs)
+        except swiftclient.client.ClientException as e:
+            if getattr(e, 'http_status', None) != 404:
+                return str(e)
+        return None
+
+    results = executors.call_functions(
+        [functools.partial(delete, name) for name in object_names],
+        'SWIFT_DELETE_WORKERS')
+    failures = {}
+    for name, (error, exception) in zip(object_names, results):
+        if exception is not None:
+            raise exception
+        if error is not None:
+            failures[name] = error
+    return failures
+
+
+def _get_slo_manifests(request, container_name, object_names):
+    """Returns the names of the Static Large Object manifests among objects.
+
+    The objects are looked up in the thread pool of SWIFT_DELETE_WORKERS.
+    Those which cannot be looked up are not considered manifests.
+    """
+    local = threading.local()
+
+    def is_manifest(name):
+        # Connections are not shared between threads.
+        if not hasattr(local, 'swift'):
+            local.swift = swift_api(request)
+        headers = local.swift.head_object(container_name, name)
+        return _is_true(headers.get('x-static-large-object'))
+
+    results = executors.call_functions(
+        [functools.partial(is_manifest, name) for name in object_names],
+        'SWIFT_DELETE_WORKERS')
+    return {name for name, (manifest, exception)
+            in zip(object_names, results) if manifest}
+
+
+def _iter_folder_objects(request, container_name, folder_name):
+    """Yields the pages of the listing of all the objects of a folder."""
+    swift = swift_api(request)
+    marker = None
+    while True:
+        objects = swift.get_container(container_name, prefix=folder_name,
+                                      marker=marker,
+                                      limit=DELETE_LISTING_LIMIT)[1]
+        if objects:
+            yield objects
+        if len(objects) < DELETE_LISTING_LIMIT:
+            return
+        marker = objects[-1]['name']
+
+
+@profiler.trace
+@safe_swift_exception
+def swift_delete_objects(request, container_name, object_names):
+    """Deletes objects and pseudo-folders with all their contents.
+
+    Names ending with the delimiter are pseudo-folders. Everything under
+    them is listed page by page and deleted, along with the folder itself.
+    The objects are deleted with the bulk delete middleware when swift
+    advertises it, by batches of its ``max_deletes_per_request``, and
+    otherwise by up to ``SWIFT_DELETE_WORKERS`` parallel requests. Objects
+    which do not exist are considered deleted.
+
+    Static Large Object manifests are deleted along with their segments by
+    parallel requests, since bulk deletes leave the segments behind. They
+    are found from the listing of the pseudo-folders, and the objects
+    named explicitly are only looked up when ``SWIFT_UPLOAD_SEGMENT_SIZE``
+    is set, as in :func:`swift_delete_object`.
+
+    :returns: a tuple of the number of objects deleted and a dict of the
+        errors of the objects which could not be deleted, by name.
+    """
+    capabilities = swift_get_capabilities(request)
+    bulk_delete = capabilities.get('bulk_delete')
+    if bulk_delete:
+        batch_size = bulk_delete.get('max_deletes_per_request', 10000)
+        delete = _bulk_delete
+    else:
+        batch_size = DELETE_LISTING_LIMIT
+        delete = _parallel_delete
+    slo = 'slo' in capabilities
+
+    def batches():
+        objects = [name for name in object_names
+                   if not name.endswith(FOLDER_DELIMITER)]
+        manifests = set()
+        if slo and settings.SWIFT_UPLOAD_SEGMENT_SIZE:
+            manifests = _get_slo_manifests(request, container_name, objects)
+        for i in range(0, len(objects), batch_size):
+            yield objects[i:i + batch_size], manifests
+        for name in object_names:
+            if name.endswith(FOLDER_DELIMITER):
+                for page in _iter_folder_objects(request, container_name,
+                                                 name):
+                    names = [obj['name'] for obj in page]
+                    # The listings of SLO manifests have their SLO etag.
+                    manifests = {obj['name'] for obj in page
+                                 if slo and 'slo_etag' in obj}
+                    for i in range(0, len(names), batch_size):
+                        yield names[i:i + batch_size], manifests
+
+    deleted = 0
+    failures = {}
+    for batch, manifests in batches():
+        batch_failures = {}
+        batch_manifests = [name for name in batch if name in manifests]
+        if batch_manifests:
+            batch_failures.update(_parallel_delete(
+                request, container_name, batch_manifests,
+                query_string='multipart-manifest=delete'))
+        batch_objects = [name for name in batch if name not in manifests]
+        if batch_objects:
+            batch_failures.update(delete(request, container_name,
+                                         batch_objects))
+        deleted += len(batch) - len(batch_failures)
+        failures.update(batch_failures)
+    return deleted, failures
+
+
 @profiler.trace
 @safe_swift_exception
 def swift_delete_folder(request, container_name, object_name):
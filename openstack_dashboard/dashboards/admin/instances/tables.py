@@ -60,18 +60,30 @@ class LiveMigrateInstance(policy.PolicyTargetMixin,
 
 
 class AdminUpdateRow(project_tables.UpdateRow):
-    def get_data(self, request, instance_id):
-        instance = super().get_data(request, instance_id)
+    def _get_tenant_name(self, request, tenant_id):
         try:
-            tenant = api.keystone.tenant_get(request,
-                                             instance.tenant_id,
-                                             admin=True)
-            instance.tenant_name = getattr(tenant, "name", instance.tenant_id)
+            tenant = api.keystone.tenant_get(request, tenant_id, admin=True)
+            return getattr(tenant, "name", tenant_id)
         except keystone_exceptions.NotFound:
-            instance.tenant_name = None
+            return None
 
+    def get_data(self, request, instance_id):
+        instance = super().get_data(request, instance_id)
+        instance.tenant_name = self._get_tenant_name(request,
+                                                     instance.tenant_id)
         return instance
 
+    def get_data_multiple(self, request, instance_ids):
+        instances, removed = super().get_data_multiple(request,
+                                                       instance_ids)
+        tenant_names = {}
+        for instance in instances:
+            if instance.tenant_id not in tenant_names:
+                tenant_names[instance.tenant_id] = self._get_tenant_name(
+                    request, instance.tenant_id)
+            instance.tenant_name = tenant_names[instance.tenant_id]
+        return instances, removed
+
 
 class AdminInstanceFilterAction(tables.FilterAction):
     # Change default name of 'filter' to distinguish this one from the
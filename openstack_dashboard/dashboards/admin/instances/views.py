@@ -178,10 +178,9 @@ class AdminIndexView(tables.PagedTableMixin, tables.DataTableView):
 
         results = futurist_utils.call_functions_parallel(
             self._get_images,
-            self._get_volumes,
             self._get_flavors,
             self._get_tenants)
-        image_dict, volume_dict, flavor_dict, tenant_dict = results
+        image_dict, flavor_dict, tenant_dict = results
 
         non_api_filter_info = [
             ('project', 'tenant_id', tenant_dict.values()),
@@ -199,14 +198,20 @@ class AdminIndexView(tables.PagedTableMixin, tables.DataTableView):
             self._more = False
             return []
 
-        instances = self._get_instances(search_opts, sort_dir)
+        instances, volume_dict = futurist_utils.call_functions_parallel(
+            (self._get_instances, [search_opts, sort_dir]),
+            self._get_volumes)
 
         if not filter_by_image_name:
             image_dict = self._get_images()
 
+        attachments = instance_utils.index_volume_attachments(
+            volume_dict.values())
+
         # Loop through instances to get image, flavor and tenant info.
         for inst in instances:
-            self._populate_image_info(inst, image_dict, volume_dict)
+            self._populate_image_info(inst, image_dict, volume_dict,
+                                      attachments)
             if hasattr(inst, 'image') and isinstance(inst.image, dict):
                 image_id = inst.image.get('id')
                 if image_id in image_dict:
@@ -224,7 +229,8 @@ class AdminIndexView(tables.PagedTableMixin, tables.DataTableView):
             inst.tenant_name = getattr(tenant, "name", None)
         return instances
 
-    def _populate_image_info(self, instance, image_dict, volume_dict):
+    def _populate_image_info(self, instance, image_dict, volume_dict,
+                             attachments):
         if not hasattr(instance, 'image'):
             return
         # Instance from image returns dict
@@ -239,33 +245,10 @@ class AdminIndexView(tables.PagedTableMixin, tables.DataTableView):
                 instance.image['name'] = _("-")
         # Otherwise trying to get image from volume metadata
         else:
-            instance_volumes = [
-                attachment
-                for volume in volume_dict.values()
-                for attachment in volume.attachments
-                if attachment['server_id'] == instance.id
-            ]
-            # While instance from volume is being created,
-            # it does not have volumes
-            if not instance_volumes:
-                return
-            # Sorting attached volumes by device name (eg '/dev/sda')
-            instance_volumes.sort(key=lambda attach: attach['device'])
-            # Getting volume object, which is as attached
-            # as the first device
-            boot_volume = volume_dict[instance_volumes[0]['id']]
-            # There is a case where volume_image_metadata contains
-            # only fields other than 'image_id' (See bug 1834747),
-            # so we try to populate image information only when it is found.
-            volume_metadata = getattr(boot_volume, "volume_image_metadata", {})
-            image_id = volume_metadata.get('image_id')
-            if image_id:
-                try:
-                    instance.image = image_dict[image_id].to_dict()
-                except KeyError:
-                    # KeyError occurs when volume was created from image and
-                    # then this image is deleted.
-                    pass
+            image = instance_utils.get_boot_volume_image(
+                instance, volume_dict, attachments, image_dict)
+            if image is not None:
+                instance.image = image.to_dict()
 
 
 class LiveMigrateView(forms.ModalFormView):
@@ -46,6 +46,7 @@ from openstack_dashboard.dashboards.project.instances.workflows \
 from openstack_dashboard.dashboards.project.instances.workflows \
     import update_instance
 from openstack_dashboard import policy
+from openstack_dashboard.utils import futurist_utils
 from openstack_dashboard.views import get_url_with_pagination
 
 LOG = logging.getLogger(__name__)
@@ -83,10 +84,19 @@ def is_deleting(instance):
     return task_state.lower() == "deleting"
 
 
+# Instance attributes the allowed() checks and the policy targets of the
+# row actions below depend on. Rows sharing them share the permission checks.
+ALLOWED_DEPENDS_ON = ("status", "OS-EXT-STS:task_state",
+                      "OS-EXT-STS:power_state", "tenant_id", "user_id",
+                      "domain_id")
+
+
 class DeleteInstance(policy.PolicyTargetMixin, tables.DeleteAction):
     policy_rules = (("compute", "os_compute_api:servers:delete"),)
+    allowed_depends_on = ALLOWED_DEPENDS_ON
     help_text = _("Deleted instances are not recoverable.")
     default_message_level = "info"
+    max_concurrency = 5
 
     @staticmethod
     def action_present(count):
@@ -118,6 +128,7 @@ class RebootInstance(policy.PolicyTargetMixin, tables.BatchAction):
     name = "reboot"
     classes = ('btn-reboot',)
     policy_rules = (("compute", "os_compute_api:servers:reboot"),)
+    allowed_depends_on = ALLOWED_DEPENDS_ON
     help_text = _("Restarted instances will lose any data"
                   " not saved in persistent storage.")
     action_type = "danger"
@@ -181,6 +192,7 @@ class RescueInstance(policy.PolicyTargetMixin, tables.LinkAction):
     name = "rescue"
     verbose_name = _("Rescue Instance")
     policy_rules = (("compute", "os_compute_api:os-rescue"),)
+    allowed_depends_on = ALLOWED_DEPENDS_ON
     classes = ("btn-rescue", "ajax-modal")
     url = "horizon:project:instances:rescue"
 
@@ -194,6 +206,7 @@ class RescueInstance(policy.PolicyTargetMixin, tables.LinkAction):
 
 class UnRescueInstance(tables.BatchAction):
     name = 'unrescue'
+    allowed_depends_on = ALLOWED_DEPENDS_ON
     classes = ("btn-unrescue",)
 
     @staticmethod
@@ -531,6 +544,7 @@ class CreateSnapshot(policy.PolicyTargetMixin, tables.LinkAction):
     classes = ("ajax-modal",)
     icon = "camera"
     policy_rules = (("compute", "os_compute_api:snapshot"),)
+    allowed_depends_on = ALLOWED_DEPENDS_ON
 
     def allowed(self, request, instance=None):
         return instance.status in SNAPSHOT_READY_STATES \
@@ -543,6 +557,7 @@ class ConsoleLink(policy.PolicyTargetMixin, tables.LinkAction):
     url = "horizon:project:instances:detail"
     classes = ("btn-console",)
     policy_rules = (("compute", "os_compute_api:os-consoles:index"),)
+    allowed_depends_on = ALLOWED_DEPENDS_ON
 
     def allowed(self, request, instance=None):
         # We check if ConsoleLink is allowed only if settings.CONSOLE_TYPE is
@@ -564,6 +579,7 @@ class LogLink(policy.PolicyTargetMixin, tables.LinkAction):
     url = "horizon:project:instances:detail"
     classes = ("btn-log",)
     policy_rules = (("compute", "os_compute_api:os-console-output"),)
+    allowed_depends_on = ALLOWED_DEPENDS_ON
 
     def allowed(self, request, instance=None):
         return instance.status in ACTIVE_STATES and not is_deleting(instance)
@@ -581,6 +597,7 @@ class ResizeLink(policy.PolicyTargetMixin, tables.LinkAction):
     url = "horizon:project:instances:resize"
     classes = ("ajax-modal", "btn-resize")
     policy_rules = (("compute", "os_compute_api:servers:resize"),)
+    allowed_depends_on = ALLOWED_DEPENDS_ON
     action_type = "danger"
 
     def get_link_url(self, project):
@@ -605,6 +622,7 @@ class ConfirmResize(policy.PolicyTargetMixin, tables.Action):
     verbose_name = _("Confirm Resize/Migrate")
     classes = ("btn-confirm", "btn-action-required")
     policy_rules = (("compute", "os_compute_api:servers:confirm_resize"),)
+    allowed_depends_on = ALLOWED_DEPENDS_ON
 
     def allowed(self, request, instance):
         return instance.status == 'VERIFY_RESIZE'
@@ -625,6 +643,7 @@ class RevertResize(policy.PolicyTargetMixin, tables.Action):
     verbose_name = _("Revert Resize/Migrate")
     classes = ("btn-revert", "btn-action-required")
     policy_rules = (("compute", "os_compute_api:servers:revert_resize"),)
+    allowed_depends_on = ALLOWED_DEPENDS_ON
 
     def allowed(self, request, instance):
         return instance.status == 'VERIFY_RESIZE'
@@ -645,6 +664,7 @@ class RebuildInstance(policy.PolicyTargetMixin, tables.LinkAction):
     classes = ("btn-rebuild", "ajax-modal")
     url = "horizon:project:instances:rebuild"
     policy_rules = (("compute", "os_compute_api:servers:rebuild"),)
+    allowed_depends_on = ALLOWED_DEPENDS_ON
     action_type = "danger"
 
     def allowed(self, request, instance):
@@ -793,8 +813,9 @@ def get_instance_error(instance):
 
 class UpdateRow(tables.Row):
     ajax = True
+    ajax_batch = True
 
-    def get_data(self, request, instance_id):
+    def _get_instance(self, request, instance_id):
         instance = api.nova.server_get(request, instance_id)
         try:
             instance.full_flavor = instance_utils.resolve_flavor(request,
@@ -804,6 +825,13 @@ class UpdateRow(tables.Row):
                               _('Unable to retrieve flavor information '
                                 'for instance "%s".') % instance_id,
                               ignore=True)
+        error = get_instance_error(instance)
+        if error:
+            messages.error(request, error)
+        return instance
+
+    def get_data(self, request, instance_id):
+        instance = self._get_instance(request, instance_id)
         try:
             api.network.servers_update_addresses(request, [instance])
         except Exception:
@@ -811,16 +839,47 @@ class UpdateRow(tables.Row):
                               _('Unable to retrieve Network information '
                                 'for instance "%s".') % instance_id,
                               ignore=True)
-        error = get_instance_error(instance)
-        if error:
-            messages.error(request, error)
         return instance
 
+    def get_data_multiple(self, request, instance_ids):
+        # Nova cannot list servers by ID for regular users, so they are
+        # retrieved in parallel and their addresses all at once.
+        def get_instance(instance_id):
+            try:
+                return self._get_instance(request, instance_id), None
+            except Exception as e:
+                return None, e
+
+        results = futurist_utils.call_functions_parallel(
+            *[(get_instance, [instance_id]) for instance_id in instance_ids])
+        instances = []
+        removed = []
+        for instance_id, (instance, exc) in zip(instance_ids, results):
+            if exc is None:
+                instances.append(instance)
+            elif isinstance(exc, exceptions.NOT_FOUND):
+                removed.append(instance_id)
+            else:
+                # The row of the instance is updated again later.
+                try:
+                    raise exc
+                except Exception:
+                    exceptions.handle(request, ignore=True)
+        try:
+            api.network.servers_update_addresses(request, instances)
+        except Exception:
+            exceptions.handle(request,
+                              _('Unable to retrieve Network information '
+                                'for instances.'),
+                              ignore=True)
+        return instances, removed
+
 
 class StartInstance(policy.PolicyTargetMixin, tables.BatchAction):
     name = "start"
     classes = ('btn-confirm',)
     policy_rules = (("compute", "os_compute_api:servers:start"),)
+    allowed_depends_on = ALLOWED_DEPENDS_ON
 
     @staticmethod
     def action_present(count):
@@ -849,6 +908,7 @@ class StartInstance(policy.PolicyTargetMixin, tables.BatchAction):
 class StopInstance(policy.PolicyTargetMixin, tables.BatchAction):
     name = "stop"
     policy_rules = (("compute", "os_compute_api:servers:stop"),)
+    allowed_depends_on = ALLOWED_DEPENDS_ON
     help_text = _("The instance(s) will be shut off.")
     action_type = "danger"
 
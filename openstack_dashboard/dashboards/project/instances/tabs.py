@@ -169,4 +169,5 @@ class InstanceDetailTabs(policy.PolicyTargetMixin, tabs.DetailTabsGroup):
     slug = "instance_details"
     tabs = (OverviewTab, InterfacesTab, LogTab, ConsoleTab, AuditTab)
     sticky = True
+    lazy = True
     policy_rules = (("compute", "os_compute_api:os-consoles:show"),)
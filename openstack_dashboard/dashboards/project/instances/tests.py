@@ -28,6 +28,7 @@ from django.test.utils import override_settings
 from django.urls import reverse
 from django.utils.http import urlencode
 from novaclient import api_versions
+from novaclient import exceptions as nova_exceptions
 
 from horizon import exceptions
 from horizon import forms
@@ -36,6 +37,8 @@ from openstack_dashboard import api
 from openstack_dashboard.dashboards.project.instances import console
 from openstack_dashboard.dashboards.project.instances import tables
 from openstack_dashboard.dashboards.project.instances import tabs
+from openstack_dashboard.dashboards.project.instances \
+    import utils as instance_utils
 from openstack_dashboard.dashboards.project.instances import workflows
 from openstack_dashboard.test import helpers
 from openstack_dashboard.views import get_url_with_pagination
@@ -254,6 +257,21 @@ class InstanceTableTests(InstanceTestBase, InstanceTableTestMixin):
         self.assertNotContains(res, "Launch Instance (Quota exceeded)")
         self._check_get_index()
 
+    def test_index_volume_attachments(self):
+        volumes = [
+            mock.Mock(attachments=[{'id': 'vol1', 'server_id': 'server1',
+                                    'device': '/dev/vdb'}]),
+            mock.Mock(attachments=[{'id': 'vol2', 'server_id': 'server1',
+                                    'device': '/dev/vda'},
+                                   {'id': 'vol2', 'device': '/dev/vdc'}]),
+            mock.Mock(attachments=[]),
+        ]
+        attachments = instance_utils.index_volume_attachments(volumes)
+        self.assertEqual(['server1'], list(attachments))
+        self.assertEqual(['/dev/vda', '/dev/vdb'],
+                         [attachment['device']
+                          for attachment in attachments['server1']])
+
     @override_settings(OPENSTACK_INSTANCE_RETRIEVE_IP_ADDRESSES=False)
     def test_index_without_servers_update_addresses(self):
         res = self._get_index(use_servers_update_address=False)
@@ -3037,6 +3055,52 @@ class InstanceAjaxTests(helpers.TestCase):
         self.mock_tenant_absolute_limits.assert_called_once_with(
             helpers.IsHttpRequest(), reserved=True)
 
+    @helpers.create_mocks({api.nova: ("server_get",
+                                      "flavor_get",
+                                      'is_feature_available',
+                                      "tenant_absolute_limits"),
+                           api.network: ('servers_update_addresses',)})
+    def test_rows_update(self):
+        servers = self.servers.list()[:2]
+        full_flavors = {f.id: f for f in self.flavors.list()}
+        deleted_id = 'deleted-server'
+        failed_id = 'failed-server'
+
+        def server_get(request, instance_id):
+            for server in servers:
+                if server.id == instance_id:
+                    return server
+            if instance_id == failed_id:
+                raise nova_exceptions.ClientException(500)
+            raise nova_exceptions.NotFound(404)
+
+        self.mock_is_feature_available.return_value = True
+        self.mock_server_get.side_effect = server_get
+        self.mock_flavor_get.side_effect = \
+            lambda request, flavor_id: full_flavors[flavor_id]
+        self.mock_servers_update_addresses.return_value = None
+        self.mock_tenant_absolute_limits.return_value = self.limits['absolute']
+
+        params = [('action', 'rows_update'),
+                  ('table', 'instances'),
+                  ('obj_id', servers[0].id),
+                  ('obj_id', servers[1].id),
+                  ('obj_id', deleted_id),
+                  ('obj_id', failed_id)]
+        res = self.client.get('?'.join((INDEX_URL, urlencode(params))),
+                              HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+
+        self.assertEqual(200, res.status_code)
+        data = json.loads(res.content)
+        # The row of the server which failed to be retrieved is unchanged.
+        self.assertEqual({servers[0].id, servers[1].id}, set(data['rows']))
+        for server in servers:
+            self.assertIn(server.name, data['rows'][server.id])
+        self.assertEqual([deleted_id], data['removed'])
+        self.assertEqual(4, self.mock_server_get.call_count)
+        self.mock_servers_update_addresses.assert_called_once_with(
+            helpers.IsHttpRequest(), servers)
+
     @helpers.create_mocks({api.nova: ("server_get",
                                       "flavor_get",
                                       'is_feature_available',
@@ -10,6 +10,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import collections
 from collections import namedtuple
 import logging
 from operator import itemgetter
@@ -276,3 +277,48 @@ def resolve_flavor(request, instance, flavors=None, **kwargs):
     else:
         instance.flavor['name'] = instance.flavor['original_name']
         return flavor_from_dict(instance.flavor)
+
+
+def index_volume_attachments(volumes):
+    """Indexes the attachments of volumes by the ID of their server.
+
+    :param volumes: iterable of cinder volumes
+    :return: dict of the attachments of each server sorted by device name
+        (eg '/dev/sda'), so that the first one is the boot volume of
+        instances booted from a volume
+    """
+    attachments = collections.defaultdict(list)
+    for volume in volumes:
+        for attachment in volume.attachments:
+            server_id = attachment.get('server_id')
+            if server_id is not None:
+                attachments[server_id].append(attachment)
+    for server_attachments in attachments.values():
+        server_attachments.sort(key=itemgetter('device'))
+    return dict(attachments)
+
+
+def get_boot_volume_image(instance, volume_dict, attachments, image_dict):
+    """Returns the image a volume booted instance was created from, if any.
+
+    :param instance: instance booted from a volume
+    :param volume_dict: dict of volumes keyed by volume ID
+    :param attachments: attachments indexed by index_volume_attachments
+    :param image_dict: dict of images keyed by image ID
+    """
+    instance_volumes = attachments.get(instance.id)
+    # While instance from volume is being created,
+    # it does not have volumes
+    if not instance_volumes:
+        return None
+    # Getting volume object, which is as attached
+    # as the first device
+    boot_volume = volume_dict.get(instance_volumes[0]['id'])
+    # There is a case where volume_image_metadata contains
+    # only fields other than 'image_id' (See bug 1834747),
+    # so we try to populate image information only when it is found.
+    volume_metadata = getattr(boot_volume, "volume_image_metadata", {})
+    image_id = volume_metadata.get('image_id')
+    # The image is missing from image_dict when the volume was created
+    # from an image which has been deleted since.
+    return image_dict.get(image_id)
@@ -120,13 +120,11 @@ class IndexView(tables.PagedTableMixin, tables.DataTableView):
         if not instances:
             return []
 
-        # TODO(future): Explore more efficient logic to sync IP address
-        # and drop the setting OPENSTACK_INSTANCE_RETRIEVE_IP_ADDRESSES.
         # The situation servers_update_addresses() is needed is only
         # when IP address of a server is updated via neutron API and
-        # nova network info cache is not synced. Precisely there is no
-        # need to check IP addresses of all servers. It is sufficient to
-        # fetch IP address information for servers recently updated.
+        # nova network info cache is not synced. When
+        # OPENSTACK_INSTANCE_IP_ADDRESSES_CACHE_TIMEOUT is set, it only
+        # fetches IP address information for servers recently updated.
         if not settings.OPENSTACK_INSTANCE_RETRIEVE_IP_ADDRESSES:
             return instances
         try:
@@ -152,10 +150,9 @@ class IndexView(tables.PagedTableMixin, tables.DataTableView):
         marker, sort_dir = self._get_marker()
         search_opts = self.get_filters({'marker': marker, 'paginate': True})
 
-        image_dict, flavor_dict, volume_dict = \
-            futurist_utils.call_functions_parallel(
-                self._get_images, self._get_flavors, self._get_volumes
-            )
+        image_dict, flavor_dict = futurist_utils.call_functions_parallel(
+            self._get_images, self._get_flavors
+        )
 
         non_api_filter_info = (
             ('image_name', 'image', image_dict.values()),
@@ -165,11 +162,17 @@ class IndexView(tables.PagedTableMixin, tables.DataTableView):
             self._more = False
             return []
 
-        instances = self._get_instances(search_opts, sort_dir)
+        instances, volume_dict = futurist_utils.call_functions_parallel(
+            (self._get_instances, [search_opts, sort_dir]),
+            self._get_volumes
+        )
+        attachments = instance_utils.index_volume_attachments(
+            volume_dict.values())
 
         # Loop through instances to get flavor info.
         for instance in instances:
-            self._populate_image_info(instance, image_dict, volume_dict)
+            self._populate_image_info(instance, image_dict, volume_dict,
+                                      attachments)
 
             instance.full_flavor = instance_utils.resolve_flavor(self.request,
                                                                  instance,
@@ -177,7 +180,8 @@ class IndexView(tables.PagedTableMixin, tables.DataTableView):
 
         return instances
 
-    def _populate_image_info(self, instance, image_dict, volume_dict):
+    def _populate_image_info(self, instance, image_dict, volume_dict,
+                             attachments):
         if not hasattr(instance, 'image'):
             return
         # Instance from image returns dict
@@ -192,33 +196,10 @@ class IndexView(tables.PagedTableMixin, tables.DataTableView):
                 instance.image['name'] = _("-")
         # Otherwise trying to get image from volume metadata
         else:
-            instance_volumes = [
-                attachment
-                for volume in volume_dict.values()
-                for attachment in volume.attachments
-                if attachment['server_id'] == instance.id
-            ]
-            # While instance from volume is being created,
-            # it does not have volumes
-            if not instance_volumes:
-                return
-            # Sorting attached volumes by device name (eg '/dev/sda')
-            instance_volumes.sort(key=lambda attach: attach['device'])
-            # Getting volume object, which is as attached
-            # as the first device
-            boot_volume = volume_dict[instance_volumes[0]['id']]
-            # There is a case where volume_image_metadata contains
-            # only fields other than 'image_id' (See bug 1834747),
-            # so we try to populate image information only when it is found.
-            volume_metadata = getattr(boot_volume, "volume_image_metadata", {})
-            image_id = volume_metadata.get('image_id')
-            if image_id:
-                try:
-                    instance.image = image_dict[image_id]
-                except KeyError:
-                    # KeyError occurs when volume was created from image and
-                    # then this image is deleted.
-                    pass
+            image = instance_utils.get_boot_volume_image(
+                instance, volume_dict, attachments, image_dict)
+            if image is not None:
+                instance.image = image
 
 
 def process_non_api_filters(search_opts, non_api_filter_info):
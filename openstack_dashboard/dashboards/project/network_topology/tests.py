@@ -14,6 +14,7 @@
 
 from unittest import mock
 
+from django.core.cache import cache
 import django.test
 from django.urls import reverse
 
@@ -56,6 +57,110 @@ class NetworkTopologyTests(test.TestCase):
     def test_json_view_console_disabled(self):
         self._test_json_view(with_console=False)
 
+    @test.create_mocks({api.nova: ('server_list',),
+                        api.neutron: ('network_list_for_tenant',
+                                      'network_list',
+                                      'router_list',
+                                      'port_list')})
+    def test_json_view_not_modified(self):
+        self._test_json_view()
+
+        res = self.client.get(JSON_URL)
+        etag = res['ETag']
+        self.assertEqual(200, res.status_code)
+        self.assertIn('no-cache', res['Cache-Control'])
+
+        res = self.client.get(JSON_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(304, res.status_code)
+        self.assertEqual(b'', res.content)
+        self.assertEqual(etag, res['ETag'])
+        self.assertEqual(3, self.mock_server_list.call_count)
+
+    @django.test.utils.override_settings(NETWORK_TOPOLOGY_CACHE_TIMEOUT=60)
+    @test.create_mocks({api.nova: ('server_list',),
+                        api.neutron: ('network_list_for_tenant',
+                                      'network_list',
+                                      'router_list',
+                                      'port_list')})
+    def test_json_view_cached(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self._test_json_view()
+
+        res = self.client.get(JSON_URL)
+        self.assertEqual(200, res.status_code)
+        res = self.client.get(JSON_URL, HTTP_IF_NONE_MATCH=res['ETag'])
+        self.assertEqual(304, res.status_code)
+        self.mock_server_list.assert_called_once_with(test.IsHttpRequest())
+
+    @django.test.utils.override_settings(NETWORK_TOPOLOGY_DELTA_TIMEOUT=60)
+    @test.create_mocks({api.nova: ('server_list',),
+                        api.neutron: ('network_list_for_tenant',
+                                      'network_list',
+                                      'router_list',
+                                      'port_list')})
+    def test_json_view_delta(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self._test_json_view()
+        version = jsonutils.loads(self.client.get(JSON_URL).content)[
+            'version']
+
+        res = self.client.get(JSON_URL, {'since': version})
+        self.assertEqual(304, res.status_code)
+
+        servers = self.servers.list()
+        servers[0].status = 'SHUTOFF'
+        self.mock_server_list.return_value = [servers[:-1], False]
+        res = self.client.get(JSON_URL, {'since': version})
+        data = jsonutils.loads(res.content)
+
+        self.assertTrue(data['delta'])
+        self.assertNotEqual(version, data['version'])
+        changed_servers = data['changed']['servers']
+        self.assertEqual([servers[0].id],
+                         [server['id'] for server in changed_servers])
+        self.assertEqual('SHUTOFF', changed_servers[0]['original_status'])
+        self.assertEqual([servers[-1].id], data['removed']['servers'])
+        for kind in ('networks', 'ports', 'routers'):
+            self.assertEqual([], data['changed'][kind])
+            self.assertEqual([], data['removed'][kind])
+
+    @django.test.utils.override_settings(NETWORK_TOPOLOGY_DELTA_TIMEOUT=60)
+    @test.create_mocks({api.nova: ('server_list',),
+                        api.neutron: ('network_list_for_tenant',
+                                      'network_list',
+                                      'router_list',
+                                      'port_list')})
+    def test_json_view_delta_unknown_version(self):
+        self._test_json_view()
+
+        res = self.client.get(JSON_URL, {'since': 'unknown'})
+        data = jsonutils.loads(res.content)
+
+        self.assertNotIn('delta', data)
+        self.assertEqual(len(self.servers.list()), len(data['servers']))
+
+    @test.create_mocks({api.nova: ('server_list',),
+                        api.neutron: ('network_list_for_tenant',
+                                      'network_list',
+                                      'router_list',
+                                      'port_list')})
+    def test_json_view_delta_disabled(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self._test_json_view()
+        version = jsonutils.loads(self.client.get(JSON_URL).content)[
+            'version']
+        servers = self.servers.list()
+        self.mock_server_list.return_value = [servers[:-1], False]
+
+        res = self.client.get(JSON_URL, {'since': version})
+        data = jsonutils.loads(res.content)
+
+        self.assertNotIn('delta', data)
+        self.assertEqual(len(servers) - 1, len(data['servers']))
+
     def _test_json_view(self, router_enable=True, with_console=True):
         self.mock_server_list.return_value = [self.servers.list(), False]
 
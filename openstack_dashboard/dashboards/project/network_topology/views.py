@@ -16,12 +16,20 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import hashlib
 import json
+import logging
 
 from django.conf import settings
+from django.core.cache import cache
 from django.http import HttpResponse
+from django.http import HttpResponseNotModified
 from django.urls import reverse
 from django.urls import reverse_lazy
+from django.utils.cache import get_conditional_response
+from django.utils.cache import patch_cache_control
+from django.utils.http import quote_etag
+from django.utils import translation
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import View
 
@@ -77,6 +85,8 @@ from openstack_dashboard import policy
 from openstack_dashboard.utils import futurist_utils
 from openstack_dashboard.utils import settings as setting_utils
 
+LOG = logging.getLogger(__name__)
+
 # List of known server statuses that wont connect to the console
 console_invalid_status = {
     'shutoff', 'suspended', 'resize', 'verify_resize',
@@ -217,13 +227,6 @@ class JSONView(View):
                 continue
             resource['url'] = reverse(view, None, [str(resource['id'])])
 
-    def _check_router_external_port(self, ports, router_id, network_id):
-        for port in ports:
-            if (port['network_id'] == network_id and
-                    port['device_id'] == router_id):
-                return True
-        return False
-
     def _get_servers(self, request):
         # Get nova data
         try:
@@ -232,10 +235,11 @@ class JSONView(View):
             servers = []
         data = []
         console_type = settings.CONSOLE_TYPE
+        # The rule does not depend on the server, check it once for all.
+        allow_delete_server = policy.check(
+            (("compute", "os_compute_api:servers:delete"),), request)
         # lowercase of the keys will be used at the end of the console URL.
         for server in servers:
-            allow_delete_server = policy.check(
-                (("compute", "os_compute_api:servers:delete"),), request)
             server_data = {'name': server.name,
                            'status': self.trans.instance[server.status],
                            'original_status': server.status,
@@ -273,19 +277,20 @@ class JSONView(View):
         except Exception:
             neutron_networks = []
         networks = []
+        # The rules only depend on the project of the network, so they are
+        # checked once per project.
+        allowed_deletes = {}
         for network in neutron_networks:
-            allow_delete_subnet = policy.check(
-                (("network", "delete_subnet"),),
-                request,
-                target={'network:tenant_id': getattr(network,
-                                                     'tenant_id', None)}
-            )
-            allow_delete_network = policy.check(
-                (("network", "delete_network"),),
-                request,
-                target={'network:tenant_id': getattr(network,
-                                                     'tenant_id', None)}
-            )
+            tenant_id = getattr(network, 'tenant_id', None)
+            if tenant_id not in allowed_deletes:
+                target = {'network:tenant_id': tenant_id}
+                allowed_deletes[tenant_id] = (
+                    policy.check((("network", "delete_subnet"),),
+                                 request, target=target),
+                    policy.check((("network", "delete_network"),),
+                                 request, target=target))
+            allow_delete_subnet, allow_delete_network = \
+                allowed_deletes[tenant_id]
             obj = {'name': network.name_or_id,
                    'id': network.id,
                    'subnets': [{'id': subnet.id,
@@ -308,7 +313,7 @@ class JSONView(View):
                     **{'router:external': True})
             except Exception:
                 neutron_public_networks = []
-            my_network_ids = [net['id'] for net in networks]
+            my_network_ids = {net['id'] for net in networks}
             for publicnet in neutron_public_networks:
                 if publicnet.id in my_network_ids:
                     continue
@@ -364,7 +369,7 @@ class JSONView(View):
     def _filter_ports(self, neutron_ports, networks):
         # we should filter out ports connected to non tenant networks
         # which they have no visibility to
-        tenant_network_ids = [network['id'] for network in networks]
+        tenant_network_ids = {network['id'] for network in networks}
         ports = [{'id': port.id,
                   'network_id': port.network_id,
                   'device_id': port.device_id,
@@ -382,6 +387,8 @@ class JSONView(View):
     def _prepare_gateway_ports(self, routers, ports):
         # user can't see port on external network. so we are
         # adding fake port based on router information
+        router_ports = {(port['device_id'], port['network_id'])
+                        for port in ports}
         for router in routers:
             external_gateway_info = router.get('external_gateway_info')
             if not external_gateway_info:
@@ -390,9 +397,7 @@ class JSONView(View):
                 'network_id')
             if not external_network:
                 continue
-            if self._check_router_external_port(ports,
-                                                router['id'],
-                                                external_network):
+            if (router['id'], external_network) in router_ports:
                 continue
             fake_port = {'id': 'gateway%s' % external_network,
                          'network_id': external_network,
@@ -400,7 +405,7 @@ class JSONView(View):
                          'fixed_ips': []}
             ports.append(fake_port)
 
-    def get(self, request, *args, **kwargs):
+    def _get_topology(self, request):
         results = futurist_utils.call_functions_parallel(
             (self._get_networks, [request]),
             (self._get_servers, [request]),
@@ -413,6 +418,115 @@ class JSONView(View):
                 'ports': self._filter_ports(ports, networks),
                 'routers': routers}
         self._prepare_gateway_ports(data['routers'], data['ports'])
-        json_string = json.dumps(data, cls=LazyTranslationEncoder,
-                                 ensure_ascii=False)
-        return HttpResponse(json_string, content_type='text/json')
+        return json.dumps(data, cls=LazyTranslationEncoder,
+                          ensure_ascii=False)
+
+    def _get_cache_key(self, request, version=None):
+        # The policy checks depend on the user and the statuses are
+        # translated.
+        cache_key = 'openstack_dashboard.network_topology:%s:%s:%s:%s:%s' % (
+            request.user.endpoint, request.user.services_region,
+            request.user.project_id, request.user.id,
+            translation.get_language())
+        if version is not None:
+            cache_key = '%s:%s' % (cache_key, version)
+        return cache_key
+
+    def _cache_get(self, cache_key):
+        try:
+            return cache.get(cache_key)
+        except Exception:
+            LOG.exception('Unable to read the network topology from the '
+                          'cache.')
+            return None
+
+    def _cache_set(self, cache_key, value, timeout):
+        try:
+            cache.set(cache_key, value, timeout)
+        except Exception:
+            LOG.exception('Unable to store the network topology in the '
+                          'cache.')
+
+    def _get_snapshot(self, request):
+        """Returns the version and the resources of the topology.
+
+        The version is a hash of the resources. When
+        ``NETWORK_TOPOLOGY_CACHE_TIMEOUT`` is set, the snapshot is kept in
+        the cache and the topology is only built again once it expires. When
+        ``NETWORK_TOPOLOGY_DELTA_TIMEOUT`` is set, each version is also kept
+        to compute the changes made since then.
+        """
+        timeout = settings.NETWORK_TOPOLOGY_CACHE_TIMEOUT
+        if timeout:
+            snapshot = self._cache_get(self._get_cache_key(request))
+            if snapshot is not None:
+                return snapshot
+
+        json_string = self._get_topology(request)
+        version = hashlib.sha256(json_string.encode('utf-8')).hexdigest()
+        snapshot = (version, json.loads(json_string))
+        if timeout:
+            self._cache_set(self._get_cache_key(request), snapshot, timeout)
+        delta_timeout = settings.NETWORK_TOPOLOGY_DELTA_TIMEOUT
+        if delta_timeout:
+            self._cache_set(self._get_cache_key(request, version),
+                            snapshot[1], delta_timeout)
+        return snapshot
+
+    def _get_delta(self, previous, topology):
+        """Returns the resources changed and removed between two snapshots.
+
+        The resources are keyed by ID within each kind of resource.
+        """
+        changed = {}
+        removed = {}
+        for kind, resources in topology.items():
+            previous_resources = {resource['id']: resource
+                                  for resource in previous.get(kind, [])}
+            changed[kind] = [
+                resource for resource in resources
+                if previous_resources.get(resource['id']) != resource]
+            ids = {resource['id'] for resource in resources}
+            removed[kind] = [resource_id for resource_id in previous_resources
+                             if resource_id not in ids]
+        return {'changed': changed, 'removed': removed}
+
+    def get(self, request, *args, **kwargs):
+        """Returns the topology, or its changes since a previous version.
+
+        The ``version`` of the topology is returned with its resources. When
+        it is passed back with the ``since`` query parameter, only the
+        resources changed (added or updated) and the IDs of the resources
+        removed since then are returned, along with ``delta: true``, or 304
+        (Not Modified) if the topology did not change. The whole topology is
+        returned when that version is no longer known.
+        """
+        version, topology = self._get_snapshot(request)
+        since = request.GET.get('since')
+        if since and since != version:
+            previous = None
+            if settings.NETWORK_TOPOLOGY_DELTA_TIMEOUT:
+                previous = self._cache_get(
+                    self._get_cache_key(request, since))
+            if previous is not None:
+                data = self._get_delta(previous, topology)
+                data.update({'version': version, 'delta': True})
+                response = HttpResponse(
+                    json.dumps(data, ensure_ascii=False),
+                    content_type='text/json')
+                patch_cache_control(response, no_cache=True, private=True)
+                return response
+
+        etag = quote_etag(version)
+        if since == version:
+            response = HttpResponseNotModified()
+        else:
+            response = get_conditional_response(request, etag=etag)
+        if response is None:
+            data = dict(topology, version=version)
+            response = HttpResponse(json.dumps(data, ensure_ascii=False),
+                                    content_type='text/json')
+        response['ETag'] = etag
+        # Browsers have to check that the topology did not change every time.
+        patch_cache_control(response, no_cache=True, private=True)
+        return response
@@ -104,6 +104,8 @@ class CreatePort(tables.LinkAction):
 
 
 class DeletePort(policy.PolicyTargetMixin, tables.DeleteAction):
+    max_concurrency = 5
+
     @staticmethod
     def action_present(count):
         return ngettext_lazy(
@@ -44,14 +44,16 @@ class UsageViewTests(test.TestCase):
     def _stub_api_calls(self, nova_stu_enabled=True,
                         stu_exception=False, overview_days_range=1,
                         quota_usage_overrides=None,
-                        quota_extension_support=True):
+                        quota_extension_support=True,
+                        quota_usage_unknown=None):
         self.mock_is_quotas_extension_supported.return_value = \
             quota_extension_support
         if nova_stu_enabled:
             self._nova_stu_enabled(stu_exception,
                                    overview_days_range=overview_days_range)
 
-        self._stub_tenant_quota_usages(overrides=quota_usage_overrides)
+        self._stub_tenant_quota_usages(overrides=quota_usage_overrides,
+                                       unknown=quota_usage_unknown)
 
     def _check_api_calls(self, nova_stu_enabled=True,
                          stu_exception=False, overview_days_range=1):
@@ -74,7 +76,7 @@ class UsageViewTests(test.TestCase):
             usages.add_quota(api.base.Quota(k, quota))
             usages.tally(k, quota_usages[k]['used'])
 
-    def _stub_tenant_quota_usages(self, overrides):
+    def _stub_tenant_quota_usages(self, overrides, unknown=None):
         usages_data = usage.quotas.QuotaUsage()
         self._add_quota_usages(usages_data, self.quota_usages.first(),
                                # At now, nova quota_usages contains
@@ -89,6 +91,10 @@ class UsageViewTests(test.TestCase):
                     usages_data.add_quota(api.base.Quota(key, value['quota']))
                 if 'used' in value:
                     usages_data.tally(key, value['used'])
+        if unknown:
+            for key in unknown:
+                usages_data.usages.pop(key, None)
+            usages_data.unknown.update(unknown)
         self.mock_tenant_quota_usages.return_value = usages_data
 
     def _check_tenant_quota_usages(self):
@@ -261,10 +267,12 @@ class UsageViewTests(test.TestCase):
     # nova_stu_enable=False is specified below, so we need this.
     @override_settings(OPENSTACK_USE_SIMPLE_TENANT_USAGE=False)
     def _test_usage_charts(self, quota_usage_overrides=None,
-                           quota_extension_support=True):
+                           quota_extension_support=True,
+                           quota_usage_unknown=None):
         self._stub_api_calls(nova_stu_enabled=False,
                              quota_usage_overrides=quota_usage_overrides,
-                             quota_extension_support=quota_extension_support)
+                             quota_extension_support=quota_extension_support,
+                             quota_usage_unknown=quota_usage_unknown)
 
         res = self.client.get(reverse('horizon:project:overview:index'))
 
@@ -316,6 +324,21 @@ class UsageViewTests(test.TestCase):
         self.assertEqual(['Compute', 'Volume'],
                          [c['title'] for c in charts])
 
+    def test_usage_charts_unknown_quota(self):
+        res = self._test_usage_charts(
+            quota_usage_unknown=('volumes', 'snapshots', 'gigabytes'))
+        charts = res.context['charts']
+
+        volume_charts = [c for c in charts if c['title'] == 'Volume'][0]
+        self.assertEqual(
+            [{'type': 'volumes', 'name': 'Volumes', 'unknown': True},
+             {'type': 'snapshots', 'name': 'Volume Snapshots',
+              'unknown': True},
+             {'type': 'gigabytes', 'name': 'Volume Storage',
+              'unknown': True}],
+            volume_charts['charts'])
+        self.assertContains(res, 'Unknown', 3)
+
     def test_usage_charts_infinite_quota(self):
         res = self._test_usage_charts(
             quota_usage_overrides={'floatingip': {'quota': -1}})
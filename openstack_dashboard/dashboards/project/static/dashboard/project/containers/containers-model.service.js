@@ -307,8 +307,8 @@
      * We first delete all files and then delete the folders in a
      * structured manner to avoid the "not empty" error.
      *
-     * Note that we fire off all the deletes here; browsers automatically
-     * throttle HTTP calls for us.
+     * The files are deleted with a single request, the server deleting
+     * them in bulk.
      */
     function recursiveDelete(state, node) {
       return model._recursiveDeleteFiles(state, node).then(function () {
@@ -318,13 +318,27 @@
 
     // Just delete the files
     function recursiveDeleteFiles(state, node) {
-      if (angular.isObject(node)) {
-        return $q.all(node.tree.map(function each(subnode) {
-          return recursiveDeleteFiles(state, subnode);
-        }));
-      } else {
-        return swiftAPI.deleteObject(model.container.name, node).then(
-          function done() { state.deleted.files++; });
+      var files = [];
+      collectFiles(node);
+      if (!files.length) {
+        return $q.when();
+      }
+      return swiftAPI.deleteObjects(model.container.name, files).then(
+        function done(response) {
+          var failures = files.length;
+          if (angular.isDefined(response)) {
+            failures = Object.keys(response.data.failures).length;
+          }
+          state.deleted.files += files.length - failures;
+          state.deleted.failures += failures;
+        });
+
+      function collectFiles(subnode) {
+        if (angular.isObject(subnode)) {
+          subnode.tree.forEach(collectFiles);
+        } else {
+          files.push(subnode);
+        }
       }
     }
 
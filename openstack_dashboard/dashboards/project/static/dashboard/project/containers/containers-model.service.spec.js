@@ -325,17 +325,18 @@
 
       it('should recursively delete files', function test() {
         var deletions = [];
-        var state = {deleted: {files: 0}};
-        spyOn(swiftAPI, 'deleteObject').and.callFake(function fake(container, node) {
+        var state = {deleted: {files: 0, failures: 0}};
+        spyOn(swiftAPI, 'deleteObjects').and.callFake(function fake(container, names) {
           var deferred = $q.defer();
-          deletions.push(node);
-          deferred.resolve();
+          deletions = names;
+          deferred.resolve({data: {deleted: 4, failures: {'folder/file2': '409 Conflict'}}});
           return deferred.promise;
         });
 
         service._recursiveDeleteFiles(state, {tree: fakeTree});
         $rootScope.$apply();
 
+        expect(swiftAPI.deleteObjects.calls.count()).toEqual(1);
         expect(deletions).toEqual([
           'file0',
           'folder/subfolder/file3',
@@ -343,7 +344,19 @@
           'folder/file1',
           'folder/file2'
         ]);
-        expect(state.deleted.files).toEqual(5);
+        expect(state.deleted.files).toEqual(4);
+        expect(state.deleted.failures).toEqual(1);
+      });
+
+      it('should count files as failed when the deletion fails', function test() {
+        var state = {deleted: {files: 0, failures: 0}};
+        spyOn(swiftAPI, 'deleteObjects').and.returnValue($q.when());
+
+        service._recursiveDeleteFiles(state, {tree: fakeTree});
+        $rootScope.$apply();
+
+        expect(state.deleted.files).toEqual(0);
+        expect(state.deleted.failures).toEqual(5);
       });
 
       // oh gods what have I wrought
@@ -99,6 +99,7 @@ class DeleteVolume(VolumePolicyTargetMixin, tables.DeleteAction):
     help_text = _("Deleted volumes are not recoverable. "
                   "All data stored in the volume will be removed.")
     default_message_level = "info"
+    max_concurrency = 5
 
     @staticmethod
     def action_present(count):
@@ -667,10 +668,10 @@ class AttachmentsTable(tables.DataTable):
         return _("Volume %(volume_name)s on instance %(instance_name)s") % vals
 
     def get_object_by_id(self, obj_id):
-        for obj in self.data:
-            if obj['attachment_id'] == obj_id:
-                return obj
-        raise ValueError('No match found for the id "%s".' % obj_id)
+        try:
+            return super().get_object_by_id(obj_id)
+        except exceptions.Http302:
+            raise ValueError('No match found for the id "%s".' % obj_id)
 
     class Meta(object):
         name = "attachments"
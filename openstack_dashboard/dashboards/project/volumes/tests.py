@@ -13,6 +13,7 @@
 #    under the License.
 
 import copy
+import threading
 from unittest import mock
 from urllib import parse
 
@@ -100,6 +101,45 @@ class VolumeIndexViewTests(test.ResetImageAPIVersionMixin, test.TestCase):
     def test_index_with_volume_groups(self):
         self._test_index(with_groups=True)
 
+    @override_settings(OPENSTACK_QUOTA_USAGES_TIMEOUTS={'volume': 0.1})
+    @test.create_mocks({
+        api.nova: ['server_list'],
+        api.cinder: ['volume_backup_supported',
+                     'volume_snapshot_list',
+                     'volume_list_paged',
+                     'tenant_absolute_limits',
+                     'is_volume_service_enabled',
+                     'group_list'],
+    })
+    def test_index_volume_quotas_timeout(self):
+        event = threading.Event()
+        self.addCleanup(event.set)
+        volumes = self.cinder_volumes.list()
+        for volume in volumes:
+            volume.attachments = []
+        self.mock_volume_backup_supported.return_value = False
+        self.mock_volume_list_paged.return_value = [volumes, False, False]
+        self.mock_server_list.return_value = [[], False]
+        self.mock_volume_snapshot_list.return_value = []
+        self.mock_group_list.return_value = []
+        self.mock_tenant_absolute_limits.return_value = \
+            self.cinder_limits['absolute']
+        # The volume quota usages are not retrieved in time.
+        self.mock_is_volume_service_enabled.side_effect = \
+            lambda *args: event.wait(5)
+
+        res = self.client.get(INDEX_URL)
+
+        self.assertEqual(res.status_code, 200)
+        # The actions checking the volume quotas are not blocked.
+        self.assertContains(
+            res, reverse('horizon:project:volumes:accept_transfer'))
+        table = res.context['volumes_table']
+        accept_transfer = table.base_actions['accept_transfer']
+        self.assertNotIn('disabled', accept_transfer.classes)
+        self.mock_is_volume_service_enabled.assert_called_with(
+            test.IsHttpRequest())
+
     @test.create_mocks({
         api.nova: ['server_list'],
         api.cinder: ['volume_backup_supported',
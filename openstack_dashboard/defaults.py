@@ -209,6 +209,12 @@ FILTER_DATA_FIRST = {
 # image form. If set to 'off', there will be no file form field on the create
 # image form. See documentation for deployment considerations.
 HORIZON_IMAGES_UPLOAD_MODE = 'legacy'
+# The number of images whose data is uploaded to glance at the same time by
+# each horizon process in the 'legacy' upload mode. Further uploads wait for a
+# free worker, with their data in a temporary file.
+HORIZON_IMAGES_UPLOAD_MAX_WORKERS = 4
+# The time in seconds the status of a finished image upload is kept.
+HORIZON_IMAGES_UPLOAD_STATUS_TIMEOUT = 600
 # Allow a location to be set when creating or updating Glance images.
 # If using Glance V2, this value should be False unless the Glance
 # configuration and policies allow setting locations.
@@ -268,6 +274,13 @@ OPENSTACK_CLOUDS_YAML_CUSTOM_TEMPLATE = ('project/api_access/'
 # of data fetched by default when rendering the Overview panel.
 OVERVIEW_DAYS_RANGE = 1
 
+# The number of threads of the pool shared by the requests of a process to
+# call APIs in parallel. ``0`` makes the calls run one after another.
+PARALLEL_EXECUTOR_MAX_WORKERS = 10
+# The maximum number of threads of the pool used by a set of parallel calls.
+# The thread serving the request runs the other calls.
+PARALLEL_EXECUTOR_MAX_WORKERS_PER_CALL = 4
+
 # Projects and users can have extra attributes as defined by keystone v3.
 # Horizon has the ability to display these extra attributes via this setting.
 # If you'd like to display extra data in the project or user tables, set the
@@ -319,6 +332,17 @@ SWIFT_FILE_TRANSFER_CHUNK_SIZE = 512 * 1024
 # name to be rendered.
 SWIFT_STORAGE_POLICY_DISPLAY_NAMES = {}
 
+# Objects larger than SWIFT_UPLOAD_SEGMENT_SIZE bytes are uploaded in segments
+# of this size, followed by a Static Large Object manifest. 0 disables the
+# segmented uploads.
+SWIFT_UPLOAD_SEGMENT_SIZE = 0
+# The size of the thread pool uploading the segments of objects in parallel.
+# 0 uploads them one after the other.
+SWIFT_UPLOAD_SEGMENT_WORKERS = 4
+# The number of objects deleted in parallel when swift does not support bulk
+# deletes.
+SWIFT_DELETE_WORKERS = 10
+
 # Perform full listing of containers and objects in the Swift
 # panel. Defaults to True.
 #
@@ -345,6 +369,16 @@ OPENSTACK_API_VERSIONS = {
     "compute": 2,
 }
 
+# The number of seconds the microversions supported by the compute and volume
+# endpoints are shared by the requests of a process. Once expired, they are
+# retrieved again in the background. ``0`` retrieves them on every request.
+OPENSTACK_API_VERSION_CACHE_TIMEOUT = 600
+
+# The maximum number of connections kept open to each API endpoint host and
+# shared by the requests of a process. ``0`` makes each request open its own
+# connections.
+OPENSTACK_HTTP_POOL_MAXSIZE = 10
+
 # OPENSTACK_ENDPOINT_TYPE specifies the endpoint type to use for the endpoints
 # in the Keystone service catalog. Use this setting when Horizon is running
 # external to the OpenStack environment. The default is 'publicURL'.
@@ -475,6 +509,30 @@ OPENSTACK_NEUTRON_NETWORK = {
 # a performance issue in the project instance table in large deployments.
 OPENSTACK_INSTANCE_RETRIEVE_IP_ADDRESSES = True
 
+# The number of seconds the IP addresses of servers retrieved from neutron
+# are kept in the default cache. Neutron is then only queried for the servers
+# updated since their addresses were cached. ``0`` disables the cache.
+OPENSTACK_INSTANCE_IP_ADDRESSES_CACHE_TIMEOUT = 0
+
+# The number of seconds the JSON of the network topology of a user is kept in
+# the default cache and served to the polls of the topology page, which can
+# then be out of date for as long. ``0`` disables the cache. Polls get a 304
+# (Not Modified) response whenever the topology did not change.
+NETWORK_TOPOLOGY_CACHE_TIMEOUT = 0
+
+# The number of seconds each version of the network topology of a user is
+# kept in the default cache, so that the polls of the topology page only get
+# the resources changed since the version they last got. It needs to be longer
+# than the polling interval of 10 seconds, 60 for example. ``0`` disables the
+# deltas.
+NETWORK_TOPOLOGY_DELTA_TIMEOUT = 0
+
+# The number of seconds to wait for the quota usages of each service, keyed by
+# 'compute', 'network' and 'volume'. The quotas of a service which does not
+# answer in time are reported as unknown instead of blocking the page.
+# e.g. {'compute': 5, 'network': 5, 'volume': 5}
+OPENSTACK_QUOTA_USAGES_TIMEOUTS = {}
+
 # This setting controls whether SimpleTenantUsage nova API is used in the usage
 # overview. According to feedbacks to the horizon team, the usage of
 # SimpleTenantUsage can cause performance issues in the nova API in larger
@@ -40,6 +40,7 @@
       createFolder: createFolder,
       deleteContainer: deleteContainer,
       deleteObject: deleteObject,
+      deleteObjects: deleteObjects,
       getContainer: getContainer,
       getContainers: getContainers,
       getInfo: getInfo,
@@ -280,6 +281,25 @@
       });
     }
 
+    /**
+     * @name deleteObjects
+     * @param {Object} container - The container
+     * @param {Array} names - The names of the objects to delete
+     * @description
+     * Delete several objects (or pseudo-folders) with a single request.
+     * Pseudo-folder names *must* end in a DELIMETER ("/" usually), all
+     * their contents are deleted along with them.
+     * @returns {Object} The result of the API call, with the number of
+     * objects deleted and the errors of the others by name
+     *
+     */
+    function deleteObjects(container, names) {
+      return apiService.delete(service.getContainerURL(container) + '/objects/', names)
+        .catch(function onError() {
+          toastService.add('error', gettext('Unable to delete the objects.'));
+        });
+    }
+
     /**
      * @name getObjectDetails
      * @param {Object} container - The container
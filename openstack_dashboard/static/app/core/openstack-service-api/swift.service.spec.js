@@ -139,6 +139,14 @@
         error: 'Unable to delete the object.',
         testInput: [ 'spam', 'ham' ]
       },
+      {
+        func: 'deleteObjects',
+        method: 'delete',
+        path: '/api/swift/containers/spam/objects/',
+        data: [ 'ham', 'eggs/' ],
+        error: 'Unable to delete the objects.',
+        testInput: [ 'spam', [ 'ham', 'eggs/' ] ]
+      },
       {
         func: 'getObjectDetails',
         method: 'get',
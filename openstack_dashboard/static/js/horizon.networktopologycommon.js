@@ -44,16 +44,65 @@ horizon.networktopologyloader = {
    */
   update:function() {
     var self = this;
-    angular.element.getJSON(
-      angular.element('#networktopology').data('networktopology') + '?' + angular.element.now(),
-      function(data) {
-        self.model = data;
-        $('#networktopology').trigger('change');
+    // Once the topology is loaded, only the changes made since its version
+    // are requested. The server answers with 304 (Not Modified) when there
+    // are none.
+    angular.element.ajax({
+      url: angular.element('#networktopology').data('networktopology'),
+      data: self.model ? {since: self.model.version} : {},
+      dataType: 'json',
+      cache: false,
+      success: function(data, status) {
+        if (status !== 'notmodified') {
+          if (data.delta) {
+            self.apply_delta(data);
+          } else {
+            self.model = data;
+          }
+          $('#networktopology').trigger('change');
+        }
         self.update_timer = setTimeout(function(){
           self.update();
         }, self.reload_duration);
       }
-    );
+    });
+  },
+
+  /**
+   * applies the resources changed and removed since the version of the model
+   */
+  apply_delta:function(delta) {
+    var self = this;
+    angular.forEach(delta.changed, function(resources, kind) {
+      var removed = delta.removed[kind] || [];
+      var changed = {};
+      angular.forEach(resources, function(resource) {
+        changed[resource.id] = resource;
+      });
+      var updated = [];
+      angular.forEach(self.model[kind], function(resource) {
+        if (removed.indexOf(resource.id) !== -1) {
+          return;
+        }
+        if (changed.hasOwnProperty(resource.id)) {
+          updated.push(changed[resource.id]);
+          delete changed[resource.id];
+        } else {
+          updated.push(resource);
+        }
+      });
+      angular.forEach(resources, function(resource) {
+        if (changed.hasOwnProperty(resource.id)) {
+          updated.push(resource);
+        }
+      });
+      self.model[kind] = updated;
+    });
+    // external networks are listed first
+    self.model.networks.sort(function(a, b) {
+      return (b['router:external'] ? 1 : 0) - (a['router:external'] ? 1 : 0);
+    });
+    self.model.version = delta.version;
   },
 
   /**
@@ -42,6 +42,7 @@ from horizon import conf
 from horizon import exceptions
 from horizon.test import helpers as horizon_helpers
 from openstack_dashboard import api
+from openstack_dashboard.api import microversions
 from openstack_dashboard import context_processors
 from openstack_dashboard.test.test_data import utils as test_utils
 
@@ -210,6 +211,7 @@ class TestCase(horizon_helpers.TestCase):
         context_processors.openstack = lambda request: self.context
 
         self.patchers = _apply_panel_mocks()
+        microversions.clear_version_ranges()
 
         super().setUp()
 
@@ -56,6 +56,31 @@ class ImagesRestTestCase(test.ResetImageAPIVersionMixin, test.RestAPITestCase):
         self.assertEqual(response.json, {"a": "1", "b": "2"})
         self.mock_image_get.assert_called_once_with(request, "1")
 
+    @test.create_mocks({api.glance: ['image_upload_get']})
+    def test_image_upload_get(self):
+        request = self.mock_rest_request()
+        upload = api.glance.ImageUpload('1', 'project', size=10)
+        upload.uploaded = 4
+        upload.status = 'uploading'
+        self.mock_image_upload_get.return_value = upload
+
+        response = glance.ImageUpload().get(request, '1')
+        self.assertStatusCode(response, 200)
+        self.assertEqual(response.json, {'image_id': '1',
+                                         'status': 'uploading',
+                                         'size': 10,
+                                         'uploaded': 4,
+                                         'error': None})
+        self.mock_image_upload_get.assert_called_once_with(request, '1')
+
+    @test.create_mocks({api.glance: ['image_upload_get']})
+    def test_image_upload_get_not_found(self):
+        request = self.mock_rest_request()
+        self.mock_image_upload_get.return_value = None
+
+        response = glance.ImageUpload().get(request, '1')
+        self.assertStatusCode(response, 404)
+
     @test.create_mocks({api.glance: ['image_update_properties']})
     def test_image_edit_metadata(self):
         request = self.mock_rest_request(
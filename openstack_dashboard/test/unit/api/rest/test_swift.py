@@ -189,6 +189,39 @@ class SwiftRestTestCase(test.RestAPITestCase):
             'container one%\u6346', prefix='test folder%\u6346/'
         )
 
+    @test.create_mocks({api.swift: ['swift_filter_objects']})
+    def test_objects_get_filter(self):
+        request = self.mock_rest_request(GET={'path': 'test folder%\u6346/',
+                                              'filter': 'test*',
+                                              'marker': 'a',
+                                              'limit': '10'})
+        self.mock_swift_filter_objects.return_value = (
+            self.subfolder.list(), 'b')
+
+        response = swift.Objects().get(request, 'container')
+
+        self.assertStatusCode(response, 200)
+        self.assertEqual(1, len(response.json['items']))
+        self.assertEqual('b', response.json['marker'])
+        self.mock_swift_filter_objects.assert_called_once_with(
+            request, 'test*', 'container', prefix='test folder%\u6346/',
+            marker='a', limit=10)
+
+    @test.create_mocks({api.swift: ['swift_delete_objects']})
+    def test_objects_delete(self):
+        request = self.mock_rest_request(body='["test.txt", "folder/"]')
+        self.mock_swift_delete_objects.return_value = (
+            3, {'test.txt': '409 Conflict'})
+
+        response = swift.Objects().delete(request, 'container')
+
+        self.assertStatusCode(response, 200)
+        self.assertEqual({'deleted': 3,
+                          'failures': {'test.txt': '409 Conflict'}},
+                         response.json)
+        self.mock_swift_delete_objects.assert_called_once_with(
+            request, 'container', ['test.txt', 'folder/'])
+
     @test.create_mocks({api.swift: ['swift_get_object']})
     def test_object_get(self):
         request = self.mock_rest_request()
@@ -234,6 +267,24 @@ class SwiftRestTestCase(test.RestAPITestCase):
         self.mock_swift_upload_object.assert_called_once_with(
             request, 'spam', 'test_object%\u6346', _file)
 
+    @test.create_mocks({api.swift: ['swift_upload_object'],
+                        swift: ['UploadObjectForm']})
+    def test_object_create_streamed(self):
+        request = self.mock_rest_request(
+            content_type='application/octet-stream',
+            META={'CONTENT_LENGTH': '10'},
+            GET={'filename': 'data.bin'})
+        self.mock_swift_upload_object.return_value = self.objects.first()
+
+        response = swift.Object().post(request, 'spam', 'folder/obj')
+
+        self.assertStatusCode(response, 201)
+        self.mock_UploadObjectForm.assert_not_called()
+        object_file = self.mock_swift_upload_object.call_args[0][3]
+        self.assertIs(request, object_file.file)
+        self.assertEqual('data.bin', object_file.name)
+        self.assertEqual(10, object_file.size)
+
     @test.create_mocks({api.swift: ['swift_create_pseudo_folder'],
                         swift: ['UploadObjectForm']})
     def test_folder_create(self):
@@ -16,6 +16,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import urllib.request
+
+from django.test.utils import override_settings
+import requests
+
 from horizon import exceptions
 
 from openstack_dashboard.api import base as api_base
@@ -319,6 +324,44 @@ class ApiHelperTests(test.APITestCase):
             url = api_base.url_for(self.request, 'image')
 
 
+class HttpSessionTests(test.TestCase):
+
+    def test_get_http_session_shared_per_host(self):
+        http_session = api_base.get_http_session(
+            'https://nova.example.com:8774/v2.1')
+        self.assertIs(http_session, api_base.get_http_session(
+            'https://nova.example.com:8774/v2.1/servers'))
+        self.assertIsNot(http_session, api_base.get_http_session(
+            'https://cinder.example.com:8776/v3'))
+        adapter = http_session.get_adapter('https://nova.example.com:8774')
+        self.assertEqual(10, adapter._pool_maxsize)
+
+    def test_get_http_session_no_cookies(self):
+        http_session = api_base.get_http_session(
+            'https://nova.example.com:8774/v2.1')
+        cookie = requests.cookies.create_cookie(
+            'lb', 'backend-1', domain='nova.example.com')
+        self.assertFalse(http_session.cookies._policy.set_ok(
+            cookie, urllib.request.Request('https://nova.example.com:8774')))
+
+    @override_settings(OPENSTACK_HTTP_POOL_MAXSIZE=0)
+    def test_get_http_session_disabled(self):
+        self.assertIsNone(api_base.get_http_session(
+            'https://nova.example.com:8774/v2.1'))
+
+    def test_clients_share_http_session(self):
+        http_session = api_base.get_http_session(
+            api_base.url_for(self.request, 'volumev3'))
+        self.assertIs(http_session,
+                      cinder.cinderclient(self.request).client.session.session)
+
+        http_session = api_base.get_http_session(
+            api_base.url_for(self.request, 'image'))
+        self.assertIs(http_session,
+                      glance.glanceclient(self.request).http_client.session
+                      .session)
+
+
 class QuotaSetTests(test.TestCase):
 
     def test_quotaset_add_with_plus(self):
@@ -460,6 +460,18 @@ class CinderApiTests(test.APIMockTestCase):
         api.cinder.message_list(self.request, search_opts=search_opts)
         messages_mock.assert_called_once_with(search_opts)
 
+    @mock.patch.object(api.cinder.cinder_client, 'get_server_version')
+    def test_get_microversion_cached(self, mock_get_server_version):
+        mock_get_server_version.return_value = (
+            api.cinder.api_versions.APIVersion('3.0'),
+            api.cinder.api_versions.APIVersion('3.60'))
+
+        for i in range(2):
+            ret = api.cinder.get_microversion(self.request, 'groups')
+            self.assertEqual('3.58', ret.get_string())
+        mock_get_server_version.assert_called_once_with(
+            api.base.url_for(self.request, 'volumev3'), False, None)
+
 
 class CinderApiVersionTests(test.TestCase):
 
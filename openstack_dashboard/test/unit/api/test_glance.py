@@ -16,10 +16,14 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import io
+import os
 from unittest import mock
 
 from django.conf import settings
+from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.test.utils import override_settings
+import futurist
 
 from openstack_dashboard import api
 from openstack_dashboard.api import base
@@ -365,6 +369,71 @@ class GlanceApiTests(test.APIMockTestCase):
     def test_image_create_v2_external_upload(self):
         self._test_image_create_external_upload()
 
+    def _create_image_with_data(self, mock_glanceclient, upload):
+        self.addCleanup(api.glance._IMAGE_UPLOADS.clear)
+        expected_image = self.images.first()
+        glanceclient = mock_glanceclient.return_value
+        glanceclient.images.create.return_value = expected_image
+        glanceclient.images.upload.side_effect = upload
+        data = InMemoryUploadedFile(io.BytesIO(b'image data'), 'data',
+                                    'image.iso', 'application/octet-stream',
+                                    10, None)
+
+        image = api.glance.image_create(self.request, data=data)
+
+        self.assertEqual(expected_image.id, image.id)
+        glanceclient.images.upload.assert_called_once_with(
+            expected_image.id, mock.ANY)
+        return api.glance.image_upload_get(self.request, expected_image.id)
+
+    @mock.patch.object(api.glance, '_get_upload_executor',
+                       return_value=futurist.SynchronousExecutor())
+    @mock.patch.object(api.glance, 'glanceclient')
+    def test_image_create_upload(self, mock_glanceclient, mock_executor):
+        uploaded = []
+
+        def upload(image_id, image_data):
+            # The data is streamed from a temporary file, not from memory.
+            filename = image_data._file.name
+            self.assertTrue(os.path.isfile(filename))
+            uploaded.append((filename, image_data.read()))
+
+        upload = self._create_image_with_data(mock_glanceclient, upload)
+
+        filename, content = uploaded[0]
+        self.assertEqual(b'image data', content)
+        self.assertFalse(os.path.exists(filename))
+        self.assertEqual({'image_id': self.images.first().id,
+                          'status': 'done',
+                          'size': 10,
+                          'uploaded': 10,
+                          'error': None}, upload.to_dict())
+
+    @mock.patch.object(api.glance, '_get_upload_executor',
+                       return_value=futurist.SynchronousExecutor())
+    @mock.patch.object(api.glance, 'glanceclient')
+    def test_image_create_upload_failed(self, mock_glanceclient,
+                                        mock_executor):
+        filenames = []
+
+        def upload(image_id, image_data):
+            filenames.append(image_data._file.name)
+            raise Exception('glance is down')
+
+        upload = self._create_image_with_data(mock_glanceclient, upload)
+
+        self.assertEqual('failed', upload.status)
+        self.assertEqual('glance is down', upload.error)
+        self.assertFalse(os.path.exists(filenames[0]))
+
+    def test_image_upload_get_other_project(self):
+        self.addCleanup(api.glance._IMAGE_UPLOADS.clear)
+        api.glance._IMAGE_UPLOADS['image-id'] = api.glance.ImageUpload(
+            'image-id', 'other-project')
+
+        self.assertIsNone(api.glance.image_upload_get(self.request,
+                                                      'image-id'))
+
     def test_create_image_metadata_docker_v2(self):
         form_data = {
             'name': 'Docker image',
@@ -13,6 +13,8 @@
 import unittest
 from unittest import mock
 
+from django.test import testcases
+from django.test.utils import override_settings
 
 from openstack_dashboard.api import microversions
 
@@ -106,3 +108,71 @@ class MicroversionsTests(unittest.TestCase):
     def test_get_microversion_undefined_service(self):
         ret = self._test_get_microversion('2.1', '2.5', service='notfound')
         self.assertIsNone(ret)
+
+
+@override_settings(OPENSTACK_API_VERSION_CACHE_TIMEOUT=600,
+                   PARALLEL_EXECUTOR_MAX_WORKERS=0)
+class VersionRangeTests(testcases.SimpleTestCase):
+
+    def setUp(self):
+        super().setUp()
+        microversions.clear_version_ranges()
+        self.addCleanup(microversions.clear_version_ranges)
+
+    def test_get_version_range_cached_per_endpoint(self):
+        fetch = mock.Mock(side_effect=[('3.0', '3.60'), ('3.0', '3.70')])
+
+        for i in range(2):
+            ret = microversions.get_version_range(
+                'volume', 'http://cinder.example.com/v3', fetch)
+            self.assertEqual(('3.0', '3.60'), ret)
+        ret = microversions.get_version_range(
+            'volume', 'http://cinder2.example.com/v3', fetch)
+        self.assertEqual(('3.0', '3.70'), ret)
+        self.assertEqual(2, fetch.call_count)
+
+    @override_settings(OPENSTACK_API_VERSION_CACHE_TIMEOUT=0)
+    def test_get_version_range_no_cache(self):
+        fetch = mock.Mock(side_effect=[('3.0', '3.60'), ('3.0', '3.70')])
+
+        for expected in (('3.0', '3.60'), ('3.0', '3.70')):
+            ret = microversions.get_version_range(
+                'volume', 'http://cinder.example.com/v3', fetch)
+            self.assertEqual(expected, ret)
+
+    @mock.patch.object(microversions.time, 'monotonic')
+    def test_get_version_range_expired(self, mock_monotonic):
+        fetch = mock.Mock(side_effect=[('3.0', '3.60'), ('3.0', '3.70')])
+        mock_monotonic.return_value = 1000
+        microversions.get_version_range(
+            'volume', 'http://cinder.example.com/v3', fetch)
+
+        mock_monotonic.return_value = 1600
+        ret = microversions.get_version_range(
+            'volume', 'http://cinder.example.com/v3', fetch)
+        self.assertEqual(('3.0', '3.70'), ret)
+        ret = microversions.get_version_range(
+            'volume', 'http://cinder.example.com/v3', fetch)
+        self.assertEqual(('3.0', '3.70'), ret)
+        self.assertEqual(2, fetch.call_count)
+
+    @mock.patch.object(microversions.time, 'monotonic')
+    def test_get_version_range_refresh_error(self, mock_monotonic):
+        fetch = mock.Mock(side_effect=[('3.0', '3.60'), Exception('error')])
+        mock_monotonic.return_value = 1000
+        microversions.get_version_range(
+            'volume', 'http://cinder.example.com/v3', fetch)
+
+        # The microversions retrieved before are used until they can be
+        # retrieved again.
+        mock_monotonic.return_value = 1600
+        ret = microversions.get_version_range(
+            'volume', 'http://cinder.example.com/v3', fetch)
+        self.assertEqual(('3.0', '3.60'), ret)
+
+        # They are not retrieved again before the timeout expires again.
+        mock_monotonic.return_value = 1700
+        ret = microversions.get_version_range(
+            'volume', 'http://cinder.example.com/v3', fetch)
+        self.assertEqual(('3.0', '3.60'), ret)
+        self.assertEqual(2, fetch.call_count)
@@ -17,6 +17,7 @@ from unittest import mock
 
 import netaddr
 
+from django.core.cache import cache
 from django.test.utils import override_settings
 
 from openstack_dashboard import api
@@ -146,3 +147,39 @@ class NetworkApiNeutronTests(test.APIMockTestCase):
     @override_settings(OPENSTACK_NEUTRON_NETWORK={'enable_router': False})
     def test_servers_update_addresses_router_disabled(self):
         self._test_servers_update_addresses(router_enabled=False)
+
+    @override_settings(OPENSTACK_NEUTRON_NETWORK={'enable_router': False},
+                       OPENSTACK_INSTANCE_IP_ADDRESSES_CACHE_TIMEOUT=60)
+    def test_servers_update_addresses_cached(self):
+        cache.clear()
+        self._test_servers_update_addresses(router_enabled=False)
+        self.sdk_net_client.reset_mock()
+
+        servers = self.servers.list()
+        for server in servers:
+            server.addresses = {}
+        # Only the servers updated since the addresses were cached are
+        # looked up in neutron.
+        updated_server = servers[1]
+        updated_server.updated = '2038-01-19T03:14:07Z'
+        server_ports = [p for p in self.api_ports_sdk
+                        if p['device_id'] == updated_server.id]
+        self.sdk_net_client.ports.side_effect = None
+        self.sdk_net_client.ports.return_value = server_ports
+        self.sdk_net_client.networks.return_value = [
+            net for net in self.api_networks_sdk
+            if net['id'] in [p['network_id'] for p in server_ports]]
+
+        api.network.servers_update_addresses(self.request, servers)
+
+        self.sdk_net_client.ports.assert_called_once_with(
+            device_id=(updated_server.id,))
+        for server in servers:
+            self._check_server_address(server, no_fip_expected=True)
+
+    @override_settings(OPENSTACK_INSTANCE_IP_ADDRESSES_CACHE_TIMEOUT=60)
+    def test_invalidate_server_addresses(self):
+        key = api.neutron._server_addresses_cache_key(self.request)
+        cache.set(key, {'server': ('updated', 0, {})})
+        api.neutron.invalidate_server_addresses(self.request)
+        self.assertIsNone(cache.get(key))
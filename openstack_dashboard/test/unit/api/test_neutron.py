@@ -1577,6 +1577,19 @@ class NeutronApiTests(test.APIMockTestCase):
 
         networkclient.extensions.assert_called_once_with()
 
+    @mock.patch.object(api.neutron, 'networkclient')
+    def test_list_extensions_returns_dicts(self, mock_networkclient):
+        extensions = self.api_extensions_sdk
+
+        networkclient = mock_networkclient.return_value
+        networkclient.extensions.return_value = extensions
+
+        ret_val = api.neutron.list_extensions(self.request)
+
+        self.assertEqual(tuple(ext.to_dict() for ext in extensions), ret_val)
+        self.assertTrue(all(type(ext) is dict for ext in ret_val))
+        networkclient.extensions.assert_called_once_with()
+
     @mock.patch.object(api.neutron, 'networkclient')
     def test_list_availability_zones_with_resource_and_state_filters(
             self, mock_networkclient):
@@ -645,6 +645,20 @@ class ComputeApiTests(test.APIMockTestCase):
         self._test_server_create(extra_kwargs=kwargs,
                                  expected_kwargs={'nics': 'auto'})
 
+    @override_settings(OPENSTACK_API_VERSION_CACHE_TIMEOUT=600)
+    @mock.patch.object(api._nova, 'novaclient')
+    def test_get_server_version_range_cached(self, mock_novaclient):
+        novaclient = mock_novaclient.return_value
+        self._mock_current_version(novaclient, '2.60')
+
+        for i in range(2):
+            ret = api._nova.get_server_version_range(self.request)
+            self.assertEqual('2.1', ret[0].get_string())
+            self.assertEqual('2.60', ret[1].get_string())
+        # The client is only created when the microversions are retrieved.
+        mock_novaclient.assert_called_once_with(self.request)
+        novaclient.versions.get_current.assert_called_once_with()
+
 
 class FlavorApiTests(test.APIMockTestCase):
 
@@ -15,11 +15,16 @@
 #    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 #    License for the specific language governing permissions and limitations
 #    under the License.
+import hashlib
+import io
+import json
 from unittest import mock
+from urllib import parse
 
 from django.test.utils import override_settings
 
 from horizon import exceptions
+from horizon.utils import executors
 
 from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
@@ -173,6 +178,60 @@ class SwiftApiTests(test.APIMockTestCase):
     def test_swift_get_objects_full_list_false(self, mock_swiftclient):
         self._test_swift_get_objects(mock_swiftclient, full_listing=False)
 
+    def test_compile_filter(self, mock_swiftclient):
+        regex, prefix = api.swift.compile_filter('photo*.jpg photo.png')
+
+        self.assertEqual('photo', prefix)
+        self.assertTrue(regex.fullmatch('photo-1.jpg'))
+        self.assertTrue(regex.fullmatch('photo.png'))
+        self.assertFalse(regex.fullmatch('photo-1.png'))
+        self.assertFalse(regex.fullmatch('my photo.jpg'))
+
+    def test_compile_filter_match_all(self, mock_swiftclient):
+        regex, prefix = api.swift.compile_filter(' ')
+
+        self.assertEqual('', prefix)
+        self.assertTrue(regex.fullmatch('any.txt'))
+
+    @override_settings(API_RESULT_LIMIT=2)
+    def test_swift_filter_objects(self, mock_swiftclient):
+        container = self.containers.first()
+        swift_api = mock_swiftclient.return_value
+        swift_api.get_container.side_effect = [
+            ({}, [{'name': 'dir/a1.txt'}, {'name': 'dir/a2.jpg'}]),
+            ({}, [{'subdir': 'dir/a3.txt/'}, {'name': 'dir/a4.txt'}]),
+        ]
+
+        objects, marker = api.swift.swift_filter_objects(
+            self.request, 'a*.txt', container.name, prefix='dir/')
+
+        self.assertEqual(['dir/a1.txt', 'dir/a3.txt'],
+                         [o.name for o in objects])
+        self.assertIsInstance(objects[1], api.swift.PseudoFolder)
+        # The limit is reached before the end of the listing.
+        self.assertEqual('dir/a3.txt/', marker)
+        swift_api.get_container.assert_has_calls([
+            mock.call(container.name, prefix='dir/a', marker=None, limit=2,
+                      delimiter='/'),
+            mock.call(container.name, prefix='dir/a', marker='dir/a2.jpg',
+                      limit=2, delimiter='/'),
+        ])
+
+    def test_swift_filter_objects_end_of_listing(self, mock_swiftclient):
+        container = self.containers.first()
+        swift_api = mock_swiftclient.return_value
+        swift_api.get_container.return_value = ({}, [{'name': 'b1.txt'},
+                                                     {'name': 'b2.txt'}])
+
+        objects, marker = api.swift.swift_filter_objects(
+            self.request, '*2.txt', container.name, marker='a.txt', limit=5)
+
+        self.assertEqual(['b2.txt'], [o.name for o in objects])
+        self.assertIsNone(marker)
+        swift_api.get_container.assert_called_once_with(
+            container.name, prefix='', marker='a.txt', limit=1000,
+            delimiter='/')
+
     def test_swift_get_object_with_data_non_chunked(self, mock_swiftclient):
         container = self.containers.first()
         object = self.objects.first()
@@ -300,6 +359,268 @@ class SwiftApiTests(test.APIMockTestCase):
             content_length=0,
             headers={})
 
+    def _test_swift_upload_object_segmented(self, mock_swiftclient,
+                                            capabilities, uploaded=()):
+        container = self.containers.first()
+        segments_container = container.name + '_segments'
+        object_file = io.BytesIO(b'0123456789')
+        object_file.name = 'data.bin'
+        object_file.size = 10
+        segments = {}
+
+        def put_object(container_name, name, contents, **kwargs):
+            if container_name == segments_container:
+                segments[name] = contents.read()
+            return 'etag'
+
+        swift_api = mock_swiftclient.return_value
+        swift_api.get_container.return_value = ({}, [
+            {'name': 'obj/slo/10/4/%08d' % index,
+             'hash': hashlib.md5(data, usedforsecurity=False).hexdigest(),
+             'bytes': len(data)}
+            for index, data in uploaded])
+        swift_api.get_capabilities.return_value = capabilities
+        swift_api.put_object.side_effect = put_object
+
+        with override_settings(SWIFT_UPLOAD_SEGMENT_SIZE=4):
+            obj = api.swift.swift_upload_object(self.request, container.name,
+                                                'obj', object_file)
+
+        self.assertEqual(10, obj.bytes)
+        swift_api.get_container.assert_called_once_with(
+            segments_container, prefix='obj/slo/10/4/', full_listing=True)
+        manifest_call = swift_api.put_object.call_args_list[-1]
+        self.assertEqual((container.name, 'obj'), manifest_call[0][:2])
+        return segments, manifest_call
+
+    def test_swift_upload_object_segmented(self, mock_swiftclient):
+        segments, manifest_call = self._test_swift_upload_object_segmented(
+            mock_swiftclient, {'slo': {'max_manifest_segments': 1000}})
+
+        self.assertEqual({'obj/slo/10/4/00000000': b'0123',
+                          'obj/slo/10/4/00000001': b'4567',
+                          'obj/slo/10/4/00000002': b'89'}, segments)
+        self.assertEqual('multipart-manifest=put',
+                         manifest_call[1]['query_string'])
+        manifest = json.loads(manifest_call[0][2])
+        self.assertEqual(['/%s_segments/obj/slo/10/4/%08d' % (
+            self.containers.first().name, index) for index in range(3)],
+            [segment['path'] for segment in manifest])
+        self.assertEqual([4, 4, 2],
+                         [segment['size_bytes'] for segment in manifest])
+        self.assertEqual(hashlib.md5(b'89', usedforsecurity=False).hexdigest(),
+                         manifest[2]['etag'])
+
+    @mock.patch.dict(executors._EXECUTORS, clear=True)
+    def test_swift_upload_object_segmented_shared_executor(
+            self, mock_swiftclient):
+        segments, manifest_call = self._test_swift_upload_object_segmented(
+            mock_swiftclient, {'slo': {}})
+        executor = executors._EXECUTORS['SWIFT_UPLOAD_SEGMENT_WORKERS'][1]
+        mock_swiftclient.reset_mock()
+
+        self._test_swift_upload_object_segmented(mock_swiftclient, {'slo': {}})
+
+        self.assertEqual(3, len(segments))
+        self.assertIs(
+            executor, executors._EXECUTORS['SWIFT_UPLOAD_SEGMENT_WORKERS'][1])
+
+    @override_settings(SWIFT_UPLOAD_SEGMENT_WORKERS=0)
+    @mock.patch.dict(executors._EXECUTORS, clear=True)
+    def test_swift_upload_object_segmented_serial(self, mock_swiftclient):
+        segments, manifest_call = self._test_swift_upload_object_segmented(
+            mock_swiftclient, {'slo': {}})
+
+        self.assertEqual(3, len(segments))
+        self.assertEqual({}, executors._EXECUTORS)
+
+    def test_swift_upload_object_segmented_resume(self, mock_swiftclient):
+        # The first segment is already uploaded, the second one differs.
+        segments, manifest_call = self._test_swift_upload_object_segmented(
+            mock_swiftclient, {'slo': {}},
+            uploaded=[(0, b'0123'), (1, b'xxxx')])
+
+        self.assertEqual({'obj/slo/10/4/00000001': b'4567',
+                          'obj/slo/10/4/00000002': b'89'}, segments)
+        self.assertEqual(3, len(json.loads(manifest_call[0][2])))
+
+    def test_swift_upload_object_segmented_dlo(self, mock_swiftclient):
+        segments, manifest_call = self._test_swift_upload_object_segmented(
+            mock_swiftclient, {})
+
+        self.assertEqual(3, len(segments))
+        self.assertEqual(
+            '%s_segments/obj/slo/10/4/' % parse.quote(
+                self.containers.first().name),
+            manifest_call[1]['headers']['X-Object-Manifest'])
+        self.assertNotIn('query_string', manifest_call[1])
+
+    @override_settings(SWIFT_UPLOAD_SEGMENT_SIZE=4)
+    def test_swift_upload_object_segmented_new_container(self,
+                                                         mock_swiftclient):
+        container = self.containers.first()
+        object_file = io.BytesIO(b'0123456789')
+        object_file.name = 'data.bin'
+        object_file.size = 10
+
+        swift_api = mock_swiftclient.return_value
+        not_found = type(self.exceptions.swift)(404, 'Not Found')
+        not_found.http_status = 404
+        swift_api.get_container.side_effect = not_found
+        swift_api.head_container.return_value = {'x-storage-policy': 'gold'}
+        swift_api.get_capabilities.return_value = {'slo': {}}
+
+        api.swift.swift_upload_object(self.request, container.name, 'obj',
+                                      object_file)
+
+        swift_api.put_container.assert_called_once_with(
+            container.name + '_segments',
+            headers={'X-Storage-Policy': 'gold'})
+        self.assertEqual(4, swift_api.put_object.call_count)
+
+    @override_settings(SWIFT_UPLOAD_SEGMENT_SIZE=4)
+    def test_swift_delete_static_large_object(self, mock_swiftclient):
+        container = self.containers.first()
+        swift_api = mock_swiftclient.return_value
+        swift_api.head_object.return_value = {'x-static-large-object': 'True'}
+
+        api.swift.swift_delete_object(self.request, container.name, 'obj')
+
+        swift_api.delete_object.assert_called_once_with(
+            container.name, 'obj', query_string='multipart-manifest=delete')
+
+    def test_swift_delete_objects_bulk(self, mock_swiftclient):
+        container = self.containers.first()
+        swift_api = mock_swiftclient.return_value
+        swift_api.get_capabilities.return_value = {
+            'bulk_delete': {'max_deletes_per_request': 2}}
+        swift_api.get_container.return_value = ({}, [
+            {'name': 'folder/'}, {'name': 'folder/c d'}])
+        swift_api.post_account.side_effect = [
+            ({}, json.dumps({'Response Status': '200 OK',
+                             'Errors': []})),
+            ({}, json.dumps({'Response Status': '400 Bad Request',
+                             'Errors': [[parse.quote('/%s/folder/c d' %
+                                                     container.name),
+                                         '409 Conflict']]})),
+        ]
+
+        deleted, failures = api.swift.swift_delete_objects(
+            self.request, container.name, ['a', 'folder/', 'b'])
+
+        self.assertEqual(3, deleted)
+        self.assertEqual({'folder/c d': '409 Conflict'}, failures)
+        swift_api.get_container.assert_called_once_with(
+            container.name, prefix='folder/', marker=None, limit=10000)
+        data = [call[1]['data']
+                for call in swift_api.post_account.call_args_list]
+        path = parse.quote('/%s/' % container.name)
+        self.assertEqual([
+            ('%sa\n%sb\n' % (path, path)).encode(),
+            ('%sfolder/\n%sfolder/c%%20d\n' % (path, path)).encode(),
+        ], data)
+        swift_api.post_account.assert_called_with(
+            headers={'Accept': 'application/json',
+                     'Content-Type': 'text/plain'},
+            query_string='bulk-delete', data=mock.ANY)
+
+    def test_swift_delete_objects_parallel(self, mock_swiftclient):
+        container = self.containers.first()
+        swift_api = mock_swiftclient.return_value
+        swift_api.get_capabilities.return_value = {}
+        not_found = type(self.exceptions.swift)(404, 'Not Found')
+        not_found.http_status = 404
+        conflict = type(self.exceptions.swift)(409, 'Conflict')
+        conflict.http_status = 409
+
+        def delete_object(container_name, name):
+            if name == 'b':
+                raise not_found
+            if name == 'c':
+                raise conflict
+
+        swift_api.delete_object.side_effect = delete_object
+
+        deleted, failures = api.swift.swift_delete_objects(
+            self.request, container.name, ['a', 'b', 'c'])
+
+        self.assertEqual(2, deleted)
+        self.assertEqual({'c': str(conflict)}, failures)
+        swift_api.delete_object.assert_has_calls([
+            mock.call(container.name, 'a'),
+            mock.call(container.name, 'b'),
+            mock.call(container.name, 'c'),
+        ], any_order=True)
+
+    def test_swift_delete_objects_bulk_static_large_objects(
+            self, mock_swiftclient):
+        container = self.containers.first()
+        swift_api = mock_swiftclient.return_value
+        swift_api.get_capabilities.return_value = {
+            'bulk_delete': {'max_deletes_per_request': 2}, 'slo': {}}
+        swift_api.get_container.return_value = ({}, [
+            {'name': 'folder/'}, {'name': 'folder/a', 'slo_etag': '"e"'}])
+        swift_api.post_account.return_value = (
+            {}, json.dumps({'Response Status': '200 OK', 'Errors': []}))
+
+        deleted, failures = api.swift.swift_delete_objects(
+            self.request, container.name, ['folder/'])
+
+        self.assertEqual(2, deleted)
+        self.assertEqual({}, failures)
+        # Bulk deletes leave the segments of the manifests behind.
+        swift_api.delete_object.assert_called_once_with(
+            container.name, 'folder/a',
+            query_string='multipart-manifest=delete')
+        path = parse.quote('/%s/' % container.name)
+        swift_api.post_account.assert_called_once_with(
+            headers={'Accept': 'application/json',
+                     'Content-Type': 'text/plain'},
+            query_string='bulk-delete', data=('%sfolder/\n' % path).encode())
+        swift_api.head_object.assert_not_called()
+
+    @override_settings(SWIFT_UPLOAD_SEGMENT_SIZE=4)
+    def test_swift_delete_objects_parallel_static_large_objects(
+            self, mock_swiftclient):
+        container = self.containers.first()
+        swift_api = mock_swiftclient.return_value
+        swift_api.get_capabilities.return_value = {'slo': {}}
+        swift_api.head_object.side_effect = lambda container_name, name: {
+            'x-static-large-object': str(name == 'b')}
+
+        deleted, failures = api.swift.swift_delete_objects(
+            self.request, container.name, ['a', 'b'])
+
+        self.assertEqual(2, deleted)
+        self.assertEqual({}, failures)
+        swift_api.delete_object.assert_has_calls([
+            mock.call(container.name, 'a'),
+            mock.call(container.name, 'b',
+                      query_string='multipart-manifest=delete'),
+        ], any_order=True)
+        self.assertEqual(2, swift_api.delete_object.call_count)
+
+    @mock.patch.object(api.swift, 'DELETE_LISTING_LIMIT', 2)
+    def test_swift_delete_objects_folder_pages(self, mock_swiftclient):
+        container = self.containers.first()
+        swift_api = mock_swiftclient.return_value
+        swift_api.get_capabilities.return_value = {}
+        swift_api.get_container.side_effect = [
+            ({}, [{'name': 'f/'}, {'name': 'f/a'}]),
+            ({}, [{'name': 'f/b'}]),
+        ]
+
+        deleted, failures = api.swift.swift_delete_objects(
+            self.request, container.name, ['f/'])
+
+        self.assertEqual(3, deleted)
+        self.assertEqual({}, failures)
+        swift_api.get_container.assert_has_calls([
+            mock.call(container.name, prefix='f/', marker=None, limit=2),
+            mock.call(container.name, prefix='f/', marker='f/a', limit=2),
+        ])
+        self.assertEqual(3, swift_api.delete_object.call_count)
+
     def test_swift_object_exists(self, mock_swiftclient):
         container = self.containers.first()
         obj = self.objects.first()
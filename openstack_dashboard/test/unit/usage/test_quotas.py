@@ -18,6 +18,7 @@
 #    under the License.
 
 import collections
+import threading
 from unittest import mock
 
 from django.test.utils import override_settings
@@ -209,6 +210,33 @@ class QuotaTests(test.APITestCase):
         self.limits['absolute']['maxTotalInstances'] = float('inf')
         self._test_tenant_quota_usages(unlimited_items=['instances'])
 
+    @override_settings(OPENSTACK_QUOTA_USAGES_TIMEOUTS={'volume': 0.1})
+    @test.create_mocks({
+        api.nova: (('tenant_absolute_limits', 'nova_tenant_absolute_limits'),),
+        api.base: ('is_service_enabled',),
+        cinder: (('tenant_absolute_limits', 'cinder_tenant_absolute_limits'),
+                 'is_volume_service_enabled')})
+    def test_tenant_quota_usages_volume_timeout(self):
+        event = threading.Event()
+        self.addCleanup(event.set)
+        self._mock_service_enabled()
+        self.mock_nova_tenant_absolute_limits.return_value = \
+            self.limits['absolute']
+        self.mock_cinder_tenant_absolute_limits.side_effect = \
+            lambda *args: event.wait(5)
+
+        quota_usages = quotas.tenant_quota_usages(self.request)
+
+        expected_output = self.get_usages_from_limits(with_volume=False)
+        self.assertCountEqual(expected_output, quota_usages.usages)
+        self.assertEqual(quotas.CINDER_QUOTA_FIELDS, quota_usages.unknown)
+        self.assertNotIn('gigabytes', quota_usages)
+        self.assertEqual({'quota': float('inf'), 'used': 0,
+                          'available': float('inf')},
+                         quota_usages['gigabytes'])
+        self.mock_nova_tenant_absolute_limits.assert_called_once_with(
+            test.IsHttpRequest(), reserved=True, tenant_id='1')
+
     @override_settings(OPENSTACK_HYPERVISOR_FEATURES={'enable_quotas': False})
     @test.create_mocks({api.base: ('is_service_enabled',),
                         cinder: ('is_volume_service_enabled',)})
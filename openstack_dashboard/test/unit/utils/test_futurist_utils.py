@@ -10,7 +10,16 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from concurrent import futures
+import threading
+import time
 import unittest
+from unittest import mock
+
+from django.test.utils import override_settings
+from django.utils import translation
+
+from horizon.utils import executors
 
 from openstack_dashboard.utils import futurist_utils
 
@@ -58,3 +67,142 @@ class FuturistUtilsTests(unittest.TestCase):
             (func2, [], {'a': 10, 'b': 20}),
             func3)
         self.assertEqual(ret, (5, 30, 3))
+
+    def _use_new_executor(self):
+        patcher = mock.patch.dict(executors._EXECUTORS, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(lambda: futurist_utils.get_executor().shutdown())
+
+    @override_settings(PARALLEL_EXECUTOR_MAX_WORKERS=10,
+                       PARALLEL_EXECUTOR_MAX_WORKERS_PER_CALL=2)
+    def test_call_functions_parallel_max_workers_per_call(self):
+        self._use_new_executor()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def func():
+            barrier.wait()
+            return threading.get_ident()
+
+        def other_func():
+            return threading.get_ident()
+
+        ret = futurist_utils.call_functions_parallel(
+            func, func, func, other_func, other_func)
+        # The first function ran in the calling thread and the two next ones
+        # in the pool, concurrently. The calling thread ran the others.
+        self.assertEqual(threading.get_ident(), ret[0])
+        self.assertEqual(3, len(set(ret[:3])))
+        self.assertEqual([threading.get_ident()] * 2, list(ret[3:]))
+
+    @override_settings(PARALLEL_EXECUTOR_MAX_WORKERS=0)
+    def test_call_functions_parallel_serial(self):
+        ret = futurist_utils.call_functions_parallel(
+            threading.get_ident, threading.get_ident)
+        self.assertEqual((threading.get_ident(),) * 2, ret)
+
+    @override_settings(PARALLEL_EXECUTOR_MAX_WORKERS=0)
+    @mock.patch.dict(executors._EXECUTORS, clear=True)
+    def test_call_functions_parallel_serial_timeout(self):
+        def slow():
+            time.sleep(0.2)
+            return 1
+
+        # The functions run in the calling thread, the second one is not
+        # run once the deadline has passed, and no pool is created to log
+        # the statistics.
+        ret = futurist_utils.call_functions_parallel(
+            slow, lambda: 2, timeout=0.1, return_timeouts=True)
+        self.assertEqual(1, ret[0])
+        self.assertIsInstance(ret[1], futures.TimeoutError)
+        self.assertEqual({}, executors._EXECUTORS)
+        self.assertEqual(0, futurist_utils.get_executor_statistics()[
+            'max_workers'])
+
+    @override_settings(PARALLEL_EXECUTOR_MAX_WORKERS=1,
+                       PARALLEL_EXECUTOR_MAX_WORKERS_PER_CALL=1)
+    def test_call_functions_parallel_nested(self):
+        self._use_new_executor()
+
+        def func(a):
+            return futurist_utils.call_functions_parallel(
+                (lambda: a), (lambda: a + 1))
+
+        # The only worker of the pool is busy with the second function, the
+        # nested calls run their functions in their calling thread.
+        ret = futurist_utils.call_functions_parallel((func, [1]), (func, [3]))
+        self.assertEqual(((1, 2), (3, 4)), ret)
+
+    @override_settings(PARALLEL_EXECUTOR_MAX_WORKERS=10,
+                       PARALLEL_EXECUTOR_MAX_WORKERS_PER_CALL=4)
+    def test_call_functions_parallel_timeout(self):
+        self._use_new_executor()
+        event = threading.Event()
+        self.addCleanup(event.set)
+
+        self.assertRaises(futures.TimeoutError,
+                          futurist_utils.call_functions_parallel,
+                          lambda: 1, (event.wait, [5]), timeout=0.1)
+
+    @override_settings(PARALLEL_EXECUTOR_MAX_WORKERS=10,
+                       PARALLEL_EXECUTOR_MAX_WORKERS_PER_CALL=1)
+    def test_call_functions_parallel_timeout_not_started(self):
+        self._use_new_executor()
+        event = threading.Event()
+        self.addCleanup(event.set)
+        func = mock.Mock()
+
+        # The function over the limit of workers per call is not run once
+        # the deadline has passed.
+        self.assertRaises(futures.TimeoutError,
+                          futurist_utils.call_functions_parallel,
+                          (event.wait, [0.2]), func, timeout=0)
+        func.assert_not_called()
+
+    def test_call_functions_parallel_language(self):
+        # With a timeout, all the functions run in the pool.
+        with translation.override('fr'):
+            ret = futurist_utils.call_functions_parallel(
+                translation.get_language, translation.get_language,
+                timeout=1)
+        self.assertEqual(('fr', 'fr'), ret)
+
+    def test_call_functions_parallel_exception(self):
+        def func():
+            raise ValueError('error')
+
+        self.assertRaises(ValueError,
+                          futurist_utils.call_functions_parallel,
+                          lambda: 1, func)
+
+    @override_settings(PARALLEL_EXECUTOR_MAX_WORKERS=10,
+                       PARALLEL_EXECUTOR_MAX_WORKERS_PER_CALL=1)
+    def test_get_executor_statistics(self):
+        self._use_new_executor()
+        caller_runs = futurist_utils.get_executor_statistics()['caller_runs']
+        event = threading.Event()
+
+        # The calling thread waits for the function submitted to the pool to
+        # start, then runs the third one.
+        futurist_utils.call_functions_parallel((event.wait, [5]), event.set,
+                                               lambda: 3)
+
+        statistics = futurist_utils.get_executor_statistics()
+        self.assertEqual(10, statistics['max_workers'])
+        self.assertEqual(1, statistics['workers'])
+        self.assertEqual(0, statistics['queue_size'])
+        self.assertEqual(caller_runs + 2, statistics['caller_runs'])
+
+    @override_settings(PARALLEL_EXECUTOR_MAX_WORKERS=10,
+                       PARALLEL_EXECUTOR_MAX_WORKERS_PER_CALL=4)
+    def test_call_functions_parallel_return_timeouts(self):
+        self._use_new_executor()
+        event = threading.Event()
+        self.addCleanup(event.set)
+
+        ret = futurist_utils.call_functions_parallel(
+            lambda: 1, (event.wait, [5]), lambda: 3,
+            timeout=[None, 0.1, None], return_timeouts=True)
+        self.assertEqual(1, ret[0])
+        self.assertIsInstance(ret[1], futures.TimeoutError)
+        self.assertEqual(3, ret[2])
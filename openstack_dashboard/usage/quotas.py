@@ -11,9 +11,11 @@
 # under the License.
 
 from collections import defaultdict
+from concurrent import futures
 import itertools
 import logging
 
+from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
 from horizon import exceptions
@@ -116,15 +118,24 @@ QUOTA_NAMES = {
 
 
 class QuotaUsage(dict):
-    """Tracks quota limit, used, and available for a given set of quotas."""
+    """Tracks quota limit, used, and available for a given set of quotas.
+
+    The names of the quotas whose limit and usage could not be retrieved in
+    time are in ``unknown``. They read as unlimited, so that the actions
+    checking them are not blocked because a service was slow to answer.
+    """
 
     def __init__(self):
         self.usages = defaultdict(dict)
+        self.unknown = set()
 
     def __contains__(self, key):
         return key in self.usages
 
     def __getitem__(self, key):
+        if key in self.unknown and key not in self.usages:
+            return {'quota': float('inf'), 'used': 0,
+                    'available': float('inf')}
         return self.usages[key]
 
     def __setitem__(self, key, value):
@@ -246,28 +257,15 @@ def get_tenant_quota_data(request, disabled_quotas=None, tenant_id=None):
     return qs
 
 
-# TOOD(amotoki): Do not use neutron specific quota field names.
-# At now, quota names from nova-network are used in the dashboard code,
-# but get_disabled_quotas() returns quota names from neutron API.
-# It is confusing and makes the code complicated. They should be push away.
-# Check Identity Project panel and System Defaults panel too.
-@profiler.trace
-def get_disabled_quotas(request, targets=None):
-    if targets:
-        candidates = set(targets)
-    else:
-        candidates = QUOTA_FIELDS
-
-    # We no longer supports nova network, so we always disable
-    # network related nova quota fields.
-    disabled_quotas = set()
-
-    # Cinder
+def _get_disabled_volume_quotas(request, candidates):
     if candidates & CINDER_QUOTA_FIELDS:
         if not cinder.is_volume_service_enabled(request):
-            disabled_quotas.update(CINDER_QUOTA_FIELDS)
+            return set(CINDER_QUOTA_FIELDS)
+    return set()
+
 
-    # Neutron
+def _get_disabled_network_quotas(request, candidates):
+    disabled_quotas = set()
     if not (candidates & NEUTRON_QUOTA_FIELDS):
         pass
     elif not base.is_service_enabled(request, 'network'):
@@ -287,18 +285,51 @@ def get_disabled_quotas(request, targets=None):
         except Exception:
             LOG.exception("There was an error checking if the Neutron "
                           "quotas extension is enabled.")
+    return disabled_quotas
+
 
-    # Nova
+def _get_disabled_compute_quotas(request, candidates):
     if candidates & NOVA_QUOTA_FIELDS:
         if not (base.is_service_enabled(request, 'compute') and
                 nova.can_set_quotas()):
-            disabled_quotas.update(NOVA_QUOTA_FIELDS)
+            return set(NOVA_QUOTA_FIELDS)
+    return set()
+
+
+def _get_candidates(targets):
+    if targets:
+        return set(targets)
+    return QUOTA_FIELDS
 
-    enabled_quotas = candidates - disabled_quotas
-    disabled_quotas = set(QUOTA_FIELDS) - enabled_quotas
+
+def _merge_disabled_quotas(candidates, *disabled_quotas):
+    enabled_quotas = candidates - set().union(*disabled_quotas)
+    return set(QUOTA_FIELDS) - enabled_quotas
+
+
+# TOOD(amotoki): Do not use neutron specific quota field names.
+# At now, quota names from nova-network are used in the dashboard code,
+# but get_disabled_quotas() returns quota names from neutron API.
+# It is confusing and makes the code complicated. They should be push away.
+# Check Identity Project panel and System Defaults panel too.
+@profiler.trace
+def get_disabled_quotas(request, targets=None):
+    candidates = _get_candidates(targets)
+
+    # We no longer supports nova network, so we always disable
+    # network related nova quota fields.
+    # The checks of cinder and neutron call their APIs, they run in parallel.
+    disabled_volume_quotas, disabled_network_quotas = \
+        futurist_utils.call_functions_parallel(
+            (_get_disabled_volume_quotas, [request, candidates]),
+            (_get_disabled_network_quotas, [request, candidates]))
+    disabled_compute_quotas = _get_disabled_compute_quotas(request,
+                                                           candidates)
 
     # There appear to be no glance quota fields currently
-    return disabled_quotas
+    return _merge_disabled_quotas(candidates, disabled_volume_quotas,
+                                  disabled_network_quotas,
+                                  disabled_compute_quotas)
 
 
 def _add_limit_and_usage(usages, name, limit, usage, disabled_quotas):
@@ -377,11 +408,38 @@ def _get_tenant_volume_usages(request, usages, disabled_quotas, tenant_id):
                              disabled_quotas)
 
 
+# The quota fields of each service along with the functions discovering
+# which of them are disabled and retrieving their usages.
+QUOTA_USAGES_SERVICES = (
+    ('compute', NOVA_QUOTA_FIELDS,
+     _get_disabled_compute_quotas, _get_tenant_compute_usages),
+    ('network', NEUTRON_QUOTA_FIELDS,
+     _get_disabled_network_quotas, _get_tenant_network_usages),
+    ('volume', CINDER_QUOTA_FIELDS,
+     _get_disabled_volume_quotas, _get_tenant_volume_usages),
+)
+
+
+def _get_tenant_service_usages(request, tenant_id, candidates,
+                               get_disabled_quotas, get_usages):
+    disabled_quotas = _merge_disabled_quotas(
+        candidates, get_disabled_quotas(request, candidates))
+    usages = QuotaUsage()
+    get_usages(request, usages, disabled_quotas, tenant_id)
+    return usages
+
+
 @profiler.trace
 @memoized
 def tenant_quota_usages(request, tenant_id=None, targets=None):
     """Get our quotas and construct our usage object.
 
+    The disabled quotas of each service are discovered and its usages are
+    retrieved in parallel with the other services. A service which does not
+    answer within its timeout in ``OPENSTACK_QUOTA_USAGES_TIMEOUTS`` does not
+    block the others, its quotas are reported in ``QuotaUsage.unknown``
+    instead.
+
     :param tenant_id: Target tenant ID. If no tenant_id is provided,
         a the request.user.project_id is assumed to be used.
     :param targets: A tuple of quota names to be retrieved.
@@ -390,17 +448,28 @@ def tenant_quota_usages(request, tenant_id=None, targets=None):
     if not tenant_id:
         tenant_id = request.user.project_id
 
-    disabled_quotas = get_disabled_quotas(request, targets)
-    usages = QuotaUsage()
-
-    futurist_utils.call_functions_parallel(
-        (_get_tenant_compute_usages,
-         [request, usages, disabled_quotas, tenant_id]),
-        (_get_tenant_network_usages,
-         [request, usages, disabled_quotas, tenant_id]),
-        (_get_tenant_volume_usages,
-         [request, usages, disabled_quotas, tenant_id]))
+    candidates = _get_candidates(targets)
+    timeouts = settings.OPENSTACK_QUOTA_USAGES_TIMEOUTS
+    results = futurist_utils.call_functions_parallel(
+        *[(_get_tenant_service_usages,
+           [request, tenant_id, candidates & fields, get_disabled,
+            get_usages])
+          for service, fields, get_disabled, get_usages
+          in QUOTA_USAGES_SERVICES],
+        timeout=[timeouts.get(service)
+                 for service, fields, get_disabled, get_usages
+                 in QUOTA_USAGES_SERVICES],
+        return_timeouts=True)
 
+    usages = QuotaUsage()
+    for (service, fields, get_disabled, get_usages), result in zip(
+            QUOTA_USAGES_SERVICES, results):
+        if isinstance(result, futures.TimeoutError):
+            LOG.warning('Quota usages of the %s service could not be '
+                        'retrieved in time.', service)
+            usages.unknown.update(candidates & fields)
+        else:
+            usages.usages.update(result.usages)
     return usages
 
 
@@ -175,7 +175,15 @@ class ProjectUsageView(UsageView):
 
     def _process_chart_section(self, chart_defs):
         charts = []
+        unknown = getattr(self.usage.limits, 'unknown', ())
         for t in chart_defs:
+            if t.quota_key in unknown:
+                charts.append({
+                    'type': t.quota_key,
+                    'name': t.label,
+                    'unknown': True,
+                })
+                continue
             if t.quota_key not in self.usage.limits:
                 continue
             key = t.quota_key
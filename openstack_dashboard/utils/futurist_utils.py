@@ -10,14 +10,87 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from concurrent import futures as concurrent_futures
 import functools
+import logging
+import threading
+import time
 
-import futurist
+from django.conf import settings
+from django.utils import translation
 
+from horizon.utils import executors
 
-def call_functions_parallel(*worker_defs):
+LOG = logging.getLogger(__name__)
+
+# Number of functions run by the calling threads instead of the pool.
+_CALLER_RUNS = 0
+_CALLER_RUNS_LOCK = threading.Lock()
+
+
+def get_executor():
+    """Returns the thread pool shared by all the requests of the process.
+
+    Its size is set by the ``PARALLEL_EXECUTOR_MAX_WORKERS`` setting. See
+    :func:`horizon.utils.executors.get_executor`.
+    """
+    return executors.get_executor('PARALLEL_EXECUTOR_MAX_WORKERS')
+
+
+def get_executor_statistics():
+    """Returns statistics about the shared thread pool.
+
+    :returns: the statistics returned by
+        :func:`horizon.utils.executors.get_executor_statistics`, along with
+        the number of functions run by the calling threads instead of the
+        pool (``caller_runs``).
+    """
+    statistics = executors.get_executor_statistics(
+        'PARALLEL_EXECUTOR_MAX_WORKERS')
+    statistics['caller_runs'] = _CALLER_RUNS
+    return statistics
+
+
+def _run_in_caller(func):
+    global _CALLER_RUNS
+    with _CALLER_RUNS_LOCK:
+        _CALLER_RUNS += 1
+    future = concurrent_futures.Future()
+    try:
+        future.set_result(func())
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def _call_in_language(language, func, *args, **kwargs):
+    # The language is only active in the thread which activated it.
+    with translation.override(language):
+        return func(*args, **kwargs)
+
+
+def _cancel(futures):
+    for future in futures:
+        future.cancel()
+
+
+def _log_timeout(timeout):
+    LOG.warning('Parallel calls did not complete in %s seconds. '
+                'Statistics of the executor: %s',
+                timeout, get_executor_statistics())
+
+
+def call_functions_parallel(*worker_defs, timeout=None,
+                            return_timeouts=False):
     """Call specified functions in parallel.
 
+    The functions run with the language active in the calling thread, in a
+    thread pool shared by the whole process (see :func:`get_executor`). At
+    most ``PARALLEL_EXECUTOR_MAX_WORKERS_PER_CALL`` of them are submitted
+    to the pool, the calling thread runs the others along with any
+    submitted function which has not started by the time it is free, so
+    that calls keep making progress when the pool is busy.
+
     :param *worker_defs: Each positional argument can be either of
         a function to be called or a tuple which consists of a function,
         a list of positional arguments) and keyword arguments (optional).
@@ -27,24 +100,78 @@ def call_functions_parallel(*worker_defs):
            call_functions_parallel(func1, (func2, [1, 2]))
            call_functions_parallel((func1, [], {'a': 1}),
                                    (func2, [], {'a': 2, 'b': 10}))
+    :param timeout: the number of seconds to wait for all the functions to
+        return, or a sequence with the number of seconds (or None) to wait
+        for each function. ``concurrent.futures.TimeoutError`` is raised
+        when exceeded and the functions which have not started are
+        cancelled. Functions already running are not interrupted. With a
+        timeout, the calling thread only runs the functions over the limit
+        of workers per call.
+    :param return_timeouts: if True, a ``concurrent.futures.TimeoutError``
+        instance is returned for the functions which did not return in time
+        instead of raising it, along with the values returned by the others.
     :returns: a tuple of values returned from individual functions.
         None is returned if a corresponding function does not return.
         It is better to return values other than None from individual
         functions.
     """
-    # TODO(amotoki): Needs to figure out what max_workers can be specified.
-    # According to e0ne, the apache default configuration in devstack  allows
-    # only 10 threads. What happens if max_worker=11 is specified?
-    max_workers = len(worker_defs)
-    # Prepare a list with enough length.
-    futures = [None] * len(worker_defs)
-    with futurist.ThreadPoolExecutor(max_workers=max_workers) as e:
-        for index, func_def in enumerate(worker_defs):
-            if callable(func_def):
-                func_def = [func_def]
-            args = func_def[1] if len(func_def) > 1 else []
-            kwargs = func_def[2] if len(func_def) > 2 else {}
-            func = functools.partial(func_def[0], *args, **kwargs)
-            futures[index] = e.submit(fn=func)
-
-    return tuple(f.result() for f in futures)
+    language = translation.get_language()
+    funcs = []
+    for func_def in worker_defs:
+        if callable(func_def):
+            func_def = [func_def]
+        args = func_def[1] if len(func_def) > 1 else []
+        kwargs = func_def[2] if len(func_def) > 2 else {}
+        funcs.append(functools.partial(_call_in_language, language,
+                                       func_def[0], *args, **kwargs))
+
+    if timeout is None or isinstance(timeout, (int, float)):
+        timeouts = [timeout] * len(funcs)
+    else:
+        timeouts = list(timeout)
+    now = time.monotonic()
+    deadlines = [None if t is None else now + t for t in timeouts]
+    with_deadlines = any(d is not None for d in deadlines)
+
+    max_per_call = settings.PARALLEL_EXECUTOR_MAX_WORKERS_PER_CALL
+    futures = [None] * len(funcs)
+    if settings.PARALLEL_EXECUTOR_MAX_WORKERS > 0 and max_per_call > 0:
+        executor = get_executor()
+        # Without a timeout, the calling thread runs the first function
+        # itself instead of waiting.
+        first = 0 if with_deadlines else 1
+        for index in range(first, min(len(funcs), first + max_per_call)):
+            futures[index] = executor.submit(funcs[index])
+
+    for index, func in enumerate(funcs):
+        future = futures[index]
+        if future is None:
+            deadline = deadlines[index]
+            if deadline is not None and time.monotonic() >= deadline:
+                futures[index] = concurrent_futures.Future()
+                futures[index].set_exception(
+                    concurrent_futures.TimeoutError())
+                continue
+            futures[index] = _run_in_caller(func)
+        elif not with_deadlines and future.cancel():
+            futures[index] = _run_in_caller(func)
+
+    results = []
+    timed_out = False
+    for future, deadline in zip(futures, deadlines):
+        remaining = None
+        if deadline is not None:
+            remaining = max(deadline - time.monotonic(), 0)
+        try:
+            results.append(future.result(timeout=remaining))
+        except concurrent_futures.TimeoutError as e:
+            future.cancel()
+            timed_out = True
+            if not return_timeouts:
+                _cancel(futures)
+                _log_timeout(timeout)
+                raise
+            results.append(e)
+    if timed_out:
+        _log_timeout(timeout)
+    return tuple(results)
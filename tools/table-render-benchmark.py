@@ -0,0 +1,101 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Benchmark of the memory and time needed to build and render a big table.
+
+It builds the rows of a table of 12 columns, reporting the memory held by
+the rows and the time spent building them, then renders the whole table.
+
+Usage::
+
+    python tools/table-render-benchmark.py --rows 1000
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1000,
+                        help='Number of rows of the table')
+    parsed_args = parser.parse_args()
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__))))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'horizon.test.settings')
+    import django
+    django.setup()
+
+    from django.contrib.auth import models as auth_models
+    from django.test import client
+
+    from horizon import tables
+
+    class Datum(object):
+        def __init__(self, index):
+            self.id = str(index)
+            self.name = 'object-%d' % index
+            self.status = ('active', 'error')[index % 2]
+            for column in range(10):
+                setattr(self, 'field%d' % column, 'value-%d-%d' % (index,
+                                                                   column))
+
+    class BenchmarkTable(tables.DataTable):
+        name = tables.Column('name', link='http://example.com/')
+        status = tables.Column('status',
+                               status=True,
+                               status_choices=(('active', True),
+                                               ('error', False)))
+        field0 = tables.Column('field0')
+        field1 = tables.Column('field1')
+        field2 = tables.Column('field2')
+        field3 = tables.Column('field3')
+        field4 = tables.Column('field4')
+        field5 = tables.Column('field5')
+        field6 = tables.Column('field6')
+        field7 = tables.Column('field7')
+        field8 = tables.Column('field8')
+        field9 = tables.Column('field9')
+
+        class Meta(object):
+            name = 'benchmark'
+            multi_select = False
+
+    request = client.RequestFactory().get('/')
+    request.user = auth_models.AnonymousUser()
+    data = [Datum(index) for index in range(parsed_args.rows)]
+
+    table = BenchmarkTable(request, data)
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = table.get_rows()
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print('build   %6d rows %8.3fs %10.1f KiB held by the rows' %
+          (len(rows), elapsed, memory / 1024.0))
+    del rows
+
+    table = BenchmarkTable(request, data)
+    start = time.perf_counter()
+    content = table.render()
+    elapsed = time.perf_counter() - start
+    print('render  %6d rows %8.3fs %10.1f KiB of HTML' %
+          (parsed_args.rows, elapsed, len(content) / 1024.0))
+
+
+if __name__ == '__main__':
+    main()